@@ -9,8 +9,9 @@ import warnings
 
 from redbird import BaseRepo
 from redbird.logging import RepoHandler
-from redbird.repos import MemoryRepo, CSVFileRepo
+from redbird.repos import CSVFileRepo
 from rocketry.log.log_record import LogRecord
+from rocketry.log.repos import IndexedMemoryRepo, SQLiteRepo
 
 from rocketry.tasks import FuncTask, CommandTask
 from rocketry.conditions import FuncCond
@@ -90,18 +91,21 @@ class Rocketry(_AppMixin):
 
     def _set_logger_with_repo(self, repo):
         if isinstance(repo, str):
-            self._get_repo(repo)
+            repo = self._get_repo(repo)
         elif repo is None:
-            repo = MemoryRepo(model=LogRecord)
+            repo = IndexedMemoryRepo(model=LogRecord)
         logger = self._get_task_logger()
         logger.handlers.insert(0, RepoHandler(repo=repo))
     
     def _get_repo(self, repo:str):
         if repo == "memory":
-            return MemoryRepo(model=LogRecord)
+            return IndexedMemoryRepo(model=LogRecord)
         elif repo == "csv":
             filepath = Path(tempfile.gettempdir()) / "rocketry.csv"
             return CSVFileRepo(filename=filepath, model=LogRecord)
+        elif repo == "sqlite":
+            filepath = Path(tempfile.gettempdir()) / "rocketry.db"
+            return SQLiteRepo(filename=str(filepath), model=LogRecord)
         else:
             raise NotImplementedError(f"Repo creation for {repo} not implemented")
 
@@ -54,6 +54,13 @@ class TimeCondWrapper(BaseCondition):
         cond = self.get_cond()
         return cond.observe(**kwargs)
 
+    def next_possible(self, **kwargs):
+        cond = self.get_cond()
+        return cond.next_possible(**kwargs)
+
+    def compile(self):
+        return self.get_cond().compile()
+
     def get_cond(self):
         "Get condition the wrapper itself represents"
         period = self._cls_period(None, None)
@@ -72,6 +79,13 @@ class TimeActionWrapper(BaseCondition):
         cond = self.get_cond()
         return cond.observe(**kwargs)
 
+    def next_possible(self, **kwargs):
+        cond = self.get_cond()
+        return cond.next_possible(**kwargs)
+
+    def compile(self):
+        return self.get_cond().compile()
+
     def __call__(self, task):
         return TimeActionWrapper(self.cls_cond, task=task)
 
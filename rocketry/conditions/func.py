@@ -1,8 +1,20 @@
 
 import copy
+import functools
 from typing import Callable, List, Optional, Pattern, Union
 from rocketry.core.parameters.parameters import Parameters
 from rocketry.core.condition import BaseCondition
+from rocketry.core.condition.base import _cycle_cached
+
+@functools.lru_cache(maxsize=None)
+def _is_task_independent(func) -> bool:
+    "Whether the function does not use the task or results of the tasks as arguments"
+    from rocketry.args import Task, Return, TerminationFlag
+    func_params = Parameters._from_signature(func)
+    return not any(
+        isinstance(arg, (Task, Return, TerminationFlag))
+        for arg in func_params._params.values()
+    )
 
 class FuncCond(BaseCondition):
     """Condition from a function.
@@ -95,6 +107,15 @@ class FuncCond(BaseCondition):
     def __bool__(self):
         return self.func(*self.args, **self.kwargs)
 
+    @property
+    def _cycle_cacheable(self) -> bool:
+        try:
+            return _is_task_independent(self.func)
+        except TypeError:
+            # Unhashable function
+            return False
+
+    @_cycle_cached
     def observe(self, **kwargs) -> bool:
         func_params = Parameters._from_signature(self.func, **kwargs)
         param_dict = func_params.materialize(**kwargs)
@@ -32,6 +32,7 @@ class IsEnv(BaseCondition):
     False
     """
     __parsers__ = {re.compile(r"env '(?P<env>.+)'"): "__init__"}
+    _cycle_cacheable = True
 
     def __init__(self, env):
         self.env = env
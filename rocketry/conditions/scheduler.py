@@ -20,6 +20,7 @@ class SchedulerCycles(BaseComparable):
     >>> parse_condition("scheduler had more than 3 cycles")
     SchedulerCycles(_gt_=3)
     """
+    _cycle_cacheable = True
 
     def get_measurement(self, session=Session()) -> int:
         n_cycles = session.scheduler.n_cycles
@@ -55,6 +56,7 @@ class SchedulerStarted(BaseCondition):
     >>> parse_condition("scheduler has run over 10 minutes")
     ~SchedulerStarted(period=TimeDelta('10 minutes'))
     """
+    _cycle_cacheable = True
 
     def __init__(self, period=None):
         self.period = period
@@ -182,6 +182,12 @@ class TaskRunning(BaseCondition):
             start, end = get_period_span(self.period)
             return start <= last_run <= end
 
+    def next_possible(self, **kwargs) -> datetime.datetime:
+        if self.observe(**kwargs) or self.period is not None:
+            return datetime.datetime.fromtimestamp(time.time())
+        # Can turn true only if the task starts
+        return TimePeriod.max
+
     def __str__(self):
         if hasattr(self, "_str"):
             return self._str
@@ -246,13 +252,6 @@ class TaskExecutable(BaseCondition):
     def get_state(self, task=Task(), session=Session()):
         task = self.task if self.task is not None else task
         period = self.period
-        retries = 0 if self.retries is None else self.retries
-
-        # Form the sub statements
-        has_not_succeeded = TaskSucceeded(period=period, task=task) == 0
-        has_not_inacted = TaskInacted(period=period, task=task) == 0
-        has_not_failed = TaskFailed(period=period, task=task) <= retries
-        has_not_terminated = TaskTerminated(period=period, task=task) == 0
 
         isin_period = (
             # TimeDelta has no __contains__. One cannot say whether now is "past 2 hours".
@@ -265,11 +264,36 @@ class TaskExecutable(BaseCondition):
 
         return (
             isin_period
-            and has_not_inacted.observe(task=task, session=session)
-            and has_not_succeeded.observe(task=task, session=session)
-            and has_not_failed.observe(task=task, session=session)
-            and has_not_terminated.observe(task=task, session=session)
+            and all(
+                cond.observe(task=task, session=session)
+                for cond in self._get_status_conds(task)
+            )
+        )
+
+    def next_possible(self, task=None, session=None, **kwargs) -> datetime.datetime:
+        session = session if session is not None else self.session
+        if self.observe(task=task, session=session, **kwargs):
+            return datetime.datetime.fromtimestamp(time.time())
+        task = self.task if self.task is not None else task
+        conds = self._get_status_conds(task)
+        if not isinstance(self.period, TimeDelta):
+            conds.append(IsPeriod(period=self.period))
+        return All(*conds).next_possible(task=task, session=session)
+
+    def _get_status_conds(self, task) -> list:
+        "Form the sub statements"
+        period = self.period
+        retries = 0 if self.retries is None else self.retries
+
+        has_not_succeeded = TaskSucceeded(period=period, task=task) == 0
+        has_not_inacted = TaskInacted(period=period, task=task) == 0
+        has_not_failed = (
+            TaskFailed(period=period, task=task) == 0
+            if retries == 0
+            else TaskFailed(period=period, task=task) <= retries
         )
+        has_not_terminated = TaskTerminated(period=period, task=task) == 0
+        return [has_not_inacted, has_not_succeeded, has_not_failed, has_not_terminated]
 
     def __str__(self):
         if hasattr(self, "_str"):
@@ -322,6 +346,16 @@ class TaskRunnable(BaseCondition):
             and has_not_run.observe(task=task, session=session)
         )
 
+    def next_possible(self, task=None, session=None, **kwargs) -> datetime.datetime:
+        session = session if session is not None else self.session
+        if self.observe(task=task, session=session, **kwargs):
+            return datetime.datetime.fromtimestamp(time.time())
+        task = self.task if self.task is not None else task
+        conds = [TaskStarted(period=self.period, task=task) == 0]
+        if not isinstance(self.period, TimeDelta):
+            conds.append(IsPeriod(period=self.period))
+        return All(*conds).next_possible(task=task, session=session)
+
 
 class DependFinish(DependMixin):
     """Condition for checking whether a given
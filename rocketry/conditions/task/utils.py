@@ -9,8 +9,8 @@ from rocketry.core.condition import All, Any
 from rocketry.args import Task, Session
 from rocketry.core.condition import BaseCondition
 from rocketry.core.condition.base import BaseComparable
-from rocketry.core.time import TimePeriod
-from rocketry.core.time.utils import get_period_span, to_timestamp
+from rocketry.core.time import TimePeriod, TimeDelta
+from rocketry.core.time.utils import get_next_start, get_period_span, to_timestamp
 from rocketry.log.utils import get_field_value
 
 class DependMixin(BaseCondition):
@@ -42,9 +42,23 @@ class DependMixin(BaseCondition):
         actual_task = session[self.task] if self.task is not None else task
         depend_task = session[self.depend_task]
 
-        #! TODO: use Task._last_success & Task._last_run if not none and not forced
-        last_depend_finish = depend_task.logger.get_latest(action=in_(self._dep_actions))
-        last_actual_start = actual_task.logger.get_latest(action="run")
+        allow_optimization = not session.config.force_status_from_logs
+
+        if allow_optimization:
+            # Use the cached statuses of the tasks to
+            # bypass reading logs
+            last_depend_finish = max(
+                (
+                    last_occur
+                    for last_occur in (getattr(depend_task, f'last_{action}') for action in self._dep_actions)
+                    if last_occur is not None
+                ),
+                default=None
+            )
+            last_actual_start = actual_task.last_run
+        else:
+            last_depend_finish = depend_task.logger.get_latest(action=in_(self._dep_actions))
+            last_actual_start = actual_task.logger.get_latest(action="run")
 
         if not last_depend_finish:
             # Depend has not run at all
@@ -52,9 +66,17 @@ class DependMixin(BaseCondition):
         elif not last_actual_start:
             # Depend has succeeded but the actual task has not
             return True
-            
+
+        if allow_optimization:
+            return last_depend_finish > last_actual_start
         return get_field_value(last_depend_finish, "created") > get_field_value(last_actual_start, "created")
 
+    def next_possible(self, **kwargs) -> datetime.datetime:
+        if self.observe(**kwargs):
+            return datetime.datetime.fromtimestamp(time.time())
+        # Can turn true only if the tasks run
+        return TimePeriod.max
+
 class TaskStatusMixin(BaseComparable):
 
     _action = None
@@ -115,6 +137,34 @@ class TaskStatusMixin(BaseComparable):
             for record in records
         ]
 
+    def next_possible(self, task=None, session=None, **kwargs) -> datetime.datetime:
+        now = datetime.datetime.fromtimestamp(time.time())
+        session = session if session is not None else self.session
+        if self.observe(task=task, session=session, **kwargs):
+            return now
+        elif self._is_any_over_zero():
+            # Can turn true only if the task has
+            # the action (ie. it runs)
+            return TimePeriod.max
+        elif self._is_equal_zero():
+            # Is false till the occurrences are out of the period
+            task = session[self.task] if self.task is not None else task
+            period = self.period if self.period is not None else task.period
+            if isinstance(period, TimeDelta):
+                if type(period) is not TimeDelta:
+                    # Other floating periods (ie. spans) are not optimized
+                    return now
+                actions = [self._action] if isinstance(self._action, str) else self._action
+                occurs = [
+                    getattr(task, f'last_{action}') for action in actions 
+                    if getattr(task, f'last_{action}') is not None
+                ]
+                if not occurs:
+                    return now
+                return max(max(occurs) + period.past, now)
+            return max(get_next_start(period, now), now)
+        return now
+
     def __str__(self):
         if hasattr(self, "_str"):
             return self._str
@@ -1,5 +1,6 @@
 
 import datetime
+import time
 
 from rocketry.time import TimeOfDay, TimeOfWeek, TimeDelta
 from rocketry.time.construct import get_full_cycle, get_between, get_after, get_before
@@ -29,6 +30,8 @@ class IsPeriod(BaseCondition):
     >>> from rocketry.time import TimeOfDay
     >>> is_morning = IsPeriod(period=TimeOfDay("06:00", "12:00")) # doctest: +SKIP
     """
+    _cycle_cacheable = True
+
     def __init__(self, period):
         if isinstance(period, TimeDelta):
             raise AttributeError("TimeDelta does not have __contains__.")
@@ -37,6 +40,10 @@ class IsPeriod(BaseCondition):
     def get_state(self):
         return datetime.datetime.now() in self.period
 
+    def next_possible(self, **kwargs) -> datetime.datetime:
+        now = datetime.datetime.fromtimestamp(time.time())
+        return max(self.period.rollforward(now).left, now)
+
     def __str__(self):
         if hasattr(self, "_str"):
             return self._str
@@ -1,14 +1,85 @@
 from copy import copy
 import datetime
+import functools
+import time
 from abc import abstractmethod
-from typing import Callable, Dict, Pattern, Union, Type
+from typing import Callable, Dict, Optional, Pattern, Tuple, Union, Type
 
 from rocketry._base import RedBase
 from rocketry.core.meta import _add_parser, _register
 from rocketry.core.parameters.parameters import Parameters
+from rocketry.core.time.base import TimePeriod
 
 PARSERS: Dict[Union[str, Pattern], Union[Callable, 'BaseCondition']] = {}
 
+_MISSING = object()
+
+def _freeze(value):
+    "Turn a value to a hashable one (if possible)"
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    elif isinstance(value, set):
+        return frozenset(value)
+    return value
+
+def _cycle_cached(observe):
+    """Decorator for observe methods to share the state of a 
+    condition within a scheduler cycle (if the condition is
+    cacheable and session.config.cycle_cond_cache is True)"""
+    @functools.wraps(observe)
+    def wrapper(self, **kwargs):
+        if not self._cycle_cacheable:
+            return observe(self, **kwargs)
+        cache = self._get_cycle_cache(**kwargs)
+        if cache is None:
+            return observe(self, **kwargs)
+        try:
+            key = self._get_cycle_key()
+            state = cache.get(key, _MISSING)
+        except TypeError:
+            # Unhashable attributes
+            return observe(self, **kwargs)
+        if state is _MISSING:
+            state = cache[key] = observe(self, **kwargs)
+        return state
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def _get_arg_plan(func:Callable) -> Tuple[tuple, Optional[tuple]]:
+    """Get the arguments of a function (get_state or get_measurement)
+    from its signature. Returns the pairs of names and arguments and,
+    if the function only takes the task and the session, the pairs of
+    names and whether the argument is the task (for a faster path)"""
+    from rocketry.args import Task, Session
+    args = tuple(Parameters._from_signature(func).items())
+    is_simple = all(
+        (type(arg) is Task and arg.name is None) or type(arg) is Session
+        for name, arg in args
+    )
+    simple_args = tuple((name, type(arg) is Task) for name, arg in args) if is_simple else None
+    return args, simple_args
+
+def _materialize_args(method:Callable, kwargs:dict) -> dict:
+    "Materialize the arguments of a method of a condition"
+    func = getattr(method, "__func__", method)
+    args, simple_args = _get_arg_plan(func)
+    if simple_args is not None:
+        task = kwargs.get("task")
+        session = kwargs.get("session")
+        if session is None and any(not is_task for name, is_task in simple_args):
+            session = task.session
+        return {
+            name: task if is_task else session
+            for name, is_task in simple_args
+        }
+    return {
+        name: arg.get_value(**kwargs)
+        for name, arg in args
+    }
+
 
 class BaseCondition(RedBase):
     """A condition is a thing/occurence that should happen in 
@@ -62,16 +133,60 @@ class BaseCondition(RedBase):
 
     """
 
+    # Whether the state does not depend on the task
+    # and stays the same during a scheduler cycle
+    _cycle_cacheable = False
+
+    @_cycle_cached
     def observe(self, **kwargs):
         "Observe the status of the condition"
-        cond_params = Parameters._from_signature(self.get_state, **kwargs)
-        param_dict = cond_params.materialize(**kwargs)
+        param_dict = _materialize_args(self.get_state, kwargs)
         return self.get_state(**param_dict)
 
     def __bool__(self) -> bool:
         """Check whether the condition holds."""
         return self.observe()
 
+    def compile(self) -> Callable[..., bool]:
+        """Compile the condition to a function that
+        gets the state of the condition.
+
+        The function takes the same arguments as 
+        ``observe``. The structure of the condition 
+        (nested containers and wrappers) is resolved
+        when compiled.
+
+        Override for optimization."""
+        return self.observe
+
+    def _get_cycle_cache(self, session=None, task=None, **kwargs) -> Optional[dict]:
+        "Get the cache of condition states of the current scheduler cycle (if in use)"
+        if session is None:
+            session = getattr(task, "session", None) or self.session
+        return getattr(session, "_cycle_cond_cache", None)
+
+    def _get_cycle_key(self) -> tuple:
+        "Get key of the condition for the cache (same for equal conditions)"
+        return (type(self),) + tuple(
+            (attr, _freeze(value)) 
+            for attr, value in sorted(self.__dict__.items())
+            if attr != "_str"
+        )
+
+    def next_possible(self, **kwargs) -> datetime.datetime:
+        """Get the earliest time the condition
+        could be true.
+
+        Used by the scheduler (if ``cycle_mode='event'``)
+        to skip checking the condition until then. Returns 
+        the current time if it cannot be determined (the
+        condition is then checked every ``cycle_sleep``) and 
+        ``TimePeriod.max`` if the condition can only turn 
+        true after a change in the tasks (ie. a task ran).
+        
+        Override for optimization."""
+        return datetime.datetime.fromtimestamp(time.time())
+
     @abstractmethod
     def get_state(self):
         """Get the status of the condition 
@@ -143,6 +258,14 @@ class _ConditionContainer:
         string = ', '.join(map(str, self.subconditions))
         return f'{type(self).__name__}({string})'
 
+def _flatten(cond):
+    "Iterate sub conditions of a container including the sub conditions of nested containers of the same type"
+    for subcond in cond.subconditions:
+        if type(subcond) is type(cond):
+            yield from _flatten(subcond)
+        else:
+            yield subcond
+
 class Any(_ConditionContainer, BaseCondition):
 
     def __init__(self, *conditions):
@@ -160,6 +283,30 @@ class Any(_ConditionContainer, BaseCondition):
                 return True
         return False
 
+    def compile(self) -> Callable[..., bool]:
+        funcs = []
+        for subcond in _flatten(self):
+            if isinstance(subcond, AlwaysFalse):
+                continue
+            if isinstance(subcond, AlwaysTrue):
+                return subcond.observe
+            funcs.append(subcond.compile())
+        if not funcs:
+            return AlwaysFalse().observe
+        if len(funcs) == 1:
+            return funcs[0]
+        funcs = tuple(funcs)
+
+        def observe(**kwargs):
+            for func in funcs:
+                if func(**kwargs):
+                    return True
+            return False
+        return observe
+
+    def next_possible(self, **kwargs) -> datetime.datetime:
+        return min((subcond.next_possible(**kwargs) for subcond in self.subconditions), default=TimePeriod.max)
+
     def __str__(self):
         try:
             return super().__str__()
@@ -185,6 +332,32 @@ class All(_ConditionContainer, BaseCondition):
                 return False
         return True
 
+    def compile(self) -> Callable[..., bool]:
+        funcs = []
+        for subcond in _flatten(self):
+            if isinstance(subcond, AlwaysTrue):
+                continue
+            if isinstance(subcond, AlwaysFalse):
+                return subcond.observe
+            funcs.append(subcond.compile())
+        if not funcs:
+            return AlwaysTrue().observe
+        if len(funcs) == 1:
+            return funcs[0]
+        funcs = tuple(funcs)
+
+        def observe(**kwargs):
+            for func in funcs:
+                if not func(**kwargs):
+                    return False
+            return True
+        return observe
+
+    def next_possible(self, **kwargs) -> datetime.datetime:
+        # All cannot be true before every sub condition can be
+        now = datetime.datetime.fromtimestamp(time.time())
+        return max((subcond.next_possible(**kwargs) for subcond in self.subconditions), default=now)
+
     def __str__(self):
         try:
             return super().__str__()
@@ -205,6 +378,21 @@ class Not(_ConditionContainer, BaseCondition):
     def observe(self, **kwargs):
         return not(self.condition.observe(**kwargs))
 
+    def compile(self) -> Callable[..., bool]:
+        cond = self.condition
+        if isinstance(cond, Not):
+            # ~~cond --> cond
+            return cond.condition.compile()
+        elif isinstance(cond, AlwaysTrue):
+            return AlwaysFalse().observe
+        elif isinstance(cond, AlwaysFalse):
+            return AlwaysTrue().observe
+        func = cond.compile()
+
+        def observe(**kwargs):
+            return not func(**kwargs)
+        return observe
+
     def __repr__(self):
         string = repr(self.condition)
         return f'~{string}'
@@ -257,6 +445,9 @@ class AlwaysFalse(BaseCondition):
     def observe(self, **kwargs):
         return False
 
+    def next_possible(self, **kwargs) -> datetime.datetime:
+        return TimePeriod.max
+
     def __repr__(self):
         return 'AlwaysFalse'
 
@@ -275,9 +466,9 @@ class BaseComparable(BaseCondition):
         self._comps = {}
         super().__init__()
 
+    @_cycle_cached
     def observe(self, **kwargs):
-        params = Parameters._from_signature(self.get_measurement, **kwargs)
-        param_dict = params.materialize(**kwargs)
+        param_dict = _materialize_args(self.get_measurement, kwargs)
         value = self.get_measurement(**param_dict)
         if isinstance(value, bool):
             # Possibly has some optimization and already did the comparison
@@ -1 +1,2 @@
-from .adapter import TaskAdapter
\ No newline at end of file
+from .adapter import TaskAdapter
+from .listener import LogQueueListener
\ No newline at end of file
@@ -0,0 +1,94 @@
+import threading
+import time
+from queue import Empty, SimpleQueue
+from typing import Callable
+
+from rocketry.log.handlers import decode_record
+
+class LogQueueListener:
+    """Thread that moves log records from a multiprocessing
+    queue to a local queue in batches.
+
+    The records can be read with the same methods as from
+    the multiprocessing queue (``get``, ``get_nowait`` and
+    ``empty``) but reading does not need inter-process
+    communication.
+
+    Parameters
+    ----------
+    queue : multiprocessing.Queue
+        Queue the processes put the log records to.
+    batch_size : int, optional
+        Maximum number of records moved at once,
+        by default 100
+    callback : callable, optional
+        Function called (in the thread) after
+        records are moved.
+    """
+
+    def __init__(self, queue, batch_size:int=100, callback:Callable=None):
+        self.queue = queue
+        self.batch_size = batch_size
+        self.callback = callback
+        self._records = SimpleQueue()
+        self._thread = None
+        self._n_errors = 0 # Consecutive errors in reading the queue
+
+    def start(self):
+        "Start moving the records"
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        "Stop the thread and move the remaining records"
+        if self._thread is not None:
+            if self._thread.is_alive():
+                self.queue.put(None) # Stops the thread
+            self._thread.join()
+            self._thread = None
+        while self._move(block=False):
+            pass
+
+    def _run(self):
+        while self._move(block=True):
+            if self._n_errors:
+                # Backing off in case the error repeats
+                time.sleep(min(0.001 * 2 ** self._n_errors, 1.0))
+
+    def _move(self, block:bool) -> bool:
+        "Move a batch of records to the local queue. Returns False if nothing to move or stopped"
+        batch = []
+        try:
+            batch.append(self.queue.get(block=block))
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                batch.append(self.queue.get_nowait())
+        except Empty:
+            pass
+        except Exception as exc:
+            # Raised to the reader (ie. unpicklable record)
+            batch.append(exc)
+            self._n_errors += 1
+            if isinstance(exc, (OSError, EOFError)) or getattr(self.queue, "_closed", False):
+                # The queue is broken thus stopping
+                batch.append(None)
+        else:
+            self._n_errors = 0
+        is_stopped = bool(batch) and batch[-1] is None
+        for record in batch:
+            if record is not None:
+                self._records.put(decode_record(record))
+        if self.callback is not None and batch and batch[0] is not None:
+            self.callback()
+        return bool(batch) and not is_stopped
+
+    def get(self, block:bool=True, timeout:float=None):
+        record = self._records.get(block=block, timeout=timeout)
+        if isinstance(record, Exception):
+            raise record
+        return record
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def empty(self) -> bool:
+        return self._records.empty()
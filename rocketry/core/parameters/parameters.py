@@ -87,16 +87,16 @@ class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...))
 
     def pre_materialize(self, *args, **kwargs):
         """Turn arguments to their values before passed
-        to child processes/threads. 
+        to child processes/threads. Returns new parameters
+        (the arguments are not replaced in these).
         """
-        self._params = {
+        return Parameters({
             key: 
                 value 
                 if not isinstance(value, BaseArgument)
                 else value.stage(*args, **kwargs)
             for key, value in self._params.items()
-        }
-        return self
+        })
 
     def materialize(self, *args, **kwargs):
         """Turn arguments to their values (after passed
@@ -1,8 +1,11 @@
 
 import asyncio
+from collections import deque
+import heapq
+import itertools
 from multiprocessing import cpu_count
 import multiprocessing
-from typing import TYPE_CHECKING, Callable, Optional, Union
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
 import threading
 import time
 import sys, os, subprocess
@@ -15,6 +18,12 @@ from queue import Empty
 from rocketry._base import RedBase
 from rocketry.core.condition import BaseCondition, AlwaysFalse
 from rocketry.core.task import Task
+from rocketry.core.log import LogQueueListener
+from rocketry.log.handlers import decode_record
+from rocketry.core.time import TimePeriod
+from rocketry.core.time.utils import to_timestamp
+from rocketry.core.utils import ProcessPool, ThreadPool
+from rocketry.core.utils.shared import start_tracker
 from rocketry.exc import SchedulerRestart, SchedulerExit
 from rocketry.core.hook import _Hooker
 
@@ -83,25 +92,46 @@ class Scheduler(RedBase):
         self._flag_shutdown = threading.Event()
         self._flag_force_exit = threading.Event()
         self._flag_restart = threading.Event()
+        self._flag_wakeup = threading.Event() # Set when tasks change (for cycle_mode='event')
         self._flag_enabled.set() # Not on hold by default
 
+        # Heap of next possible start times of the tasks (for cycle_mode='event')
+        self._wakeups = []
+        self._task_wakeups = {}
+        self._wakeup_counter = itertools.count()
+        self._changed_tasks = set() # Tasks changed after they were inspected
+        self._idle_tasks = set() # Tasks that can start only after a change in the tasks
+        self._wakeup_event = None # Set to wake up from hibernation (asyncio.Event)
+        self._loop = None
+        self._run_waiters = {} # Futures of launched process tasks waiting for their run records (by task name)
+
         # is_alive is used by testing whether the scheduler is 
         # still running or not
         self.is_alive = None
 
         self._log_queue = multiprocessing.Queue(-1)
+        self._log_listener = None # Drains _log_queue while the scheduler runs
+        self._record_queue = self._log_queue # Queue the records are read from
+        self._tasks = None # Tasks ordered by priority (reset when tasks change)
+        # Tasks that may be running (by execution type)
+        self._alive = {"async": set(), "thread": set(), "process": set()}
+        self._process_pool = None # Warm workers for process tasks (if process_pool_size)
+        self._thread_pool = None # Worker threads for thread tasks (if thread_pool_size)
+        self._last_snapshot = None # When status snapshot was saved (if status_snapshot)
 
     def _register_instance(self):
         self.session.scheduler = self
 
     @property
-    def tasks(self):
-
-        #! TODO: Is this needed?
-        tasks = self.session.get_tasks()
-        # There may be extra rare situation that priority is not in the task
-        # for short period if it is being modified thus we use getattr
-        return sorted(tasks, key=lambda task: getattr(task, "priority", 0), reverse=True)
+    def tasks(self) -> List[Task]:
+        "Tasks of the session ordered by priority"
+        tasks = self._tasks
+        if tasks is None:
+            # There may be extra rare situation that priority is not in the task
+            # for short period if it is being modified thus we use getattr
+            tasks = sorted(self.session.get_tasks(), key=lambda task: getattr(task, "priority", 0), reverse=True)
+            self._tasks = tasks
+        return tasks
 
     def __call__(self):
         return self.run()
@@ -117,6 +147,9 @@ class Scheduler(RedBase):
         self._flag_restart.clear()
         self._flag_enabled.set()
 
+        self._loop = asyncio.get_running_loop()
+        self._wakeup_event = asyncio.Event()
+
         self.is_alive = True
         exception = None
         try:
@@ -130,6 +163,7 @@ class Scheduler(RedBase):
                     raise SchedulerRestart()
 
                 await self.run_cycle()
+                self._save_status_snapshot()
 
                 # self.maintain()
         except SystemExit as exc:
@@ -162,18 +196,38 @@ class Scheduler(RedBase):
         
         Each task is inspected and in case their starting condition
         is fulfilled, they are run.  A task can be running once at 
-        any given time (in other words, multiple paraller execution 
-        of a single task is not supported at the moment). Tasks that 
-        are running but their termination condition is fulfilled are 
-        terminated.
+        any given time unless its ``max_instances`` allows more
+        parallel runs. Tasks that are running but their termination
+        condition is fulfilled are terminated.
+
+        If ``cycle_mode='event'``, only the tasks that are running, 
+        which start condition may have turned true or which have 
+        changed since the previous cycle are inspected.
         """
-        tasks = self.tasks
+        if self.session.config.cycle_cond_cache:
+            # Task independent conditions are evaluated once per cycle
+            self.session._cycle_cond_cache = {}
+        try:
+            await self._run_cycle()
+        finally:
+            self.session._cycle_cond_cache = None
+
+    async def _run_cycle(self):
+        is_event_mode = self.session.config.cycle_mode == "event"
+        if is_event_mode:
+            self.handle_logs()
+            tasks = self._get_due_tasks()
+        else:
+            tasks = self.tasks
         self.logger.debug(f"Beginning cycle with {len(tasks)} tasks...", extra={"action": "run"})
 
         # Running hooks
         hooker = _Hooker(self.session.hooks.scheduler_cycle)
         hooker.prerun(self)
 
+        self._join_finished()
+        launches = []
+        launch_priority = None
         for task in tasks:
             with task.lock:
                 self.handle_logs()
@@ -181,8 +235,21 @@ class Scheduler(RedBase):
                     # Startup or shutdown tasks are not run in main sequence
                     pass
                 elif self._flag_enabled.is_set() and self.is_task_runnable(task):
+                    priority = getattr(task, "priority", 0)
+                    if launches and priority < launch_priority:
+                        # The tasks with higher priority start first
+                        await asyncio.gather(*launches)
+                        launches = []
                     # Run the actual task
-                    await self.run_task(task)
+                    if task.get_execution() == "process":
+                        # The process is started now but its run
+                        # record is waited with the other launches
+                        # of the same priority
+                        launches.append(asyncio.create_task(self.run_task(task)))
+                        launch_priority = priority
+                        await asyncio.sleep(0)
+                    else:
+                        await self.run_task(task)
                     # Reset force_run as a run has forced
                     task.force_run = False
                 elif self.is_timeouted(task):
@@ -191,6 +258,14 @@ class Scheduler(RedBase):
                 elif self.is_out_of_condition(task):
                     # Terminate the task
                     await self.terminate_task(task)
+                if task._instances:
+                    # Earlier runs of the task may have timeouted
+                    await self._terminate_timeouted_instances(task)
+            if is_event_mode:
+                self._set_wakeup(task)
+
+        if launches:
+            await asyncio.gather(*launches)
 
         # Running hooks
         hooker.postrun()
@@ -217,6 +292,7 @@ class Scheduler(RedBase):
 
         try:
             await task.start_async(log_queue=self._log_queue)
+            self._add_alive(task)
         except (SchedulerRestart, SchedulerExit) as exc:
             raise 
         except Exception as exc:
@@ -261,6 +337,37 @@ class Scheduler(RedBase):
             # The process/thread probably just died after the check
             pass
 
+        for instance in list(task._instances):
+            await self._terminate_instance(task, instance, reason=reason)
+
+    async def _terminate_instance(self, task, instance, reason=None):
+        "Terminate an earlier run of a task (if max_instances > 1)"
+        if instance.thread is not None and instance.thread.is_alive():
+            instance.thread_terminate.set()
+        elif instance.process is not None and instance.process.is_alive():
+            instance.process.terminate()
+            instance.process.join()
+            task.log_termination(reason=reason, start=instance.start)
+        elif instance.async_task is not None and not instance.async_task.done():
+            instance.async_task.cancel()
+            try:
+                await instance.async_task
+            except asyncio.CancelledError:
+                task.log_termination()
+
+    async def _terminate_timeouted_instances(self, task):
+        "Terminate the earlier runs of the task that have run too long"
+        timeout = (
+            task.timeout if task.timeout is not None
+            else self.session.config.timeout
+        )
+        if timeout is None or task.permanent_task:
+            return
+        now = datetime.datetime.fromtimestamp(time.time())
+        for instance in list(task._instances):
+            if instance.is_alive() and instance.start is not None and now - instance.start > timeout:
+                await self._terminate_instance(task, instance, reason="timeout")
+
     def is_timeouted(self, task):
         """Check if the task is timeouted."""
         #! TODO: Can this be put to the Task?
@@ -290,17 +397,19 @@ class Scheduler(RedBase):
         execution = task.get_execution()
         is_condition = self.check_task_cond(task)
         if execution == "process":
-            is_not_running = not task.is_alive()
+            has_free_instance = task.count_instances() < task.max_instances
             has_free_processors = self.has_free_processors()
-            return is_not_running and has_free_processors and is_condition
+            return has_free_instance and has_free_processors and is_condition
         elif execution == "main":
             return is_condition
         elif execution == "thread":
-            is_not_running = not task.is_alive()
-            return is_not_running and is_condition
+            has_free_instance = task.count_instances() < task.max_instances
+            has_free_threads = self._is_under_limit("thread", self.session.config.max_thread_count)
+            return has_free_instance and has_free_threads and is_condition
         elif execution == "async":
-            is_not_running = not task.is_alive()
-            return is_not_running and is_condition
+            has_free_instance = task.count_instances() < task.max_instances
+            has_free_slots = self._is_under_limit("async", self.session.config.max_async_count)
+            return has_free_instance and has_free_slots and is_condition
         else:
             raise NotImplementedError(task.execution)
 
@@ -319,18 +428,48 @@ class Scheduler(RedBase):
         else:
             return task.is_terminable()
             
+    def _save_status_snapshot(self, force:bool=False):
+        "Save the status snapshot if set and the interval has passed"
+        config = self.session.config
+        if config.status_snapshot is None:
+            return
+        now = time.time()
+        interval = config.status_snapshot_interval.total_seconds()
+        if force or self._last_snapshot is None or now - self._last_snapshot >= interval:
+            self.session.save_status_snapshot()
+            self._last_snapshot = now
+
     def handle_logs(self):
         """Handle the status queue and carries the logging on their behalf."""
         # TODO: This could be maybe done in the tasks
-        queue = self._log_queue
+        queue = self._record_queue
+        records = []
         while True:
             try:
-                record = queue.get(block=False)
+                records.append(queue.get(block=False))
             except Empty:
                 break
-            else:
+        if records:
+            self._handle_records(records)
+
+    def _handle_records(self, records:list):
+        "Log the records from the log queue (grouped by task)"
+        task_records = {}
+        for record in map(decode_record, records):
+            task_records.setdefault(record.task_name, []).append(record)
+
+        for task_name, records in task_records.items():
+            task = self.session[task_name]
+            waiters = self._run_waiters.get(task_name)
+            for record in records:
+                if waiters and record.action == "run":
+                    # The launch of the task can continue
+                    waiter = waiters.popleft()
+                    if not waiters:
+                        del self._run_waiters[task_name]
+                    if not waiter.done():
+                        waiter.set_result(record)
                 self.logger.debug(f"Inserting record for '{record.task_name}' ({record.action})")
-                task = self.session[record.task_name]
                 if record.action == "fail":
                     # There is a caveat in logging 
                     # https://github.com/python/cpython/blame/fad6af2744c0b022568f7f4a8afc93fed056d4db/Lib/logging/handlers.py#L1383 
@@ -351,15 +490,189 @@ class Scheduler(RedBase):
                     return_value = record.__return__
                     task._handle_return(return_value)
                     del record.__return__
-                
-                task.log_record(record)
+
+            task.log_records(records)
 
     async def _hibernate(self):
         """Go to sleep and wake up when next task can be executed."""
         delay = self.session.config.cycle_sleep
-        if delay is not None:
+        if self.session.config.cycle_mode == "event" and self.is_alive and self._wakeup_event is not None:
+            await self._wait_wakeup(delay)
+        elif delay is not None:
             await asyncio.sleep(delay)
 
+    async def _wait_wakeup(self, delay:Optional[float]):
+        """Sleep till a task could start or something changed (for cycle_mode='event').
+        
+        Running tasks and shut conditions which next possible
+        time is not known are checked every ``delay`` seconds."""
+        event = self._wakeup_event
+        shut_cond = self.session.config.shut_cond
+        while True:
+            event.clear()
+            if self._is_cycle_due():
+                return
+            now = time.time()
+            timeouts = []
+            if self._wakeups:
+                timeouts.append(to_timestamp(self._wakeups[0][0]) - now)
+            if self.n_alive:
+                # The running tasks may need to be terminated
+                timeouts.append(delay or 0)
+            if shut_cond is not None:
+                shut_time = shut_cond.next_possible(scheduler=self, session=self.session)
+                if shut_time < TimePeriod.max:
+                    shut_timeout = to_timestamp(shut_time) - now
+                    # Not known when the condition could turn true if it could now
+                    timeouts.append(shut_timeout if shut_timeout > 0 else (delay or 0))
+            timeout = max(min(timeouts), 0) if timeouts else None
+            try:
+                await asyncio.wait_for(event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                if self.n_alive or self.check_shut_cond(shut_cond):
+                    return
+
+    def _wake_up(self):
+        "Wake up the scheduler from hibernation (for cycle_mode='event'). Thread-safe."
+        event = self._wakeup_event
+        if event is not None:
+            self._call_in_loop(event.set)
+
+    def _call_in_loop(self, func:Callable):
+        "Call the function in the event loop of the scheduler. Thread-safe."
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            is_loop_thread = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            is_loop_thread = False
+        if is_loop_thread:
+            func()
+        else:
+            try:
+                loop.call_soon_threadsafe(func)
+            except RuntimeError:
+                # The loop is closed thus the scheduler is not running
+                pass
+
+    def _on_log_records(self):
+        "Handle arrived log records of process tasks (called in the thread of the log listener)"
+        if self._run_waiters:
+            # Launched tasks are waiting for their run records
+            self._call_in_loop(self.handle_logs)
+        if self.session.config.cycle_mode == "event":
+            self._wake_up()
+
+    def _add_run_waiter(self, task:Task) -> asyncio.Future:
+        "Get a future that is done when the next run record of the task is handled"
+        future = asyncio.get_running_loop().create_future()
+        self._run_waiters.setdefault(task.name, deque()).append(future)
+        return future
+
+    def _remove_run_waiter(self, task:Task, future:asyncio.Future):
+        "Stop waiting the run record of the task"
+        waiters = self._run_waiters.get(task.name)
+        if waiters and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._run_waiters[task.name]
+
+    def _is_cycle_due(self) -> bool:
+        "Whether there is something to do in the next cycle (for cycle_mode='event')"
+        if self._flag_wakeup.is_set() or self._flag_shutdown.is_set() or self._flag_restart.is_set():
+            return True
+        elif self._changed_tasks or not self._record_queue.empty():
+            return True
+        now = datetime.datetime.fromtimestamp(time.time())
+        return bool(self._wakeups) and self._wakeups[0][0] <= now
+
+    def _get_due_tasks(self) -> List[Task]:
+        "Get tasks that need to be inspected in the cycle (for cycle_mode='event')"
+        changed = set()
+        while self._changed_tasks:
+            # Popping one by one as the tasks may change in other threads
+            changed.add(self._changed_tasks.pop())
+
+        if self._flag_wakeup.is_set():
+            # All tasks are inspected (ie. on startup)
+            self._flag_wakeup.clear()
+            return self.tasks
+
+        now = datetime.datetime.fromtimestamp(time.time())
+        due = changed
+        while self._wakeups and self._wakeups[0][0] <= now:
+            wakeup, _, task = heapq.heappop(self._wakeups)
+            if self._task_wakeups.get(task) == wakeup:
+                # Not outdated
+                due.add(task)
+        if changed:
+            # The changed tasks may have made the
+            # tasks waiting for a change runnable
+            due.update(self._idle_tasks)
+        return [task for task in self.tasks if task in due or task.is_alive()]
+
+    def _set_wakeup(self, task:Task):
+        "Set the time when the task is inspected next time (for cycle_mode='event')"
+        now = datetime.datetime.fromtimestamp(time.time())
+        if task.on_startup or task.on_shutdown or task.disabled:
+            # Only a change in the task can make it runnable
+            wakeup = TimePeriod.max
+        elif task.force_run:
+            wakeup = now
+        else:
+            try:
+                wakeup = task.start_cond.next_possible(task=task, session=self.session)
+            except:
+                if not self.session.config.silence_cond_check:
+                    raise
+                wakeup = now
+
+        now = datetime.datetime.fromtimestamp(time.time())
+        if wakeup <= now:
+            # Not known when the task could start (or it
+            # could start now but did not) thus it is
+            # inspected again after the cycle sleep
+            wakeup = now + datetime.timedelta(seconds=self.session.config.cycle_sleep or 0)
+
+        self._task_wakeups[task] = wakeup
+        if wakeup < TimePeriod.max:
+            self._idle_tasks.discard(task)
+            heapq.heappush(self._wakeups, (wakeup, next(self._wakeup_counter), task))
+        elif not (task.on_startup or task.on_shutdown or task.disabled):
+            # Can start only after a change in the tasks
+            self._idle_tasks.add(task)
+        else:
+            # Inspected when the task itself changes
+            self._idle_tasks.discard(task)
+
+        if len(self._wakeups) > 2 * len(self._task_wakeups):
+            # Too many outdated wakeups, rebuilding
+            self._wakeups = [
+                (wakeup, next(self._wakeup_counter), task) 
+                for task, wakeup in self._task_wakeups.items()
+                if wakeup < TimePeriod.max
+            ]
+            heapq.heapify(self._wakeups)
+
+    def _on_task_change(self, task:Task, attr:str):
+        "Handle a change in a task (called by the task)"
+        if attr in ("session", "priority"):
+            # Task added, removed or reordered
+            self._tasks = None
+            if attr == "session" and self.session._task_index.get(task.name) is not task:
+                # Task removed
+                self._task_wakeups.pop(task, None)
+                self._idle_tasks.discard(task)
+                self._changed_tasks.discard(task)
+                return
+        elif attr == "status" and task.status == "run":
+            # Task started (possibly outside of the scheduler)
+            self._add_alive(task)
+        # The task is inspected in the next cycle (if cycle_mode='event')
+        self._changed_tasks.add(task)
+        self._wake_up()
+
     async def startup(self):
         """Start up the scheduler.
         
@@ -373,6 +686,32 @@ class Scheduler(RedBase):
         self.n_cycles = 0
         self.startup_time = datetime.datetime.fromtimestamp(time.time())
 
+        self._wakeups = []
+        self._task_wakeups = {}
+        self._changed_tasks = set()
+        self._idle_tasks = set()
+        self._run_waiters = {}
+        self._flag_wakeup.set()
+
+        # The existing tasks have already read their
+        # statuses thus the snapshot is no longer needed
+        self.session._status_snapshot = None
+
+        if self.session.config.shared_memory_min_size is not None:
+            start_tracker()
+        self._log_listener = LogQueueListener(self._log_queue, callback=self._on_log_records)
+        self._log_listener.start()
+        self._record_queue = self._log_listener
+
+        pool_size = self.session.config.process_pool_size
+        if pool_size:
+            self._process_pool = ProcessPool(pool_size, log_queue=self._log_queue, daemon=self.session.config.tasks_as_daemon)
+            self._process_pool.start()
+
+        thread_pool_size = self.session.config.thread_pool_size
+        if thread_pool_size:
+            self._thread_pool = ThreadPool(thread_pool_size)
+
         self.logger.info(f"Beginning startup sequence...")
         for task in self.tasks:
             if task.on_startup:
@@ -394,7 +733,62 @@ class Scheduler(RedBase):
     @property
     def n_alive(self) -> int:
         """Count of tasks that are alive."""
-        return sum(task.is_alive() for task in self.tasks)
+        return self.count_alive()
+
+    def count_alive(self, execution:str=None) -> int:
+        """Count of tasks that are alive. Each
+        running instance of a task is counted
+        (if the task's max_instances > 1).
+
+        Parameters
+        ----------
+        execution : str, optional
+            Count only the tasks of given execution
+            type ('async', 'thread' or 'process'),
+            by default all
+        """
+        executions = self._alive if execution is None else (execution,)
+        n = 0
+        for execution in executions:
+            tasks = self._alive[execution]
+            # Remove finished tasks (only the
+            # started ones are checked)
+            for task in list(tasks):
+                n_instances = task.count_instances()
+                if not n_instances:
+                    tasks.discard(task)
+                n += n_instances
+        return n
+
+    def _join_finished(self):
+        "Reap the threads and processes of tasks that have already finished (once per cycle)"
+        for task in list(self._alive["thread"]):
+            if task.is_alive_as_thread() and task.status != "run" and not getattr(task._thread, "is_queued", False):
+                # The task has finished and the thread is
+                # about to end. Not waiting it to end: if it
+                # has not, it is reaped in the next cycle.
+                task._thread.join(0)
+        for task in list(self._alive["process"]):
+            if task.is_alive_as_process() and task.status != "run":
+                # Same for the process
+                task._process.join(0)
+
+    def _add_alive(self, task:Task):
+        "Mark the task as possibly running"
+        execution = task.get_execution()
+        if execution in self._alive and task.is_alive():
+            self._alive[execution].add(task)
+
+    def get_thread_pool_metrics(self) -> Optional[dict]:
+        """Get metrics of the thread pool (see ``ThreadPool.get_metrics``).
+        Returns None if the thread pool is not in use"""
+        if self._thread_pool is None:
+            return None
+        return self._thread_pool.get_metrics()
+
+    def _is_under_limit(self, execution:str, limit:Optional[int]) -> bool:
+        "Whether more tasks of the execution type can be started"
+        return limit is None or self.count_alive(execution) < limit
         
     async def _shut_down_tasks(self, traceback=None, exception=None):
         non_fatal_excs = (SchedulerRestart,) # Exceptions that are allowed to have graceful exit
@@ -471,6 +865,27 @@ class Scheduler(RedBase):
 
         await self.wait_task_alive() # Wait till all tasks' threads and processes are dead
 
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self.handle_logs()
+            self._record_queue = self._log_queue
+            self._log_listener = None
+
+        # Write the records buffered by the handlers (ie. BatchedHandler)
+        task_logger = logging.getLogger(self.session.config.task_logger_basename)
+        for handler in task_logger.handlers:
+            handler.flush()
+
+        self._save_status_snapshot(force=True)
+
+        if self._process_pool is not None:
+            self._process_pool.close()
+            self._process_pool = None
+
+        if self._thread_pool is not None:
+            self._thread_pool.close()
+            self._thread_pool = None
+
         # Running hooks
         hooker.postrun()
 
@@ -525,12 +940,15 @@ class Scheduler(RedBase):
             self._flag_enabled.clear()
         else:
             self._flag_enabled.set()
+            self._flag_wakeup.set()
+            self._wake_up()
 
     def set_shut_down(self):
         """Shut down the scheduler. Useful to shut down the 
         scheduler in a controller task."""
         self.on_hold = False # In case was set to wait
         self._flag_shutdown.set()
+        self._wake_up()
 
 # Logging
     @property
@@ -1,5 +1,7 @@
 
 import asyncio
+from contextvars import ContextVar
+import functools
 import inspect
 from pickle import PicklingError
 import sys
@@ -30,16 +32,40 @@ from rocketry.core.parameters import Parameters
 from rocketry.core.log import TaskAdapter
 from rocketry.core.time.utils import to_timedelta
 from rocketry.core.utils import is_pickleable, filter_keyword_args, is_main_subprocess
+from rocketry.core.utils.shared import SharedReturn
 from rocketry.exc import SchedulerRestart, SchedulerExit, TaskInactionException, TaskTerminationException
 from rocketry.core.meta import _register
 from rocketry.core.hook import _Hooker
-from rocketry.log import QueueHandler
+from rocketry.log import CompactQueueHandler
+from rocketry.log.handlers import decode_record
 
 if TYPE_CHECKING:
     from rocketry import Session
     from rocketry.core.parameters import BaseArgument
 
 _IS_WINDOWS = platform.system()
+_ACTIONS = ('run', 'success', 'fail', 'terminate', 'inaction', 'crash')
+
+# Task and start time of the run in the current thread or async task
+# (the runs of a task with max_instances > 1 may overlap)
+_current_run: ContextVar[Optional[Tuple['Task', datetime.datetime]]] = ContextVar("_current_run", default=None)
+
+class _TaskInstance:
+    "Run of a task that was started before the latest run and is possibly still running"
+
+    def __init__(self, process=None, thread=None, async_task=None, thread_terminate=None, start=None):
+        self.process = process
+        self.thread = thread
+        self.async_task = async_task
+        self.thread_terminate = thread_terminate
+        self.start = start
+
+    def is_alive(self) -> bool:
+        return (
+            (self.process is not None and self.process.is_alive())
+            or (self.thread is not None and self.thread.is_alive())
+            or (self.async_task is not None and not self.async_task.done())
+        )
 
 def _create_session():
     # To avoid circular imports
@@ -108,6 +134,10 @@ class Task(RedBase, BaseModel):
         the task will be terminated. Only applicable
         for tasks with execution='process' or 
         with execution='thread'.
+    max_instances : int
+        Maximum number of runs of the task running
+        at the same time. Not applicable for
+        execution='main', by default 1
     daemon : Bool, optional
         Whether run the task as daemon process
         or not. Only applicable for execution='process',
@@ -161,6 +191,7 @@ class Task(RedBase, BaseModel):
     # Class
     permanent_task: bool = False # Whether the task is not meant to finish (Ie. RestAPI)
     _actions: ClassVar[Tuple] = ("run", "fail", "success", "inaction", "terminate", None, "crash")
+    _scheduler_attrs: ClassVar[Tuple] = ("session", "priority", "status", "force_run", "force_termination", "disabled", "start_cond")
     fmt_log_message: str = r"Task '{task}' status: '{action}'"
 
     daemon: Optional[bool]
@@ -176,6 +207,7 @@ class Task(RedBase, BaseModel):
     force_termination: bool = False
     status: Optional[Literal['run', 'fail', 'success', 'terminate', 'inaction', 'crash']] = Field(description="Latest status of the task")
     timeout: Optional[datetime.timedelta]
+    max_instances: int = Field(default=1, ge=1)
 
     parameters: Parameters = Parameters()
 
@@ -197,8 +229,9 @@ class Task(RedBase, BaseModel):
     _thread_terminate: threading.Event = PrivateAttr(default_factory=threading.Event)
     _lock: Optional[threading.Lock] = PrivateAttr(default_factory=threading.Lock)
     _async_task: Optional[asyncio.Task] = PrivateAttr(default=None)
-
-    _mark_running = False
+    _start_cond_compiled: Optional[Callable] = PrivateAttr(default=None)
+    _shared_memory_min_size: Optional[int] = PrivateAttr(default=None) # Set in child process
+    _instances: List['_TaskInstance'] = PrivateAttr(default_factory=list) # Earlier runs still running (if max_instances > 1)
 
     @validator('start_cond', pre=True)
     def parse_start_cond(cls, value, values):
@@ -326,6 +359,24 @@ class Task(RedBase, BaseModel):
     def __hash__(self):
         return id(self)
 
+    def __setattr__(self, name, value):
+        old_value = self.__dict__.get(name)
+        super().__setattr__(name, value)
+        if name == "name" and self.session is not None:
+            self.session._rename_task(self, old_value)
+        if name == "start_cond":
+            self._start_cond_compiled = None
+        if name in self._scheduler_attrs:
+            self._notify_change(name)
+
+    def _notify_change(self, attr:str):
+        "Inform the scheduler that an attribute affecting scheduling changed"
+        # Session is None if the task is copied to a child process
+        session = self.__dict__.get("session")
+        scheduler = getattr(session, "scheduler", None)
+        if scheduler is not None:
+            scheduler._on_task_change(self, attr)
+
     def __call__(self, *args, **kwargs):
         "Run sync"
         self.start(*args, **kwargs)
@@ -348,6 +399,11 @@ class Task(RedBase, BaseModel):
             and extra parameters are acquired, by default None
         """
 
+        if self.max_instances > 1 and self.is_alive():
+            # Keep track of the running instance(s)
+            # while this one is started
+            self._park_instance()
+
         # Remove old threads/processes
         # (using _process and _threads are most robust way to check if running as process or thread)
         if self._process is not None:
@@ -386,7 +442,15 @@ class Task(RedBase, BaseModel):
                     # in tests will succeed. 
                     time.sleep(1e-6)
             elif execution == "process":
-                self.run_as_process(params=params, **kwargs)
+                log_queue = self._start_process(params=params, **kwargs)
+                scheduler = self.session.scheduler
+                # Counted as running already while the run
+                # log is waited (for max_process_count)
+                scheduler._add_alive(self)
+                if log_queue is scheduler._log_queue:
+                    # The scheduler's listener may have taken the records
+                    log_queue = scheduler._record_queue
+                await self._lock_to_run_log_async(log_queue)
             elif execution == "thread":
                 self.run_as_thread(params=params, **kwargs)
         except (SchedulerRestart, SchedulerExit):
@@ -423,9 +487,10 @@ class Task(RedBase, BaseModel):
         elif self.disabled:
             return False
 
-        cond = self.start_cond.observe(task=self)
-
-        return cond
+        cond = self._start_cond_compiled
+        if cond is None:
+            cond = self._start_cond_compiled = self.start_cond.compile()
+        return cond(task=self)
 
     def run_as_main(self, params:Parameters):
         return self._run_as_main(params, self.parameters)
@@ -456,13 +521,16 @@ class Task(RedBase, BaseModel):
         params = Parameters(params) | Parameters(direct_params)
         params = params.materialize(task=self, session=self.session)
 
+        run_token = None
         if execution in ('main', 'async'):
-            self.log_running()
+            start = self.log_running()
+            run_token = _current_run.set((self, start))
         try:
-            if inspect.iscoroutinefunction(self.execute):
-                output = await self.execute(**params)
+            execute = self._get_executor(execution)
+            if inspect.iscoroutinefunction(execute):
+                output = await execute(**params)
             else:
-                output = self.execute(**params)
+                output = execute(**params)
 
             # NOTE: we process success here in case the process_success
             # fails (therefore task fails)
@@ -520,6 +588,8 @@ class Task(RedBase, BaseModel):
         finally:
             self.process_finish(status=status)
             self.force_run = False
+            if run_token is not None:
+                _current_run.reset(run_token)
             #if cwd is not None:
             #    os.chdir(old_cwd)
             hooker.postrun(*exc_info)
@@ -533,16 +603,29 @@ class Task(RedBase, BaseModel):
         self._thread_terminate.clear()
 
         event_is_running = threading.Event()
-        self._thread = threading.Thread(target=self._run_as_thread, args=(params, direct_params, event_is_running))
         self.last_run = datetime.datetime.fromtimestamp(time.time()) # Needed for termination
-        self._thread.start()
+        pool = getattr(self.session.scheduler, "_thread_pool", None)
+        if pool is not None:
+            self._thread = pool.submit(self._run_as_thread, params, direct_params, event_is_running)
+            if self._thread.is_queued:
+                # All workers are busy, the task is run later
+                return
+        else:
+            self._thread = threading.Thread(target=self._run_as_thread, args=(params, direct_params, event_is_running))
+            self._thread.start()
         event_is_running.wait() # Wait until the task is confirmed to run 
  
     def _run_as_thread(self, params:Parameters, direct_params:Parameters, event=None):
         """Running the task in a new thread. This method should only
         be run by the new thread."""
 
-        self.log_running()
+        if self._thread_terminate.is_set():
+            # Terminated while waiting in the thread pool
+            self.log_termination(reason="terminated while queued")
+            event.set()
+            return
+        start = self.log_running()
+        run_token = _current_run.set((self, start))
         event.set()
         try:
             output = self._run_as_main(params=params, direct_params=direct_params, execution="thread")
@@ -551,9 +634,19 @@ class Task(RedBase, BaseModel):
             self.log_failure()
             # We cannot rely the exception to main thread here
             # thus we supress to prevent unnecessary warnings.
+        finally:
+            # The thread may be reused (thread pool)
+            _current_run.reset(run_token)
 
     def run_as_process(self, params:Parameters, daemon=None, log_queue: multiprocessing.Queue=None):
         """Create a new process and run the task on that."""
+        log_queue = self._start_process(params, daemon=daemon, log_queue=log_queue)
+        self._lock_to_run_log(log_queue)
+        return log_queue
+
+    def _start_process(self, params:Parameters, daemon=None, log_queue: multiprocessing.Queue=None):
+        """Create a new process (or use a pooled one) and start
+        the task on that. Returns the log queue of the process."""
         session = self.session
 
         params = params.pre_materialize(task=self, session=session)
@@ -563,18 +656,28 @@ class Task(RedBase, BaseModel):
         log_queue = session.scheduler._log_queue if log_queue is None else log_queue
 
         daemon = self.daemon if self.daemon is not None else session.config.tasks_as_daemon
-        self._process = multiprocessing.Process(
-            target=self._run_as_process, 
-            args=(params, direct_params, log_queue, session.config, self._get_hooks("task_execute")), 
-            daemon=daemon
-        ) 
+        exec_hooks = self._get_hooks("task_execute")
+        pool = getattr(session.scheduler, "_process_pool", None)
         #self._last_run = datetime.datetime.fromtimestamp(time.time()) # Needed for termination
-        self._mark_running = True # needed in pickling
-        
-        self._process.start()
-        self._mark_running = False
-        
-        self._lock_to_run_log(log_queue)
+
+        job = None
+        try:
+            if pool is not None and log_queue is pool.log_queue:
+                # Run in a warm worker (None if all are busy)
+                job = pool.submit(self, params, direct_params, session.config, exec_hooks)
+
+            if job is not None:
+                self._process = job
+            else:
+                self._process = multiprocessing.Process(
+                    target=self._run_as_process,
+                    args=(params, direct_params, log_queue, session.config, exec_hooks),
+                    daemon=daemon
+                )
+                self._process.start()
+        except Exception as exc:
+            self._check_pickling(exc)
+            raise
         return log_queue
 
     def _run_as_process(self, params:Parameters, direct_params:Parameters, queue, config, exec_hooks):
@@ -593,7 +696,7 @@ class Task(RedBase, BaseModel):
 
         basename = self.logger_name
         # handler = logging.handlers.QueueHandler(queue)
-        handler = QueueHandler(queue)
+        handler = CompactQueueHandler(queue)
 
         # Set the process logger
         logger = logging.getLogger(basename + "._process")
@@ -606,6 +709,7 @@ class Task(RedBase, BaseModel):
         except:
             logger.critical(f"Task '{self.name}' crashed in setting up logger.", exc_info=True, extra={"action": "fail", "task_name": self.name})
             raise
+        self._shared_memory_min_size = config.shared_memory_min_size
         self.log_running()
         try:
             # NOTE: The parameters are "materialized" 
@@ -694,6 +798,12 @@ class Task(RedBase, BaseModel):
         """
         return params
 
+    def _get_executor(self, execution:Optional[str]) -> Callable:
+        """Get the method that runs the task with
+        given execution. Override to use a different
+        method when the task is run in the event loop."""
+        return self.execute
+
     @abstractmethod
     def execute(self, *args, **kwargs):
         """Run the actual task. Override this.
@@ -742,6 +852,10 @@ class Task(RedBase, BaseModel):
     @property
     def is_running(self):
         """bool: Whether the task is currently running or not."""
+        if self._instances:
+            # The status is from the run that logged last
+            # thus checking the runs themselves
+            return self.count_instances() > 0
         return self.get_status() == "run"
 
     def register(self):
@@ -756,16 +870,20 @@ class Task(RedBase, BaseModel):
         # We get the logger here to not flood with warnings if missing repo
         logger = self.logger
 
-        self.last_run = self._get_last_action("run", from_logs=True, logger=logger)
-        self.last_success = self._get_last_action("success", from_logs=True, logger=logger)
-        self.last_fail = self._get_last_action("fail", from_logs=True, logger=logger)
-        self.last_terminate = self._get_last_action("terminate", from_logs=True, logger=logger)
-        self.last_inaction = self._get_last_action("inaction", from_logs=True, logger=logger)
-        self.last_crash = self._get_last_action("crash", from_logs=True, logger=logger)
+        snapshot = self.session._get_status_snapshot()
+        if snapshot is not None and self.name in snapshot["tasks"]:
+            self._set_cached_from_snapshot(snapshot["tasks"][self.name], snapshot["created"], logger=logger)
+        else:
+            self.last_run = self._get_last_action("run", from_logs=True, logger=logger)
+            self.last_success = self._get_last_action("success", from_logs=True, logger=logger)
+            self.last_fail = self._get_last_action("fail", from_logs=True, logger=logger)
+            self.last_terminate = self._get_last_action("terminate", from_logs=True, logger=logger)
+            self.last_inaction = self._get_last_action("inaction", from_logs=True, logger=logger)
+            self.last_crash = self._get_last_action("crash", from_logs=True, logger=logger)
 
         times = {
             name: getattr(self, f"last_{name}")
-            for name in ('run', 'success', 'fail', 'terminate', 'inaction', 'crash')
+            for name in _ACTIONS
             if getattr(self, f"last_{name}") is not None
         }
         if times:
@@ -779,6 +897,27 @@ class Task(RedBase, BaseModel):
             else:
                 self.status = status
 
+    def _set_cached_from_snapshot(self, last_actions:Dict[str, float], created:float, logger=None):
+        "Set the last actions from a status snapshot and the log records created after it"
+        from redbird.oper import greater_equal
+        last_actions = dict(last_actions)
+        try:
+            records = logger.filter_by(created=greater_equal(created)).all()
+        except AttributeError:
+            if is_main_subprocess():
+                warnings.warn(f"Task '{self.name}' logger is not readable. Using only the snapshot.")
+            records = []
+        for record in records:
+            action = record["action"] if isinstance(record, dict) else record.action
+            timestamp = record["created"] if isinstance(record, dict) else record.created
+            if isinstance(timestamp, datetime.datetime):
+                timestamp = timestamp.timestamp()
+            if action in _ACTIONS and timestamp >= last_actions.get(action, timestamp):
+                last_actions[action] = timestamp
+        for action in _ACTIONS:
+            timestamp = last_actions.get(action)
+            setattr(self, f"last_{action}", datetime.datetime.fromtimestamp(timestamp) if timestamp is not None else None)
+
     def get_default_name(self, **kwargs):
         """Create a name for the task when name was not passed to initiation of
         the task. Override this method."""
@@ -786,7 +925,33 @@ class Task(RedBase, BaseModel):
 
     def is_alive(self) -> bool:
         """Whether the task is alive: check if the task has a live process or thread."""
-        return self.is_alive_as_async() or self.is_alive_as_thread() or self.is_alive_as_process()
+        return (
+            self.is_alive_as_async() or self.is_alive_as_thread() or self.is_alive_as_process()
+            or any(instance.is_alive() for instance in self._instances)
+        )
+
+    def count_instances(self) -> int:
+        """Number of runs of the task that are alive
+        (more than one only if max_instances > 1)."""
+        if self._instances:
+            self._instances = [instance for instance in self._instances if instance.is_alive()]
+        is_latest_alive = self.is_alive_as_async() or self.is_alive_as_thread() or self.is_alive_as_process()
+        return len(self._instances) + int(is_latest_alive)
+
+    def _park_instance(self):
+        "Move the running run to the instances so that a new run can be started"
+        self._instances.append(_TaskInstance(
+            process=self._process,
+            thread=self._thread,
+            async_task=self._async_task,
+            thread_terminate=self._thread_terminate,
+            start=self.last_run,
+        ))
+        self._process = None
+        self._thread = None
+        self._async_task = None
+        # Each thread run has its own termination flag
+        self._thread_terminate = threading.Event()
 
     def is_alive_as_async(self) -> bool:
         return self._async_task is not None and not self._async_task.done()
@@ -802,10 +967,10 @@ class Task(RedBase, BaseModel):
 # Logging
     def _lock_to_run_log(self, log_queue):
         "Handle next run log to make sure the task started running before continuing (otherwise may cause accidential multiple launches)"
-        action = None
         timeout = 10 # Seconds allowed the setup to take before declaring setup to crash
         #record = log_queue.get(block=True, timeout=None)
-        while action != "run":
+        is_run = False
+        while not is_run:
             try:
                 record = log_queue.get(block=True, timeout=timeout)
             except Empty:
@@ -814,16 +979,51 @@ class Task(RedBase, BaseModel):
                     self.logger.critical(f"Task '{self.name}' crashed in setup", extra={"action": "fail"})
                     return
             else:
-                
-                #self.logger.debug(f"Inserting record for '{record.task_name}' ({record.action})")
-                task = self.session[record.task_name]
-                task.log_record(record)
+                is_run = self._handle_queued_record(record)
+
+    async def _lock_to_run_log_async(self, log_queue):
+        "Same as _lock_to_run_log but lets the event loop run while waiting for the run log"
+        timeout = 10 # Seconds allowed the setup to take before declaring setup to crash
+        scheduler = self.session.scheduler
+        if log_queue is not None and log_queue is scheduler._log_listener:
+            # The scheduler handles the records as they
+            # arrive and informs when the run is logged
+            run_logged = scheduler._add_run_waiter(self)
+            while not run_logged.done():
+                try:
+                    await asyncio.wait_for(asyncio.shield(run_logged), timeout=timeout)
+                except asyncio.TimeoutError:
+                    if not self.is_alive():
+                        scheduler._remove_run_waiter(self, run_logged)
+                        # There will be no "run" log record thus ending the task gracefully
+                        self.logger.critical(f"Task '{self.name}' crashed in setup", extra={"action": "fail"})
+                        return
+            return
+
+        loop = asyncio.get_running_loop()
+        is_run = False
+        while not is_run:
+            try:
+                # Waiting in a thread to not block the event loop
+                record = await loop.run_in_executor(None, functools.partial(log_queue.get, True, timeout))
+            except Empty:
+                if not self.is_alive():
+                    # There will be no "run" log record thus ending the task gracefully
+                    self.logger.critical(f"Task '{self.name}' crashed in setup", extra={"action": "fail"})
+                    return
+            else:
+                is_run = self._handle_queued_record(record)
 
-                action = record.action
+    def _handle_queued_record(self, record) -> bool:
+        "Log a record from the log queue. Returns True if it is the run record of this task"
+        record = decode_record(record)
+        self.session.scheduler._handle_records([record])
+        return record.task_name == self.name and record.action == "run"
 
-    def log_running(self):
-        """Make a log that the task is currently running."""
-        self._set_status("run")
+    def log_running(self) -> datetime.datetime:
+        """Make a log that the task is currently running.
+        Returns the start time of the run."""
+        return self._set_status("run")
 
     def log_failure(self):
         """Log that the task failed."""
@@ -834,13 +1034,18 @@ class Task(RedBase, BaseModel):
         self._set_status("success", return_value=return_value)
         #self.status = "success"
 
-    def log_termination(self, reason=None):
-        """Make a log that the task was terminated."""
+    def log_termination(self, reason=None, start:datetime.datetime=None):
+        """Make a log that the task was terminated.
+        The start is the start time of the terminated run
+        (by default of the current or the latest run)."""
         reason = reason or "unknown reason"
-        self._set_status("terminate", message=reason)
+        self._set_status("terminate", message=reason, start=start)
 
         # Reset event and force_termination (for threads)
-        self._thread_terminate.clear()
+        if not self._instances:
+            # Else the event may belong to another run
+            # (it is cleared when the next run starts)
+            self._thread_terminate.clear()
         self.force_termination = False
 
     def log_inaction(self):
@@ -855,13 +1060,25 @@ class Task(RedBase, BaseModel):
         """Log the record with the logger of the task.
         Also sets the status according to the record.
         """
+        self.log_records([record])
+
+    def log_records(self, records:List[logging.LogRecord]):
+        """Log multiple records with the logger of the task.
+        Also sets the status according to the last record.
+        """
+        if not records:
+            return
         # Set last_run/last_success/last_fail etc.
-        cache_attr = f"last_{record.action}"
-        record_time = datetime.datetime.fromtimestamp(record.created)
-        setattr(self, cache_attr, record_time)
+        last_actions = {}
+        for record in records:
+            last_actions[record.action] = max(record.created, last_actions.get(record.action, record.created))
+        for action, created in last_actions.items():
+            setattr(self, f"last_{action}", datetime.datetime.fromtimestamp(created))
 
-        self.logger.handle(record)
-        self.status = record.action
+        logger = self.logger
+        for record in records:
+            logger.handle(record)
+        self.status = records[-1].action
 
     def get_status(self) -> Literal['run', 'fail', 'success', 'terminate', 'inaction', None]:
         """Get latest status of the task."""
@@ -882,7 +1099,7 @@ class Task(RedBase, BaseModel):
             # This is way faster
             return self.status
 
-    def _set_status(self, action, message=None, return_value=None):
+    def _set_status(self, action, message=None, return_value=None, start=None):
         if message is None:
             message = self.fmt_log_message.format(action=action, task=self.name)
 
@@ -895,7 +1112,7 @@ class Task(RedBase, BaseModel):
                 extra = {"action": "run", "start": now}
                 # self._last_run = now
             else:
-                start_time = self.get_last_run()
+                start_time = start if start is not None else self._get_run_start()
                 runtime = now - start_time if start_time is not None else None
                 extra = {"action": action, "start": start_time, "end": now, "runtime": runtime}
             
@@ -904,6 +1121,10 @@ class Task(RedBase, BaseModel):
                 # If child process, the return value is passed via QueueHandler to the main process
                 # and it's handled then in Scheduler.
                 # Else the return value is handled in Task itself (__call__ & _run_as_thread)
+                min_size = self._shared_memory_min_size
+                if min_size is not None:
+                    # Large buffers are passed via shared memory
+                    return_value = SharedReturn.from_value(return_value, min_size=min_size)
                 extra["__return__"] = return_value
 
             log_method = self.logger.exception if action == "fail" else self.logger.info
@@ -914,6 +1135,14 @@ class Task(RedBase, BaseModel):
             cache_attr = f"last_{action}"
             setattr(self, cache_attr, now)
         self.status = action
+        return now
+
+    def _get_run_start(self) -> datetime.datetime:
+        "Get start time of the run that is logging"
+        current_run = _current_run.get()
+        if current_run is not None and current_run[0] is self:
+            return current_run[1]
+        return self.get_last_run()
 
     def get_last_success(self) -> datetime.datetime:
         """Get the lastest timestamp when the task succeeded."""
@@ -1006,7 +1235,9 @@ class Task(RedBase, BaseModel):
         priv_attrs['_lock'] = None
         priv_attrs['_process'] = None
         priv_attrs['_thread'] = None
+        priv_attrs['_instances'] = []
         priv_attrs['_thread_terminate'] = None
+        priv_attrs['_start_cond_compiled'] = None
 
         # We also get rid of the conditions as if there is a task
         # containing an attr that cannot be pickled (like FuncTask
@@ -1022,31 +1253,41 @@ class Task(RedBase, BaseModel):
         dict_state['parameters'] = Parameters()
         dict_state['session'] = None
 
-        if not is_pickleable(state):
-            if self._mark_running:
-                # When this block might get executed?
-                #   - If FuncTask func is non-picklable
-                #       - There is another func with same name in the file
-                #       - The function is lambda or decorated func
-                unpicklable = {key: val for key, val in state.items() if not is_pickleable(val)}
-                self.log_running()
-                self.logger.critical(f"Task '{self.name}' crashed in pickling. Cannot pickle: {unpicklable}", extra={"action": "fail", "task_name": self.name})
-                raise PicklingError(f"Task {self.name} could not be pickled. Cannot pickle: {unpicklable}")
-            else:
-                # Is pickled by something else than task execution
-                return state
+        # NOTE: Whether the state can be pickled is checked
+        # only if starting the process fails (see _start_process)
+        # so that the task is not pickled twice per run.
 
         # what we return here will be stored in the pickle
         return state
 
+    def _check_pickling(self, exc:Exception):
+        """Log and raise PicklingError with the attributes that
+        cannot be pickled if the task is not picklable. Called 
+        when starting the task in a process failed."""
+        state = self.__getstate__()
+        if is_pickleable(state):
+            # Failed due to something else
+            return
+        # When this block might get executed?
+        #   - If FuncTask func is non-picklable
+        #       - There is another func with same name in the file
+        #       - The function is lambda or decorated func
+        attrs = {**state['__dict__'], **state['__private_attribute_values__']}
+        unpicklable = {key: val for key, val in attrs.items() if not is_pickleable(val)}
+        self.log_running()
+        self.logger.critical(f"Task '{self.name}' crashed in pickling. Cannot pickle: {unpicklable}", extra={"action": "fail", "task_name": self.name})
+        raise PicklingError(f"Task {self.name} could not be pickled. Cannot pickle: {unpicklable}") from exc
+
     def _handle_return(self, value):
         "Handle the return value (ie. store to parameters)"
+        if isinstance(value, SharedReturn):
+            value = value.load()
         self.session.returns[self] = value
 
     def delete(self):
         """Delete the task from the session. 
         Overried if needed additional cleaning."""
-        self.session.tasks.remove(self)
+        self.session.remove_task(self)
 
     def terminate(self):
         "Terminate this task"
@@ -180,4 +180,11 @@ def get_period_span(period:'TimePeriod') -> Tuple[datetime.datetime, datetime.da
     interval = period.rollback(dt)
     start = interval.left
     end = interval.right
-    return start, end
\ No newline at end of file
+    return start, end
+
+def get_next_start(period:'TimePeriod', dt:datetime.datetime) -> datetime.datetime:
+    "Get start of the next interval of the period (excluding currently ongoing)"
+    interval = period.rollforward(dt)
+    if dt in interval:
+        interval = period.rollforward(interval.right)
+    return interval.left
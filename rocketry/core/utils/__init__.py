@@ -1,4 +1,5 @@
 
 from .pickle import is_pickleable
 from .meta import filter_keyword_args
-from .process import is_main_subprocess
\ No newline at end of file
+from .process import is_main_subprocess
+from .pool import ProcessPool, ThreadPool
\ No newline at end of file
@@ -0,0 +1,284 @@
+from collections import deque
+import itertools
+import logging
+import multiprocessing
+import pickle
+import threading
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+def _run_worker(conn, log_queue, job_id):
+    """Run jobs in a pooled worker process. This function
+    should only be run by the worker process."""
+    while True:
+        try:
+            data = conn.recv_bytes()
+        except EOFError:
+            # Pool closed
+            break
+        if not data:
+            # Stop sentinel
+            break
+        task = None
+        try:
+            task, params, direct_params, config, exec_hooks = pickle.loads(data)
+            task._run_as_process(params, direct_params, log_queue, config, exec_hooks)
+        except Exception:
+            # The task crashed before it could log "run".
+            # The scheduler handles this as a crash in setup
+            # but the cause is only known here.
+            name = getattr(task, "name", None)
+            logger.exception(f"Pooled worker failed to run task {name!r}")
+        finally:
+            # Mark the worker as idle
+            job_id.value = 0
+
+class _Worker:
+    "Warm worker process of the pool"
+
+    def __init__(self, process:multiprocessing.Process, conn, job_id):
+        self.process = process
+        self.conn = conn
+        self.job_id = job_id
+
+    def is_idle(self) -> bool:
+        return self.process.is_alive() and self.job_id.value == 0
+
+class PoolJob:
+    """Handle of a task run in a pooled worker.
+
+    Mimics the parts of ``multiprocessing.Process``
+    that are used for monitoring and terminating
+    process tasks. Terminating a job terminates its
+    worker and the pool replaces it with a fresh one."""
+
+    def __init__(self, worker:_Worker, job_id:int):
+        self.worker = worker
+        self.job_id = job_id
+
+    def is_alive(self) -> bool:
+        return self.worker.process.is_alive() and self.worker.job_id.value == self.job_id
+
+    def terminate(self):
+        if self.is_alive():
+            self.worker.process.terminate()
+
+    def join(self, timeout=None):
+        # The worker process does not end when the job is done
+        # thus waiting the job id to change
+        start = time.time()
+        while self.is_alive():
+            if timeout is not None and time.time() - start >= timeout:
+                break
+            time.sleep(0.001)
+
+class ProcessPool:
+    """Pool of warm worker processes for running
+    process tasks.
+
+    Parameters
+    ----------
+    size : int
+        Number of worker processes.
+    log_queue : multiprocessing.Queue
+        Queue the workers send the log records
+        (and return values) of the tasks to.
+    daemon : bool, optional
+        Whether the workers are daemon processes,
+        by default True
+    """
+
+    def __init__(self, size:int, log_queue:multiprocessing.Queue, daemon:bool=True):
+        self.size = size
+        self.log_queue = log_queue
+        self.daemon = daemon
+        self._workers: List[_Worker] = []
+        self._job_counter = itertools.count(1)
+
+    def start(self):
+        "Start the worker processes"
+        self._workers = [self._start_worker() for _ in range(self.size)]
+
+    def _start_worker(self) -> _Worker:
+        recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+        job_id = multiprocessing.Value('q', 0)
+        process = multiprocessing.Process(
+            target=_run_worker,
+            args=(recv_conn, self.log_queue, job_id),
+            daemon=self.daemon
+        )
+        process.start()
+        recv_conn.close()
+        return _Worker(process, send_conn, job_id)
+
+    def submit(self, task, params, direct_params, config, exec_hooks) -> Optional[PoolJob]:
+        """Send a task to an idle worker. Returns None
+        if all the workers are busy."""
+        for i, worker in enumerate(self._workers):
+            if not worker.process.is_alive():
+                # Terminated or crashed, replace
+                worker.conn.close()
+                worker = self._workers[i] = self._start_worker()
+            if worker.is_idle():
+                break
+        else:
+            return None
+
+        # Pickling here (instead of in the pipe) so that
+        # pickling errors are raised to the caller
+        data = pickle.dumps((task, params, direct_params, config, exec_hooks))
+
+        job_id = next(self._job_counter)
+        worker.job_id.value = job_id
+        worker.conn.send_bytes(data)
+        return PoolJob(worker, job_id)
+
+    def close(self, timeout:float=5):
+        "Stop the workers"
+        for worker in self._workers:
+            try:
+                worker.conn.send_bytes(b"")
+            except (OSError, ValueError):
+                # Worker already dead
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.conn.close()
+        self._workers = []
+
+class ThreadJob:
+    """Handle of a task run in the thread pool.
+
+    Mimics the parts of ``threading.Thread`` that
+    are used for monitoring thread tasks. The job is
+    alive while it is queued or running."""
+
+    def __init__(self, func:Callable, args:tuple):
+        self.func = func
+        self.args = args
+        self.is_queued = True
+        self._done = threading.Event()
+
+    def is_alive(self) -> bool:
+        return not self._done.is_set()
+
+    def join(self, timeout=None):
+        self._done.wait(timeout)
+
+    def _run(self):
+        try:
+            self.func(*self.args)
+        finally:
+            self._done.set()
+
+class ThreadPool:
+    """Pool of worker threads for running thread
+    tasks.
+
+    The workers are started when needed up to the
+    size of the pool. If all of them are busy, the
+    jobs are queued and run in the order they were
+    submitted.
+
+    Parameters
+    ----------
+    size : int
+        Maximum number of worker threads.
+    """
+
+    def __init__(self, size:int):
+        self.size = size
+        self._workers: List[threading.Thread] = []
+        self._jobs = deque()
+        self._has_jobs = threading.Condition()
+        self._is_closed = False
+
+        self._n_running = 0
+        # Metrics
+        self.n_submitted = 0
+        self.n_saturated = 0
+        self.max_queued = 0
+
+    def submit(self, func:Callable, *args) -> ThreadJob:
+        """Run the function in a worker thread. The job
+        is queued if all the workers are busy"""
+        job = ThreadJob(func, args)
+        with self._has_jobs:
+            if self._is_closed:
+                raise RuntimeError("Thread pool is closed")
+            # Workers not running a job (or not yet started)
+            n_available = self.size - self._n_running
+            # Jobs before this are picked by the available workers first
+            job.is_queued = len(self._jobs) >= n_available
+            self._jobs.append(job)
+            n_free_workers = len(self._workers) - self._n_running
+            if len(self._jobs) > n_free_workers and len(self._workers) < self.size:
+                self._start_worker()
+
+            self.n_submitted += 1
+            if job.is_queued:
+                self.n_saturated += 1
+            n_queued = max(len(self._jobs) - n_available, 0)
+            self.max_queued = max(self.max_queued, n_queued)
+            self._has_jobs.notify()
+        return job
+
+    def get_metrics(self) -> dict:
+        """Get the state of the pool and how
+        saturated it has been
+
+        Returns
+        -------
+        dict
+            - ``workers``: Number of worker threads
+            - ``running``: Number of jobs running
+            - ``queued``: Number of jobs waiting for a worker
+            - ``submitted``: Number of jobs submitted in total
+            - ``saturated``: Number of jobs that had to wait for a worker
+            - ``max_queued``: Most jobs waiting at the same time
+        """
+        with self._has_jobs:
+            return {
+                "workers": len(self._workers),
+                "running": self._n_running,
+                "queued": len(self._jobs),
+                "submitted": self.n_submitted,
+                "saturated": self.n_saturated,
+                "max_queued": self.max_queued,
+            }
+
+    def close(self, timeout:float=None):
+        "Stop the workers after the queued jobs are done"
+        with self._has_jobs:
+            self._is_closed = True
+            self._has_jobs.notify_all()
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+
+    def _start_worker(self):
+        worker = threading.Thread(target=self._run_worker, daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _run_worker(self):
+        while True:
+            with self._has_jobs:
+                while not self._jobs and not self._is_closed:
+                    self._has_jobs.wait()
+                if not self._jobs:
+                    # Closed
+                    return
+                job = self._jobs.popleft()
+                job.is_queued = False
+                self._n_running += 1
+            try:
+                job._run()
+            finally:
+                with self._has_jobs:
+                    self._n_running -= 1
@@ -0,0 +1,116 @@
+import os
+import pickle
+from typing import Any, List, Tuple, Union
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError: # pragma: no cover
+    # Python 3.7
+    shared_memory = None
+
+# On Windows the memory is freed when the process
+# that created the block closes it thus not supported
+IS_SUPPORTED = shared_memory is not None and os.name == "posix"
+
+if shared_memory is not None:
+    class _SharedBlock(shared_memory.SharedMemory):
+        "Shared memory block that can be garbage collected while its buffer is used"
+
+        def __del__(self):
+            try:
+                self.close()
+            except BufferError:
+                # The buffer is still used by the loaded value.
+                # The memory is unmapped when the value is deleted.
+                pass
+
+class SharedReturn:
+    """Return value of a process task which large
+    buffers (ie. of NumPy arrays) are in shared
+    memory blocks.
+
+    The value is pickled with protocol 5 and the
+    out-of-band buffers larger than ``min_size``
+    are copied to shared memory. Only the names
+    of the blocks are passed to the main process
+    which maps the buffers without copying.
+
+    The blocks are unlinked by the process that
+    loads the value. If the process that created
+    them uses the resource tracker of the main
+    process (see ``start_tracker``), the tracker
+    unlinks the blocks that were not loaded when
+    the main process exits. Otherwise the creator
+    stops tracking the blocks so that they are not
+    unlinked when it exits and the blocks that are
+    never loaded are left in the shared memory.
+    """
+
+    def __init__(self, data:bytes, buffers:List[Union[bytes, Tuple[str, int]]]):
+        self.data = data
+        self.buffers = buffers
+
+    @classmethod
+    def from_value(cls, value, min_size:int) -> Union['SharedReturn', Any]:
+        """Create from a value. The value is pickled only
+        once: if it has no buffers larger than min_size,
+        the pickled value is passed as it is."""
+        if not IS_SUPPORTED:
+            return value
+        is_tracker_shared = _is_tracker_shared()
+        buffers = []
+        data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+
+        shared_buffers = []
+        for buffer in buffers:
+            raw = buffer.raw()
+            if raw.nbytes >= min_size:
+                block = shared_memory.SharedMemory(create=True, size=raw.nbytes)
+                block.buf[:raw.nbytes] = raw
+                shared_buffers.append((block.name, raw.nbytes))
+                block.close()
+                if not is_tracker_shared:
+                    # The tracker of this process would unlink
+                    # the block when this process exits
+                    resource_tracker.unregister(block._name, "shared_memory")
+            else:
+                shared_buffers.append(raw.tobytes())
+        return cls(data, shared_buffers)
+
+    def load(self) -> Any:
+        """Load the value. The buffers in shared memory
+        are used as they are (not copied)."""
+        buffers = []
+        for buffer in self.buffers:
+            if isinstance(buffer, bytes):
+                buffers.append(buffer)
+                continue
+            name, size = buffer
+            # Attaching registers the block to the resource
+            # tracker (again if the creator used the same
+            # tracker) and unlinking unregisters it
+            block = _SharedBlock(name=name)
+            # Only the name is removed. The memory is
+            # freed when the value is no longer used.
+            block.unlink()
+            buffers.append(block.buf[:size])
+        return pickle.loads(self.data, buffers=buffers)
+
+_tracker_shared = {} # Whether the process uses the tracker of its parent (by process id)
+
+def _is_tracker_shared() -> bool:
+    "Whether the resource tracker was started before the first block of this process"
+    pid = os.getpid()
+    if pid not in _tracker_shared:
+        # The tracker started by the parent is
+        # inherited by the child processes
+        _tracker_shared[pid] = resource_tracker._resource_tracker._fd is not None
+    return _tracker_shared[pid]
+
+def start_tracker():
+    """Start the resource tracker of the shared memory
+    blocks so that the child processes use the same tracker.
+    The tracker unlinks the blocks the main process has
+    not read when the main process exits."""
+    if IS_SUPPORTED:
+        resource_tracker.ensure_running()
@@ -1,2 +1,3 @@
-from .handlers import QueueHandler
-from .log_record import MinimalRecord, LogRecord, TaskLogRecord
\ No newline at end of file
+from .handlers import QueueHandler, CompactQueueHandler, BatchedHandler
+from .log_record import MinimalRecord, LogRecord, TaskLogRecord
+from .repos import IndexedMemoryRepo, SQLiteRepo
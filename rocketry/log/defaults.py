@@ -1,10 +1,10 @@
 
 from redbird.logging import RepoHandler
-from redbird.repos import MemoryRepo
 from .log_record import MinimalRecord
+from .repos import IndexedMemoryRepo
 
 def create_default_handler():
     "Create default handler that can be read"
     return RepoHandler(
-        repo=MemoryRepo(model=MinimalRecord)
+        repo=IndexedMemoryRepo(model=MinimalRecord)
     )
\ No newline at end of file
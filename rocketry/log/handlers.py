@@ -1,5 +1,8 @@
+from collections import deque
+import datetime
 from logging.handlers import QueueHandler as _QueueHandler
-from logging import Formatter
+from logging import Formatter, Handler, LogRecord
+import threading
 
 import copy
 
@@ -44,3 +47,163 @@ class QueueHandler(_QueueHandler):
         record.exc_info = None
         # record.exc_text = None
         return record
+
+
+# Fields of a compact record (in order). These are
+# the fields the log record models need.
+_RECORD_FIELDS = (
+    "name", "msg", "levelname", "levelno", "pathname", "filename",
+    "module", "exc_text", "lineno", "funcName", "created", "msecs",
+    "relativeCreated", "thread", "threadName", "processName", "process",
+    "message", "task_name", "action", "start", "end", "runtime",
+)
+_N_FIELDS = len(_RECORD_FIELDS)
+_MESSAGE = _RECORD_FIELDS.index("message")
+_START, _END, _RUNTIME = _RECORD_FIELDS.index("start"), _RECORD_FIELDS.index("end"), _RECORD_FIELDS.index("runtime")
+
+class CompactQueueHandler(QueueHandler):
+    """Queue handler that puts the log records
+    to the queue as tuples of the fields the
+    log record models need.
+
+    The tuples are cheaper to pickle and unpickle
+    than the log records. Use ``decode_record``
+    to turn them back to log records. The return
+    value of the task (``__return__``) is passed
+    as the last item, if set.
+    """
+
+    def prepare(self, record):
+        "Encode the record as a tuple"
+        message = self.format(record)
+        data = [getattr(record, field, None) for field in _RECORD_FIELDS]
+        data[_MESSAGE] = message
+        start, end, runtime = data[_START], data[_END], data[_RUNTIME]
+        # Timestamps are smaller to transfer than datetimes
+        data[_START] = start.timestamp() if start is not None else None
+        data[_END] = end.timestamp() if end is not None else None
+        data[_RUNTIME] = runtime.total_seconds() if runtime is not None else None
+        if hasattr(record, "__return__"):
+            data.append(record.__return__)
+        return tuple(data)
+
+def decode_record(data) -> LogRecord:
+    """Turn a record encoded by ``CompactQueueHandler``
+    back to a log record. Other records are returned
+    as they are."""
+    if not isinstance(data, tuple):
+        return data
+    # Skipping LogRecord.__init__ as the attributes are set here
+    record = LogRecord.__new__(LogRecord)
+    attrs = record.__dict__
+    attrs.update(zip(_RECORD_FIELDS, data))
+    attrs["args"] = None
+    attrs["exc_info"] = None
+    attrs["stack_info"] = None
+    start, end, runtime = data[_START], data[_END], data[_RUNTIME]
+    attrs["start"] = datetime.datetime.fromtimestamp(start) if start is not None else None
+    attrs["end"] = datetime.datetime.fromtimestamp(end) if end is not None else None
+    attrs["runtime"] = datetime.timedelta(seconds=runtime) if runtime is not None else None
+    if len(data) > _N_FIELDS:
+        attrs["__return__"] = data[_N_FIELDS]
+    return record
+
+class BatchedHandler(Handler):
+    """Handler that passes the log records to another
+    handler in batches in a background thread.
+
+    Useful to keep slow repositories (ie. files) from
+    blocking the scheduler. The pending records are
+    written when the handler is flushed or closed.
+    Reading the repo (via ``repo``) does not wait for
+    them. The scheduler flushes the handlers of the
+    task logger on shutdown and the records emitted
+    after closing are written directly.
+
+    Parameters
+    ----------
+    handler : logging.Handler
+        Handler that writes the records, ie.
+        ``redbird.logging.RepoHandler``.
+    batch_size : int, optional
+        Maximum number of records written at once
+        while holding the write lock, by default 100
+    **kwargs : dict
+        Keyword arguments passed to logging.Handler
+        init
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import logging
+        from redbird.logging import RepoHandler
+        from redbird.repos import CSVFileRepo
+        from rocketry.log import BatchedHandler
+
+        repo = CSVFileRepo(filename="logs.csv")
+        logger = logging.getLogger("rocketry.task")
+        logger.addHandler(BatchedHandler(RepoHandler(repo=repo)))
+    """
+
+    def __init__(self, handler:Handler, batch_size:int=100, **kwargs):
+        super().__init__(**kwargs)
+        self.handler = handler
+        self.batch_size = batch_size
+        self._records = deque()
+        self._has_records = threading.Condition()
+        self._write_lock = threading.RLock()
+        self._thread = None
+        self._is_closed = False
+
+    @property
+    def repo(self):
+        "BaseRepo: Repository of the wrapped handler (pending records are not flushed)"
+        return getattr(self.handler, "repo")
+
+    def emit(self, record):
+        "Queue the record to be written"
+        with self._has_records:
+            self._records.append(record)
+            is_closed = self._is_closed
+            if self._thread is None and not is_closed:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._has_records.notify()
+        if is_closed:
+            # No background thread to write it
+            self.flush()
+
+    def flush(self):
+        "Write the pending records"
+        with self._write_lock:
+            while True:
+                with self._has_records:
+                    n_records = min(len(self._records), self.batch_size)
+                    batch = [self._records.popleft() for _ in range(n_records)]
+                if not batch:
+                    break
+                for record in batch:
+                    self.handler.handle(record)
+            self.handler.flush()
+
+    def close(self):
+        "Write the pending records and stop the background thread"
+        with self._has_records:
+            self._is_closed = True
+            self._has_records.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        self.handler.close()
+        super().close()
+
+    def _run(self):
+        while True:
+            with self._has_records:
+                while not self._records and not self._is_closed:
+                    self._has_records.wait()
+                if self._is_closed:
+                    return
+            self.flush()
@@ -0,0 +1,431 @@
+from bisect import bisect_left, bisect_right
+import datetime
+import sqlite3
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import PrivateAttr
+from redbird.oper import Between, GreaterEqual, GreaterThan, In, LessEqual, LessThan, NotEqual, Operation, _Skip
+from redbird.repos import MemoryRepo
+from redbird.templates import TemplateRepo
+from redbird.utils.query import QueryMatcher
+
+from .log_record import MinimalRecord
+
+class IndexedMemoryRepo(MemoryRepo):
+    """Memory repository for task log records
+
+    Works as ``redbird.repos.MemoryRepo`` but
+    maintains indexes for the queries Rocketry
+    uses: the latest record of each action of
+    each task and the records of each task
+    sorted by creation time. The records must
+    have fields ``task_name``, ``action`` and
+    ``created``.
+
+    Unlike ``MemoryRepo``, queries filtered by
+    a task name return the records in the order
+    of creation time instead of in the order of
+    insertion. These differ if a record arrives
+    late (ie. from a process task). Other queries
+    return the records in the order of insertion.
+
+    The records can also be removed automatically
+    by setting a retention policy. The repository
+    is then compacted when it has grown to double 
+    since the previous compaction. The latest 
+    record of each action of each task is always
+    kept as the task statuses are based on them.
+
+    Parameters
+    ----------
+    model : Type
+        Class of a log record. By default dict.
+    max_records : int, optional
+        Maximum number of records kept per task.
+        By default, no limit.
+    max_age : datetime.timedelta, float, optional
+        Maximum age of the kept records (or seconds).
+        By default, no limit.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from rocketry.log import IndexedMemoryRepo, LogRecord
+        repo = IndexedMemoryRepo(model=LogRecord)
+
+    .. code-block:: python
+
+        # Keep at most 1000 records per task and
+        # the records of the past week
+        repo = IndexedMemoryRepo(
+            model=LogRecord, 
+            max_records=1000, 
+            max_age=datetime.timedelta(days=7)
+        )
+    """
+    max_records: Optional[int] = None
+    max_age: Optional[datetime.timedelta] = None
+
+    # Minimum size of the repository before compacting
+    min_compact_size: int = 1000
+
+    # Records of each task sorted by creation time and their creation times
+    _by_task: Dict[str, List[Any]] = PrivateAttr(default_factory=dict)
+    _created: Dict[str, List[float]] = PrivateAttr(default_factory=dict)
+    # Latest record (and its position in the collection) of each action of each task
+    _latest: Dict[str, Dict[str, Tuple[int, Any]]] = PrivateAttr(default_factory=dict)
+
+    _indexed: List[Any] = PrivateAttr(default=None)
+    _n_indexed: int = PrivateAttr(default=0)
+    _compact_at: int = PrivateAttr(default=0)
+
+    def insert(self, item):
+        super().insert(item)
+        self._check_index()
+        if self._is_compaction_due():
+            self.compact()
+
+    def compact(self):
+        """Remove the records that are not retained by
+        the retention policy (``max_records`` and ``max_age``)"""
+        self._check_index()
+        min_created = (
+            time.time() - self.max_age.total_seconds()
+            if self.max_age is not None else None
+        )
+        keep = set()
+        for task_name, records in self._by_task.items():
+            times = self._created[task_name]
+            start = 0
+            if self.max_records is not None:
+                start = max(len(records) - self.max_records, 0)
+            if min_created is not None:
+                start = max(start, bisect_left(times, min_created))
+            keep.update(id(data) for data in records[start:])
+            # Task statuses rely on these
+            keep.update(id(data) for _, data in self._latest[task_name].values())
+        self.collection = [data for data in self.collection if id(data) in keep]
+        self._reindex()
+        self._compact_at = max(2 * len(self.collection), self.min_compact_size)
+
+    def _is_compaction_due(self) -> bool:
+        has_policy = self.max_records is not None or self.max_age is not None
+        return has_policy and len(self.collection) >= max(self._compact_at, self.min_compact_size)
+
+    def query_data(self, query:dict):
+        self._check_index()
+        records = self._get_candidates(query)
+        matcher = QueryMatcher(query, value_getter=self.get_field_value)
+        for data in records:
+            if data in matcher:
+                yield data
+
+    def query_read_last(self, query:dict):
+        self._check_index()
+        task_name = query.get("task_name")
+        action = query.get("action")
+        is_indexed = (
+            isinstance(task_name, str)
+            and (action is None or isinstance(action, (str, In)))
+            and set(query) <= {"task_name", "action"}
+        )
+        if is_indexed:
+            actions = self._latest.get(task_name, {})
+            if action is None:
+                latest = list(actions.values())
+            elif isinstance(action, In):
+                latest = [actions[act] for act in action.value if act in actions]
+            else:
+                latest = [actions[action]] if action in actions else []
+            if not latest:
+                return None
+            _, data = max(latest, key=lambda rec: rec[0])
+            return self.data_to_item(data)
+
+        matcher = QueryMatcher(query, value_getter=self.get_field_value)
+        for data in reversed(self.collection):
+            if data in matcher:
+                return self.data_to_item(data)
+
+    def query_count(self, query:dict) -> int:
+        return sum(1 for _ in self.query_data(query))
+
+    def query_update(self, query:dict, values:dict):
+        super().query_update(query, values)
+        self._reindex()
+
+    def query_delete(self, query:dict):
+        super().query_delete(query)
+        self._reindex()
+
+    def _get_candidates(self, query:dict) -> List[Any]:
+        "Get records that might match the query using the indexes"
+        task_name = query.get("task_name")
+        if isinstance(task_name, Operation) or task_name is None:
+            return self.collection
+        records = self._by_task.get(task_name, [])
+        created = query.get("created")
+        if isinstance(created, Operation):
+            times = self._created.get(task_name, [])
+            start, end = 0, len(times)
+            if isinstance(created, Between):
+                start = bisect_left(times, created.start)
+                end = bisect_right(times, created.end)
+            elif isinstance(created, GreaterEqual):
+                start = bisect_left(times, created.value)
+            elif isinstance(created, GreaterThan):
+                start = bisect_right(times, created.value)
+            elif isinstance(created, LessEqual):
+                end = bisect_right(times, created.value)
+            elif isinstance(created, LessThan):
+                end = bisect_left(times, created.value)
+            records = records[start:end]
+        return records
+
+    def _check_index(self):
+        "Index new records (or all if the collection was replaced)"
+        if self._indexed is not self.collection or self._n_indexed > len(self.collection):
+            self._reindex()
+            return
+        for data in self.collection[self._n_indexed:]:
+            self._index(data, self._n_indexed)
+            self._n_indexed += 1
+
+    def _reindex(self):
+        self._by_task = {}
+        self._created = {}
+        self._latest = {}
+        self._indexed = self.collection
+        self._n_indexed = 0
+        self._check_index()
+
+    def _index(self, data, position:int):
+        task_name = self.get_field_value(data, "task_name")
+        action = self.get_field_value(data, "action")
+        created = self.get_field_value(data, "created")
+
+        records = self._by_task.setdefault(task_name, [])
+        times = self._created.setdefault(task_name, [])
+        if not times or times[-1] <= created:
+            records.append(data)
+            times.append(created)
+        else:
+            # Arrived late (ie. from a process)
+            pos = bisect_right(times, created)
+            records.insert(pos, data)
+            times.insert(pos, created)
+
+        self._latest.setdefault(task_name, {})[action] = (position, data)
+
+
+def _flush_pending(conn:sqlite3.Connection, lock:threading.RLock, sql:str, pending:list):
+    "Write the pending rows to the database"
+    with lock:
+        if pending:
+            conn.executemany(sql, pending)
+            conn.commit()
+            pending.clear()
+
+class SQLiteRepo(TemplateRepo):
+    """SQLite repository for task log records
+
+    The log records are stored to a table 
+    that has a column for each field of the
+    model. The table is indexed by task 
+    name, action and creation time and the
+    database uses write-ahead logging.
+    
+    By default, each record is committed when
+    inserted. With a larger ``batch_size``, the
+    records are inserted in batches. Pending 
+    records are written when the batch is full,
+    before reading and when the repository is 
+    garbage collected or the interpreter exits.
+    A hard crash may then lose the pending 
+    records except the ``run`` records which are
+    always written immediately as detecting the
+    crashed runs on restart relies on them.
+
+    Like with the memory repositories, the last
+    record is the last inserted record.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the SQLite database.
+    table : str, optional
+        Name of the table, by default 'task_log'.
+    model : Type
+        Class of a log record (Pydantic model),
+        by default MinimalRecord.
+    batch_size : int, optional
+        Number of records inserted at once,
+        by default 1.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from rocketry.log import SQLiteRepo, LogRecord
+        repo = SQLiteRepo(filename="logs.db", model=LogRecord)
+    """
+    filename: str
+    table: str = "task_log"
+    model: Type = MinimalRecord
+    batch_size: int = 1
+
+    __slots__ = ("__weakref__",) # For flushing when garbage collected
+
+    _conn: sqlite3.Connection = PrivateAttr(default=None)
+    _lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+    _pending: list = PrivateAttr(default_factory=list)
+    _columns: Tuple[str, ...] = PrivateAttr(default=())
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._columns = tuple(self.model.__fields__)
+        self._conn = sqlite3.connect(self.filename, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_table()
+        weakref.finalize(self, _flush_pending, self._conn, self._lock, self._get_insert_sql(), self._pending)
+
+    def _create_table(self):
+        columns = ", ".join(
+            f"{self._quote(name)} {self._get_column_type(field.outer_type_)}"
+            for name, field in self.model.__fields__.items()
+        )
+        table = self._quote(self.table)
+        with self._lock:
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+            for index_cols in (("task_name", "action"), ("task_name", "created")):
+                name = self._quote(f"ix_{self.table}_{'_'.join(index_cols)}")
+                cols = ", ".join(map(self._quote, index_cols))
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({cols})")
+            self._conn.commit()
+
+    def insert(self, item):
+        data = self.item_to_data(item)
+        with self._lock:
+            self._pending.append(data)
+            if len(self._pending) >= self.batch_size or self.get_field_value(item, "action") == "run":
+                self.flush()
+
+    def flush(self):
+        "Write the pending records to the database"
+        _flush_pending(self._conn, self._lock, self._get_insert_sql(), self._pending)
+
+    def item_to_data(self, item) -> tuple:
+        return tuple(
+            self._to_db(self.get_field_value(item, col))
+            for col in self._columns
+        )
+
+    def data_to_item(self, data):
+        if isinstance(data, tuple):
+            data = dict(zip(self._columns, data))
+        return super().data_to_item(data)
+
+    def query_data(self, query:dict):
+        where, params = self._format_where(query)
+        yield from self._execute(f"SELECT * FROM {self._quote(self.table)}{where} ORDER BY rowid", params)
+
+    def query_read_first(self, query:dict):
+        where, params = self._format_where(query)
+        rows = self._execute(f"SELECT * FROM {self._quote(self.table)}{where} ORDER BY rowid LIMIT 1", params)
+        return self.data_to_item(rows[0]) if rows else None
+
+    def query_read_last(self, query:dict):
+        # Index (task_name, action) is also ordered by rowid
+        where, params = self._format_where(query)
+        rows = self._execute(f"SELECT * FROM {self._quote(self.table)}{where} ORDER BY rowid DESC LIMIT 1", params)
+        return self.data_to_item(rows[0]) if rows else None
+
+    def query_count(self, query:dict) -> int:
+        where, params = self._format_where(query)
+        rows = self._execute(f"SELECT COUNT(*) FROM {self._quote(self.table)}{where}", params)
+        return rows[0][0]
+
+    def query_update(self, query:dict, values:dict):
+        where, params = self._format_where(query)
+        sets = ", ".join(f"{self._quote(self._check_column(key))}=?" for key in values)
+        set_params = [self._to_db(val) for val in values.values()]
+        self._execute(f"UPDATE {self._quote(self.table)} SET {sets}{where}", set_params + params, commit=True)
+
+    def query_delete(self, query:dict):
+        where, params = self._format_where(query)
+        self._execute(f"DELETE FROM {self._quote(self.table)}{where}", params, commit=True)
+
+    def _execute(self, sql:str, params:list, commit:bool=False) -> list:
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(sql, params).fetchall()
+            if commit:
+                self._conn.commit()
+        return rows
+
+    def _format_where(self, query:dict) -> Tuple[str, list]:
+        "Turn the query to SQL WHERE clause and its parameters"
+        clauses = []
+        params = []
+        for key, value in query.items():
+            col = self._quote(self._check_column(key))
+            if isinstance(value, _Skip):
+                continue
+            elif isinstance(value, Between):
+                clauses.append(f"{col} BETWEEN ? AND ?")
+                params += [self._to_db(value.start), self._to_db(value.end)]
+            elif isinstance(value, In):
+                values = list(value.value)
+                clauses.append(f"{col} IN ({', '.join('?' * len(values))})")
+                params += [self._to_db(val) for val in values]
+            elif isinstance(value, Operation):
+                opers = {
+                    GreaterThan: ">", GreaterEqual: ">=", 
+                    LessThan: "<", LessEqual: "<=", NotEqual: "!="
+                }
+                if type(value) not in opers:
+                    raise NotImplementedError(f"Operation {type(value).__name__} not supported")
+                clauses.append(f"{col} {opers[type(value)]} ?")
+                params.append(self._to_db(value.value))
+            elif value is None:
+                clauses.append(f"{col} IS NULL")
+            else:
+                clauses.append(f"{col} = ?")
+                params.append(self._to_db(value))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def _get_insert_sql(self) -> str:
+        cols = ", ".join(map(self._quote, self._columns))
+        values = ", ".join("?" * len(self._columns))
+        return f"INSERT INTO {self._quote(self.table)} ({cols}) VALUES ({values})"
+
+    def _check_column(self, name:str) -> str:
+        if name not in self._columns:
+            raise KeyError(f"Field {name!r} not in the model")
+        return name
+
+    @staticmethod
+    def _quote(name:str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    @staticmethod
+    def _get_column_type(type_) -> str:
+        if type_ is bool or type_ is int:
+            return "INTEGER"
+        elif type_ is float:
+            return "REAL"
+        return "TEXT"
+
+    @staticmethod
+    def _to_db(value):
+        if isinstance(value, datetime.datetime):
+            return value.isoformat()
+        elif isinstance(value, datetime.timedelta):
+            return value.total_seconds()
+        return value
@@ -6,9 +6,12 @@ about the scehuler/task/parameters etc.
 """
 
 import datetime
+import json
 import logging
 from multiprocessing import cpu_count
+import os
 from pathlib import Path
+import time
 import warnings
 
 from pydantic import BaseModel, PrivateAttr, validator
@@ -46,6 +49,10 @@ class Config(BaseModel):
     task_execution: str = 'process'
     task_pre_exist: str = 'raise'
     force_status_from_logs: bool = False # Force to check status from logs every time (slow but robust)
+    status_snapshot: Optional[str] = None # File to store the last actions of the tasks for fast startup
+    status_snapshot_interval: datetime.timedelta = datetime.timedelta(minutes=1)
+    shared_memory_min_size: Optional[int] = None # Return value buffers of process tasks larger than this (bytes) are passed in shared memory
+    module_cache: bool = True # Whether to reuse the modules of FuncTasks with path until the files change
     
     task_logger_basename: str = "rocketry.task"
     scheduler_logger_basename: str = "rocketry.scheduler"
@@ -53,9 +60,15 @@ class Config(BaseModel):
     silence_task_prerun: bool = False # Whether to silence errors occurred in setting a task to run
     silence_cond_check: bool = False # Whether to silence errors occurred in checking conditions
     cycle_sleep: Optional[float] = 0.1
+    cycle_mode: Literal['poll', 'event'] = 'poll'
+    cycle_cond_cache: bool = False # Whether to evaluate task independent conditions once per cycle
     debug: bool = False
 
     max_process_count = cpu_count()
+    max_thread_count: Optional[int] = None
+    max_async_count: Optional[int] = None
+    process_pool_size: Optional[int] = None # Number of warm worker processes for process tasks (None: new process per run)
+    thread_pool_size: Optional[int] = None # Number of worker threads for thread tasks (None: new thread per run)
     tasks_as_daemon: bool = True
     restarting: str = 'replace'
     instant_shutdown: bool = False
@@ -73,7 +86,7 @@ class Config(BaseModel):
             return AlwaysFalse()
         return parse_condition(value)
 
-    @validator('timeout', pre=True, always=True)
+    @validator('timeout', 'status_snapshot_interval', pre=True, always=True)
     def parse_timeout(cls, value):
         if isinstance(value, str):
             return to_timedelta(value)
@@ -181,22 +194,25 @@ class Session(RedBase):
         self.parameters = self._get_parameters(parameters)
         self.scheduler = Scheduler(self)
         self.tasks = set()
+        self._task_index: Dict[str, 'Task'] = {} # Task names to tasks (for fast lookup)
         self.hooks = Hooks()
         self.returns = self._get_parameters(None)
         self._cond_parsers = self._cls_cond_parsers.copy()
         self._cond_cache: Dict = {} # Cached by CondParser to speed up expensive conditions
         self._cond_states = {} # Used by FuncConds to relay condiiton states to conditions
+        self._cycle_cond_cache = None # States of conditions in the current cycle (if config.cycle_cond_cache)
+        self._status_snapshot = None # Loaded from config.status_snapshot
+        self._module_cache: Dict = {} # Modules imported by FuncTasks with path (see config.module_cache)
         if delete_existing_loggers:
             self.delete_task_loggers()
 
     def __getitem__(self, task:Union['Task', str]):
         "Get a task from the session"
         task_name = self._get_task_name(task)
-        for task in self.tasks:
-            if task.name == task_name:
-                return task
-        else:
-            raise KeyError(f"Task '{task_name}' not found")
+        try:
+            return self._task_index[task_name]
+        except KeyError:
+            raise KeyError(f"Task '{task_name}' not found") from None
 
     def __contains__(self, task: Union['Task', str]):
         "Check if task is in session"
@@ -284,6 +300,7 @@ class Session(RedBase):
         will occur after the scheduler finishes
         checking one cycle of tasks."""
         self.scheduler._flag_restart.set()
+        self.scheduler._wake_up()
 
     def shutdown(self):
         """Shut down the scheduler
@@ -296,6 +313,7 @@ class Session(RedBase):
             "Please use Session.shut_down instead"
         ), DeprecationWarning)
         self.scheduler._flag_shutdown.set()
+        self.scheduler._wake_up()
 
     def shut_down(self, force=None):
         """Shut down the scheduler"""
@@ -303,6 +321,7 @@ class Session(RedBase):
         self.scheduler._flag_shutdown.set()
         if force:
             self.scheduler._flag_force_exit.set()
+        self.scheduler._wake_up()
 
     def _check_readable_logger(self):
         from rocketry.core.log import TaskAdapter
@@ -372,12 +391,14 @@ class Session(RedBase):
             if if_exists == 'ignore':
                 return
             elif if_exists == 'replace':
-                self.tasks.remove(task)
+                self.tasks.remove(self[task])
                 self.tasks.add(task)
+                self._task_index[task.name] = task
             elif if_exists == 'raise':
                 raise KeyError(f"Task '{task.name}' already exists")
         else:
             self.tasks.add(task)
+            self._task_index[task.name] = task
         
         # Adding the session to the task
         task.session = self
@@ -385,7 +406,17 @@ class Session(RedBase):
     def remove_task(self, task: Union['Task', str]):
         if isinstance(task, str):
             task = self[task]
-        self.session.tasks.remove(task)
+        self.tasks.remove(task)
+        if self._task_index.get(task.name) is task:
+            del self._task_index[task.name]
+        if self.scheduler is not None:
+            self.scheduler._on_task_change(task, "session")
+
+    def _rename_task(self, task: 'Task', old_name: str):
+        "Update the task index after a task was renamed"
+        if self._task_index.get(old_name) is task:
+            del self._task_index[old_name]
+            self._task_index[task.name] = task
 
     def task_exists(self, task: 'Task'):
         warnings.warn((
@@ -394,11 +425,7 @@ class Session(RedBase):
         ), DeprecationWarning)
 
         task_name = self._get_task_name(task)
-        for task in self.tasks:
-            if task.name == task_name:
-                return True
-        else:
-            return False
+        return task_name in self._task_index
 
     def get_repo(self):
         "Get log repo where the task logs are stored"
@@ -458,6 +485,52 @@ class Session(RedBase):
             data = chain(data, logger.get_records(*args, **kwargs))
         return data
         
+    def save_status_snapshot(self, filename:Optional[str]=None):
+        """Save the last actions (run, success, fail etc.)
+        of the tasks to a file. The tasks are set from it
+        (and from the log records created after it) on 
+        startup instead of querying the logs for every
+        action.
+
+        Parameters
+        ----------
+        filename : str, optional
+            File to save the snapshot to, by default
+            ``config.status_snapshot``
+        """
+        from rocketry.core.task import _ACTIONS
+        filename = filename if filename is not None else self.config.status_snapshot
+        snapshot = {
+            "created": time.time(),
+            "tasks": {
+                task.name: {
+                    action: getattr(task, f"last_{action}").timestamp()
+                    for action in _ACTIONS
+                    if getattr(task, f"last_{action}") is not None
+                }
+                for task in self.tasks
+            }
+        }
+        # Write first to a temporary file to not leave a broken snapshot
+        path = Path(filename)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(snapshot))
+        os.replace(tmp_path, path)
+
+    def _get_status_snapshot(self) -> Optional[dict]:
+        """Get status snapshot (loaded from config.status_snapshot).
+        Not used while the scheduler runs as then the snapshot
+        may be outdated."""
+        if self.scheduler.is_alive:
+            return None
+        if self._status_snapshot is None and self.config.status_snapshot is not None:
+            path = Path(self.config.status_snapshot)
+            try:
+                self._status_snapshot = json.loads(path.read_text())
+            except FileNotFoundError:
+                self._status_snapshot = {"created": None, "tasks": {}}
+        return self._status_snapshot
+
     def delete_task_loggers(self):
         """Delete the previous loggers from task logger"""
         loggers = logging.Logger.manager.loggerDict
@@ -471,6 +544,8 @@ class Session(RedBase):
         from rocketry.core import Parameters
 
         self.tasks = set()
+        self._task_index = {}
+        self.scheduler._tasks = None
         self.parameters = Parameters()
 
     def __getstate__(self):
@@ -478,7 +553,11 @@ class Session(RedBase):
         # the task.session. Therefore removing unpicklable here.
         state = self.__dict__.copy()
         state["tasks"] = set()
+        state["_task_index"] = {}
         state["_cond_cache"] = None
+        state["_cycle_cond_cache"] = None
+        state["_status_snapshot"] = None
+        state["_module_cache"] = {}
         state["_cond_parsers"] = None
         state["session"] = None
         #state["parameters"] = None
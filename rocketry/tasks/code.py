@@ -1,6 +1,18 @@
 
+import functools
+from types import CodeType
+
+from pydantic import validator
+
 from rocketry.core import Task
 
+@functools.lru_cache(maxsize=1024)
+def _compile_code(code:str) -> CodeType:
+    """Compile the code of a CodeTask. Cached by the content
+    so the same code is compiled only once per process (also
+    in the warm workers of the process pool)"""
+    return compile(code, "<string>", "exec")
+
 class CodeTask(Task):
     """Task to run a piece of Python code
 
@@ -13,7 +25,8 @@ class CodeTask(Task):
     code : str
         Piece of Python code to execute. Variable ``return_value``
         is used as the return value of this task if set. Parameters
-        are passed to the code as locals.
+        are passed to the code as locals. The code is compiled 
+        once and syntax errors are raised on creating the task.
     **kwargs : dict
         See :class:`rocketry.core.Task`
 
@@ -48,10 +61,16 @@ class CodeTask(Task):
     output_variable: str = 'return_value'
     code: str
 
+    @validator('code')
+    def validate_code(cls, value):
+        # Raises SyntaxError if invalid
+        _compile_code(value)
+        return value
+
     def execute(self, **params):
         loc = params
         glob = {}
-        exec(self.code, glob, loc)
+        exec(_compile_code(self.code), glob, loc)
         return loc.get(self.output_variable, None)
 
     def get_default_name(self, **kwargs):
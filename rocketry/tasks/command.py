@@ -1,6 +1,9 @@
 
+import asyncio
+import datetime
 import subprocess
-from typing import List, Optional, Union
+import threading
+from typing import Callable, List, Optional, Tuple, Union
 
 try:
     from typing import Literal
@@ -12,11 +15,62 @@ from pydantic import Field, validator
 from rocketry.core.parameters.parameters import Parameters
 from rocketry.core.task import Task
 
+class _OutputSink:
+    """Output of a command read in chunks. Only
+    the last bytes are kept in memory and the
+    whole output is optionally written to a file."""
+
+    chunk_size = 2 ** 16
+
+    def __init__(self, tail_size:int, file:Optional[str]=None):
+        self.tail_size = tail_size
+        self.tail = bytearray()
+        self._file = open(file, "wb") if file is not None else None
+
+    def write(self, chunk:Union[bytes, str]):
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        if self._file is not None:
+            self._file.write(chunk)
+        self.tail += chunk
+        if len(self.tail) > self.tail_size:
+            del self.tail[:len(self.tail) - self.tail_size]
+
+    def read_from(self, stream):
+        if stream is None:
+            return
+        while True:
+            chunk = stream.read(self.chunk_size)
+            if not chunk:
+                break
+            self.write(chunk)
+
+    async def read_from_async(self, stream:Optional[asyncio.StreamReader]):
+        if stream is None:
+            return
+        while True:
+            chunk = await stream.read(self.chunk_size)
+            if not chunk:
+                break
+            self.write(chunk)
+
+    def getvalue(self) -> bytes:
+        return bytes(self.tail)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
 
 class CommandTask(Task):
     """Task that executes a command from 
     shell/terminal.
 
+    With ``execution="async"``, the command is
+    run as an asyncio subprocess so that it does
+    not block the event loop and it can be
+    terminated by cancelling.
+
     Parameters
     ----------
     command : str, list
@@ -27,6 +81,16 @@ class CommandTask(Task):
         If true, the command will be executed through the shell.
     kwds_popen : dict, optional
         Keyword arguments to be passed to subprocess.Popen
+    stream_output : bool, optional
+        If true, the output is read in chunks while the
+        command runs instead of keeping all of it in memory.
+        Only the last ``output_tail`` bytes of the output
+        are returned. By default False.
+    output_tail : int, optional
+        Number of last bytes of the output (and of the error
+        output) kept when streaming. By default 64 KiB.
+    output_file : str, optional
+        File where the whole output is written when streaming.
     **kwargs : dict
         See :py:class:`rocketry.core.Task`
 
@@ -46,6 +110,9 @@ class CommandTask(Task):
     cwd: Optional[str]
     kwds_popen: dict = {}
     argform: Optional[Literal['-', '--', 'short', 'long']] = Field(description="Whether the arguments are turned as short or long form command line arguments")
+    stream_output: bool = Field(default=False, description="Whether to read the output in chunks instead of buffering it all")
+    output_tail: int = Field(default=2 ** 16, ge=0, description="Number of last bytes of the output kept when streaming")
+    output_file: Optional[str] = Field(description="File where the output is written when streaming")
 
     def get_kwargs_popen(self) -> dict:
         kwargs = {
@@ -68,8 +135,9 @@ class CommandTask(Task):
             None: '--',
         }[value]
 
-    def execute(self, **parameters):
-        """Run the command."""
+    def get_command(self, parameters:dict) -> Union[str, List[str]]:
+        """Get the command with the parameters
+        as command line arguments."""
         command = self.command
         
         for param, val in parameters.items():
@@ -79,24 +147,137 @@ class CommandTask(Task):
             if isinstance(command, str):
                 command = command + f" {param} \"{val}\""
             else:
-                command += [param] + [val]
+                command = command + [param, val]
+        return command
+
+    def get_timeout(self) -> Optional[float]:
+        "Get the timeout of the command in seconds"
+        if self.timeout is None or self.timeout == datetime.timedelta.max:
+            return None
+        return self.timeout.total_seconds()
+
+    def execute(self, **parameters):
+        """Run the command."""
+        command = self.get_command(parameters)
 
         # https://stackoverflow.com/a/5469427/13696660
         pipe = subprocess.Popen(command, **self.get_kwargs_popen())
+        timeout = self.get_timeout()
+        if self.stream_output:
+            outs, errs = self._stream(pipe, timeout=timeout)
+        else:
+            try:
+                outs, errs = pipe.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                # https://docs.python.org/3.3/library/subprocess.html#subprocess.Popen.communicate
+                pipe.kill()
+                outs, errs = pipe.communicate()
+                raise
+        
+        self._check_return_code(pipe.returncode, errs)
+        return outs
+
+    async def execute_async(self, **parameters):
+        """Run the command as an asyncio subprocess."""
+        command = self.get_command(parameters)
+        kwargs = self.get_kwargs_popen()
+        shell = kwargs.pop("shell")
+
+        if shell:
+            pipe = await asyncio.create_subprocess_shell(command, **kwargs)
+        else:
+            if isinstance(command, str):
+                command = [command]
+            pipe = await asyncio.create_subprocess_exec(*command, **kwargs)
+
+        timeout = self.get_timeout()
+        if self.stream_output:
+            communicate = self._stream_async(pipe)
+        else:
+            communicate = pipe.communicate()
         try:
-            outs, errs = pipe.communicate(timeout=self.timeout)
-        except subprocess.TimeoutExpired:
-            # https://docs.python.org/3.3/library/subprocess.html#subprocess.Popen.communicate
-            pipe.kill()
-            outs, errs = pipe.communicate()
+            outs, errs = await asyncio.wait_for(communicate, timeout=timeout)
+        except asyncio.TimeoutError:
+            await self._kill_async(pipe)
+            raise subprocess.TimeoutExpired(command, timeout)
+        except asyncio.CancelledError:
+            # Terminated by the scheduler
+            await self._kill_async(pipe)
             raise
-        
-        return_code = pipe.returncode
+
+        self._check_return_code(pipe.returncode, errs)
+        return outs
+
+    def _stream(self, pipe:subprocess.Popen, timeout:Optional[float]=None) -> Tuple[bytes, bytes]:
+        """Read the output and error output of the
+        process in chunks till the process finishes"""
+        out = _OutputSink(self.output_tail, self.output_file)
+        err = _OutputSink(self.output_tail)
+        if pipe.stdin is not None:
+            pipe.stdin.close()
+
+        timed_out = threading.Event()
+        def kill():
+            timed_out.set()
+            pipe.kill()
+        timer = threading.Timer(timeout, kill) if timeout is not None else None
+
+        # Error output is read in another thread so
+        # that neither of the pipes fills up
+        err_reader = threading.Thread(target=err.read_from, args=(pipe.stderr,), daemon=True)
+        try:
+            if timer is not None:
+                timer.start()
+            err_reader.start()
+            out.read_from(pipe.stdout)
+            err_reader.join()
+            pipe.wait()
+        finally:
+            if timer is not None:
+                timer.cancel()
+            out.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(pipe.args, timeout)
+        return out.getvalue(), err.getvalue()
+
+    async def _stream_async(self, pipe:asyncio.subprocess.Process) -> Tuple[bytes, bytes]:
+        """Read the output and error output of the
+        asyncio subprocess in chunks till it finishes"""
+        out = _OutputSink(self.output_tail, self.output_file)
+        err = _OutputSink(self.output_tail)
+        if pipe.stdin is not None:
+            pipe.stdin.close()
+        try:
+            await asyncio.gather(
+                out.read_from_async(pipe.stdout),
+                err.read_from_async(pipe.stderr),
+            )
+            await pipe.wait()
+        finally:
+            out.close()
+        return out.getvalue(), err.getvalue()
+
+    @staticmethod
+    async def _kill_async(pipe:asyncio.subprocess.Process):
+        try:
+            pipe.kill()
+        except ProcessLookupError:
+            # Already finished
+            pass
+        await pipe.wait()
+
+    def _get_executor(self, execution:Optional[str]) -> Callable:
+        if execution == "async":
+            return self.execute_async
+        return self.execute
+
+    @staticmethod
+    def _check_return_code(return_code:int, errs):
         if return_code != 0:
             if hasattr(errs, "decode"):
                 errs = errs.decode("utf-8", errors="ignore")
             raise OSError(f"Failed running command ({return_code}): \n{errs}")
-        return outs
 
     def postfilter_params(self, params: Parameters):
         # Only allows the task specific parameters
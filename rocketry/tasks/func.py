@@ -4,10 +4,11 @@ import sys
 import inspect
 import importlib
 from pathlib import Path
-from typing import Callable, List, Optional
+import weakref
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
 import warnings
 
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, validator
 from rocketry.core.parameters.arguments import BaseArgument
 
 from rocketry.core.task import Task
@@ -34,6 +35,46 @@ def get_module(path, pkg_path=None):
         raise ImportError(f"Importing the file '{path}' failed.") from exc
     return task_module
 
+# Arguments of the functions read from the signatures. Weak keys
+# so that the functions of reloaded modules can be garbage collected
+_signature_args = weakref.WeakKeyDictionary()
+
+def _get_signature_args(func:Callable) -> Tuple[Tuple[str, ...], Tuple[str, ...], FrozenSet[str], Tuple[Tuple[str, BaseArgument], ...]]:
+    """Get the arguments of a function from its signature.
+    Returns the names of the positional arguments, the names
+    of the keyword arguments (also as a set) and the pairs of
+    names and arguments set as defaults"""
+    params = inspect.signature(func).parameters.values()
+    pos_args = tuple(
+        param.name for param in params
+        if param.kind in (
+            inspect.Parameter.POSITIONAL_ONLY, # NOTE: Python <= 3.8 do not have positional arguments, but maybe in the future?
+            inspect.Parameter.POSITIONAL_OR_KEYWORD # Keyword argument
+        )
+    )
+    kw_args = tuple(
+        param.name for param in params
+        if param.kind in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD, # Normal argument
+            inspect.Parameter.KEYWORD_ONLY # Keyword argument
+        )
+    )
+    args = tuple(Parameters._from_signature(func).items())
+    return pos_args, kw_args, frozenset(kw_args), args
+
+def _get_func_args(func:Callable):
+    """Get the arguments of a function from its signature
+    (cached per function object)"""
+    try:
+        return _signature_args[func]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable or cannot be weakly referenced
+        return _get_signature_args(func)
+    args = _signature_args[func] = _get_signature_args(func)
+    return args
+
 def to_import_path(src:stat_result):
     imp = '.'.join(Path(src).with_suffix("").parts)
     return imp
@@ -145,6 +186,7 @@ class FuncTask(Task):
 
     _delayed_kwargs: dict = {}
     _name_template: str = '{module_name}:{func_name}'
+    _process_modules: Dict = PrivateAttr(default_factory=dict) # Module cache of the copy in a child process
     @property
     def delayed(self):
         return self.func is None
@@ -233,13 +275,7 @@ class FuncTask(Task):
 
     def get_func(self, cache=True):
         if self.func is None:
-            # Add dir of self.path to sys.path so importing from that dir works
-            pkg_path = find_package_root(self.path)
-            root = str(Path(self.path).parent.absolute()) if not pkg_path else str(pkg_path)
-
-            # _task_func is cached to faster performance
-            with TempSysPath([root] + self.sys_paths):
-                task_module = get_module(self.path, pkg_path=pkg_path)
+            task_module = self.get_module()
             task_func = getattr(task_module, self.func_name)
 
             if cache:
@@ -248,6 +284,40 @@ class FuncTask(Task):
         else:
             return self.func
 
+    def get_module(self):
+        """Import the module of the task from the path. 
+        The module is reused from the session's module
+        cache if the file has not changed since."""
+        path = Path(self.path)
+        modules = self._get_module_cache()
+        if modules is not None:
+            stat = path.stat()
+            key = str(path.absolute())
+            cached = modules.get(key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]
+
+        # Add dir of self.path to sys.path so importing from that dir works
+        pkg_path = find_package_root(path)
+        root = str(path.parent.absolute()) if not pkg_path else str(pkg_path)
+
+        with TempSysPath([root] + self.sys_paths):
+            task_module = get_module(path, pkg_path=pkg_path)
+
+        if modules is not None:
+            modules[key] = (stat.st_mtime_ns, stat.st_size, task_module)
+        return task_module
+
+    def _get_module_cache(self) -> Optional[dict]:
+        session = self.session
+        if session is None:
+            # Copy of the task in a child process
+            # (only lives for the run)
+            return self._process_modules
+        if not session.config.module_cache:
+            return None
+        return session._module_cache
+
     def get_default_name(self, func=None, path=None, func_name=None, _name_template=None, **kwargs):
         if func is None:
             file = Path(path)
@@ -263,13 +333,6 @@ class FuncTask(Task):
         else:
             return f'{module_name}:{func_name}'
 
-    def process_finish(self, *args, **kwargs):
-        if self.is_delayed():
-            # Deleting the _func so it is refreshed
-            # next time the task is run.
-            self._func = None
-        super().process_finish(*args, **kwargs)
-
     def is_delayed(self):
         return self.func is None
         
@@ -279,7 +342,7 @@ class FuncTask(Task):
         # Get params from the typehints
         cache = False if self.path is not None else True
         func = self.get_func(cache=cache)
-        params.update(Parameters._from_signature(func, task=self, session=self.session))
+        params.update(dict(_get_func_args(func)[3]))
         return params
 
     def prefilter_params(self, params):
@@ -289,9 +352,10 @@ class FuncTask(Task):
             # pickling. If lazy, we filter after
             # pickling to handle problems in 
             # pickling functions.
+            kw_args = self._get_kw_arg_set()
             return {
                 key: val for key, val in params.items()
-                if key in self.kw_args
+                if key in kw_args
             }
         else:
             return params
@@ -299,37 +363,24 @@ class FuncTask(Task):
     def postfilter_params(self, params:Parameters):
         if self.is_delayed():
             # Was not filtered in prefiltering.
+            kw_args = self._get_kw_arg_set()
             return {
                 key: val for key, val in params.items()
-                if key in self.kw_args
+                if key in kw_args
             }
         else:
             return params
 
+    def _get_kw_arg_set(self) -> FrozenSet[str]:
+        func = self.get_func(cache=self.cache)
+        return _get_func_args(func)[2]
+
     @property
     def pos_args(self):
-        func = self.get_func()
-        sig = inspect.signature(func)
-        pos_args = [
-            val.name
-            for name, val in sig.parameters.items()
-            if val.kind in (
-                inspect.Parameter.POSITIONAL_ONLY, # NOTE: Python <= 3.8 do not have positional arguments, but maybe in the future?
-                inspect.Parameter.POSITIONAL_OR_KEYWORD # Keyword argument
-            )
-        ]
-        return pos_args
+        func = self.get_func(cache=self.cache)
+        return list(_get_func_args(func)[0])
 
     @property
     def kw_args(self):
-        func = self.get_func()
-        sig = inspect.signature(func)
-        kw_args = [
-            val.name
-            for name, val in sig.parameters.items()
-            if val.kind in (
-                inspect.Parameter.POSITIONAL_OR_KEYWORD, # Normal argument
-                inspect.Parameter.KEYWORD_ONLY # Keyword argument
-            )
-        ]
-        return kw_args
+        func = self.get_func(cache=self.cache)
+        return list(_get_func_args(func)[1])
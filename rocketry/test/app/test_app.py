@@ -7,6 +7,7 @@ from rocketry.conditions.task.task import TaskStarted
 from rocketry.args import Return, Arg, FuncArg
 from redbird.logging import RepoHandler
 from redbird.repos import MemoryRepo, CSVFileRepo
+from rocketry.log import IndexedMemoryRepo
 
 from rocketry import Session
 from rocketry.tasks import CommandTask
@@ -29,14 +30,18 @@ def test_app_create(session, tmpdir):
     # Till Red Bird supports equal, we need to test the handler one obj at a time
     assert len(task_logger.handlers) == 1
     assert isinstance(task_logger.handlers[0], RepoHandler)
-    assert isinstance(task_logger.handlers[0].repo, MemoryRepo)
+    assert isinstance(task_logger.handlers[0].repo, IndexedMemoryRepo)
 
     assert isinstance(app.session, Session)
 
+    app = Rocketry(logger_repo="memory")
+    assert len(task_logger.handlers) == 2
+    assert isinstance(task_logger.handlers[0].repo, IndexedMemoryRepo)
+
     # Test setting SQL repo
     with tmpdir.as_cwd():
         app = Rocketry(logger_repo=CSVFileRepo(filename="myrepo.csv"))
-    assert len(task_logger.handlers) == 2
+    assert len(task_logger.handlers) == 3
     assert isinstance(task_logger.handlers[0], RepoHandler)
     assert isinstance(task_logger.handlers[0].repo, CSVFileRepo)
 
@@ -1,4 +1,6 @@
 
+import datetime
+
 import pytest
 
 from rocketry.conditions import (
@@ -240,6 +242,19 @@ def test_task_depend_success(tmpdir, session, cls, expected):
         task()
         assert not condition.observe(task=task)
 
+def test_task_depend_cached(session):
+    # The statuses are read from the tasks, not from the logs
+    condition = DependSuccess(task="runned task", depend_task="prerequisite task")
+    depend_task = FuncTask(run_task, name="prerequisite task", execution="main", session=session)
+    task = FuncTask(run_task, name="runned task", execution="main", session=session)
+
+    depend_task.last_success = datetime.datetime(2022, 1, 1, 10, 0)
+    assert condition.observe(task=task)
+
+    task.last_run = datetime.datetime(2022, 1, 1, 11, 0)
+    assert not condition.observe(task=task)
+    assert task.logger.filter_by().count() == 0
+
 
 @pytest.mark.parametrize(
     "cls,string",
@@ -0,0 +1,52 @@
+import pytest
+
+from rocketry.conditions import FuncCond, TaskStarted
+from rocketry.conds import true, false, daily, started
+from rocketry.core.condition import All, Any, Not
+from rocketry.tasks import FuncTask
+
+def is_true():
+    return True
+
+def is_false():
+    return False
+
+cond_true = FuncCond(is_true)
+cond_false = FuncCond(is_false)
+
+@pytest.mark.parametrize("cond", [
+    pytest.param(All(cond_true, cond_true), id="All, true"),
+    pytest.param(All(cond_true, cond_false), id="All, false"),
+    pytest.param(All(cond_true, All(cond_false, cond_true)), id="All, nested"),
+    pytest.param(All(), id="All, empty"),
+    pytest.param(All(true, false), id="All, constant"),
+    pytest.param(Any(cond_false, cond_false), id="Any, false"),
+    pytest.param(Any(cond_false, cond_true), id="Any, true"),
+    pytest.param(Any(cond_false, Any(cond_false, cond_true)), id="Any, nested"),
+    pytest.param(Any(), id="Any, empty"),
+    pytest.param(Any(false, cond_true), id="Any, constant"),
+    pytest.param(Not(cond_true), id="Not"),
+    pytest.param(Not(Not(cond_false)), id="Not, double"),
+    pytest.param(Not(true), id="Not, constant"),
+    pytest.param(All(Any(cond_false, Not(cond_false)), ~All(cond_true, false)), id="Mixed"),
+])
+def test_compile(cond, session):
+    task = FuncTask(lambda: None, name="a task", execution="main", session=session)
+    assert cond.compile()(task=task) is cond.observe(task=task)
+
+def test_compile_wrapper(session):
+    task = FuncTask(lambda: None, name="a task", execution="main", session=session)
+    for cond in (daily, daily.between("10:00", "12:00"), started, started.today, started(task="a task").this_hour):
+        assert cond.compile()(task=task) == cond.observe(task=task)
+
+def test_task_cache(session):
+    task = FuncTask(lambda: None, name="a task", start_cond=cond_true, execution="main", session=session)
+    assert task.is_runnable()
+    assert task._start_cond_compiled is not None
+
+    task.start_cond = cond_false
+    assert task._start_cond_compiled is None
+    assert not task.is_runnable()
+
+    task.start_cond = TaskStarted(task="a task") == 0
+    assert task.is_runnable()
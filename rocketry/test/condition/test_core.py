@@ -7,6 +7,9 @@ from rocketry.conditions import (
 )
 from rocketry.conds import true, false
 from rocketry.time import TimeDelta
+from rocketry.args import Arg, Session, Task
+from rocketry.core import BaseCondition
+from rocketry.tasks import FuncTask
 
 def test_true():
     assert bool(true)
@@ -102,4 +105,25 @@ def test_fail(get_cond,exc):
 )
 def test_representation(obj, string, represent):
     assert str(obj) == string
-    assert repr(obj) == represent
\ No newline at end of file
+    assert repr(obj) == represent
+
+def test_observe_args(session):
+    class TaskAndSession(BaseCondition):
+        def get_state(self, task=Task(), session=Session()):
+            return task.name == "mytask" and session is task.session
+
+    class SessionArg(BaseCondition):
+        def get_state(self, value=Arg("myarg")):
+            return value == "myval"
+
+    class NoArgs(BaseCondition):
+        def get_state(self):
+            return True
+
+    task = FuncTask(lambda: None, name="mytask", execution="main", session=session)
+    session.parameters["myarg"] = "myval"
+    for _ in range(2):
+        assert TaskAndSession().observe(task=task)
+        assert TaskAndSession().observe(task=task, session=session)
+        assert SessionArg().observe(task=task)
+        assert NoArgs().observe(task=task)
@@ -0,0 +1,54 @@
+import pytest
+
+from rocketry.args import Task
+from rocketry.conditions import FuncCond, IsEnv, IsPeriod, SchedulerCycles
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeOfDay
+
+calls = []
+
+def is_foo():
+    calls.append(None)
+    return True
+
+def is_foo_task(task=Task()):
+    calls.append(task.name)
+    return True
+
+@pytest.mark.parametrize("use_cache,expected", [(True, 1), (False, 3)])
+def test_shared_cond(session, use_cache, expected):
+    calls.clear()
+    for name in ("task 1", "task 2", "task 3"):
+        # Equal but separate conditions
+        FuncTask(lambda: None, name=name, start_cond=FuncCond(is_foo) & IsEnv("prod"), execution="main", session=session)
+
+    session.config.cycle_cond_cache = use_cache
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+
+    assert len(calls) == expected
+    for name in ("task 1", "task 2", "task 3"):
+        assert session[name].logger.filter_by(action="run").count() == 0
+    # Cache is only used during a cycle
+    assert session._cycle_cond_cache is None
+
+def test_task_dependent_cond(session):
+    calls.clear()
+    for name in ("task 1", "task 2"):
+        FuncTask(lambda: None, name=name, start_cond=FuncCond(is_foo_task), execution="main", session=session)
+
+    session.config.cycle_cond_cache = True
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+
+    assert sorted(calls) == ["task 1", "task 2"]
+
+def test_key():
+    assert IsPeriod(TimeOfDay("10:00", "12:00"))._get_cycle_key() == IsPeriod(TimeOfDay("10:00", "12:00"))._get_cycle_key()
+    assert IsPeriod(TimeOfDay("10:00", "12:00"))._get_cycle_key() != IsPeriod(TimeOfDay("10:00", "13:00"))._get_cycle_key()
+    assert IsEnv("prod")._get_cycle_key() != IsEnv("dev")._get_cycle_key()
+    assert FuncCond(is_foo, kwargs={"x": 1})._get_cycle_key() == FuncCond(is_foo, kwargs={"x": 1})._get_cycle_key()
+    assert FuncCond(is_foo, kwargs={"x": 1})._get_cycle_key() != FuncCond(is_foo, kwargs={"x": 2})._get_cycle_key()
+
+    assert FuncCond(is_foo)._cycle_cacheable
+    assert not FuncCond(is_foo_task)._cycle_cacheable
@@ -0,0 +1,115 @@
+import datetime
+import logging
+
+import pytest
+
+from rocketry.conditions import (
+    IsPeriod, TaskExecutable, TaskRunnable, TaskStarted,
+    DependSuccess, TaskRunning,
+    AlwaysTrue, AlwaysFalse, All, Any, Not,
+)
+from rocketry.core.time import TimePeriod
+from rocketry.pybox.time.convert import to_datetime
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeDelta, TimeOfDay, Cron
+
+def log_action(task, log_time, action):
+    record = logging.LogRecord(
+        name='rocketry.core.task', level=logging.INFO, lineno=1,
+        pathname='d:\\Projects\\rocketry\\rocketry\\core\\task\\base.py',
+        msg="Logging of 'task'", args=(), exc_info=None,
+    )
+    record.created = to_datetime(log_time).timestamp()
+    record.action = action
+    record.task_name = task.name
+    task.logger.handle(record)
+    setattr(task, f'last_{action}', to_datetime(log_time))
+
+@pytest.mark.parametrize(
+    "get_condition,logs,time_now,expected",
+    [
+        pytest.param(
+            lambda: AlwaysTrue(), [], "2020-01-01 07:00", "2020-01-01 07:00",
+            id="AlwaysTrue"),
+        pytest.param(
+            lambda: AlwaysFalse(), [], "2020-01-01 07:00", TimePeriod.max,
+            id="AlwaysFalse"),
+        pytest.param(
+            lambda: IsPeriod(TimeOfDay("10:00", "12:00")), [], "2020-01-01 07:00", "2020-01-01 10:00",
+            id="IsPeriod (before)"),
+        pytest.param(
+            lambda: IsPeriod(TimeOfDay("10:00", "12:00")), [], "2020-01-01 11:00", "2020-01-01 11:00",
+            id="IsPeriod (in)"),
+        pytest.param(
+            lambda: TaskExecutable(task="the task", period=TimeOfDay()),
+            [("2020-01-01 07:10", "run"), ("2020-01-01 07:20", "success")],
+            "2020-01-01 08:00", "2020-01-02 00:00",
+            id="TaskExecutable (succeeded)"),
+        pytest.param(
+            lambda: TaskExecutable(task="the task", period=TimeOfDay("10:00", "12:00")),
+            [("2020-01-01 10:10", "run"), ("2020-01-01 10:20", "fail")],
+            "2020-01-01 11:00", "2020-01-02 10:00",
+            id="TaskExecutable (failed)"),
+        pytest.param(
+            lambda: TaskExecutable(task="the task", period=TimeOfDay("10:00", "12:00")),
+            [],
+            "2020-01-01 07:00", "2020-01-01 10:00",
+            id="TaskExecutable (out of period)"),
+        pytest.param(
+            lambda: TaskExecutable(task="the task", period=TimeDelta("1 hour")),
+            [("2020-01-01 07:10", "run"), ("2020-01-01 07:20", "success")],
+            "2020-01-01 07:30", "2020-01-01 08:20",
+            id="TaskExecutable (time delta)"),
+        pytest.param(
+            lambda: TaskStarted(task="the task", period=TimeDelta("10 minutes")) == 0,
+            [("2020-01-01 07:10", "run")],
+            "2020-01-01 07:15", "2020-01-01 07:20",
+            id="TaskStarted (time delta)"),
+        pytest.param(
+            lambda: TaskStarted(task="the task", period=TimeOfDay()) > 0,
+            [],
+            "2020-01-01 07:15", TimePeriod.max,
+            id="TaskStarted (not started)"),
+        pytest.param(
+            lambda: TaskRunnable(task="the task", period=Cron("0", "*")),
+            [("2020-01-01 07:00", "run")],
+            "2020-01-01 07:00:30", "2020-01-01 08:00",
+            id="TaskRunnable (cron)"),
+        pytest.param(
+            lambda: DependSuccess(task="the task", depend_task="other task"),
+            [],
+            "2020-01-01 07:15", TimePeriod.max,
+            id="DependSuccess (not succeeded)"),
+        pytest.param(
+            lambda: TaskRunning(task="the task"),
+            [],
+            "2020-01-01 07:15", TimePeriod.max,
+            id="TaskRunning (not running)"),
+        pytest.param(
+            lambda: IsPeriod(TimeOfDay("10:00", "12:00")) & IsPeriod(TimeOfDay("11:00", "13:00")),
+            [],
+            "2020-01-01 07:00", "2020-01-01 11:00",
+            id="All"),
+        pytest.param(
+            lambda: IsPeriod(TimeOfDay("10:00", "12:00")) | IsPeriod(TimeOfDay("11:00", "13:00")),
+            [],
+            "2020-01-01 07:00", "2020-01-01 10:00",
+            id="Any"),
+        pytest.param(
+            lambda: ~IsPeriod(TimeOfDay("10:00", "12:00")),
+            [],
+            "2020-01-01 11:00", "2020-01-01 11:00",
+            id="Not"),
+    ],
+)
+def test_next_possible(mock_pydatetime, get_condition, logs, time_now, expected, session):
+    task = FuncTask(lambda: None, name="the task", execution="main", session=session)
+    FuncTask(lambda: None, name="other task", execution="main", session=session)
+
+    for log_time, action in logs:
+        log_action(task, log_time, action)
+    mock_pydatetime(time_now)
+
+    cond = get_condition()
+    expected = to_datetime(expected)
+    assert cond.next_possible(task=task, session=session) == expected
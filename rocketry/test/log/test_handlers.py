@@ -0,0 +1,114 @@
+import datetime
+import logging
+from queue import SimpleQueue
+import threading
+import time
+
+from redbird.logging import RepoHandler
+from redbird.repos import MemoryRepo
+
+from rocketry.conditions import SchedulerCycles
+from rocketry.log import BatchedHandler, CompactQueueHandler, MinimalRecord
+from rocketry.log.handlers import decode_record
+from rocketry.tasks import FuncTask
+
+class ThreadHandler(logging.Handler):
+    "Collect messages and the threads they were written in"
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((record.msg, threading.current_thread()))
+
+def do_success():
+    ...
+
+def _make_record(created):
+    record = logging.LogRecord("rocketry.task", logging.INFO, "", 0, "run", None, None)
+    record.task_name = "my task"
+    record.action = "run"
+    record.created = created
+    return record
+
+def test_background():
+    handler = ThreadHandler()
+    batched = BatchedHandler(handler)
+    logger = logging.getLogger("rocketry.test.batched")
+    logger.handlers = [batched]
+    logger.propagate = False
+
+    for i in range(10):
+        logger.warning(f"message {i}")
+
+    start = time.time()
+    while len(handler.records) < 10 and time.time() - start < 5:
+        time.sleep(0.001)
+    assert [msg for msg, _ in handler.records] == [f"message {i}" for i in range(10)]
+    assert all(thread is not threading.main_thread() for _, thread in handler.records)
+    batched.close()
+    assert batched._thread is None
+
+def test_read_not_flushed():
+    repo = MemoryRepo(model=MinimalRecord)
+    handler = BatchedHandler(RepoHandler(repo=repo), batch_size=2)
+    # Holding the lock to keep the records pending
+    with handler._write_lock:
+        for i in range(5):
+            handler.handle(_make_record(created=float(i)))
+        assert handler.repo is repo
+        assert repo.filter_by().count() == 0
+    handler.flush()
+    assert [r.created for r in repo.filter_by().all()] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    handler.close()
+
+def test_emit_after_close():
+    repo = MemoryRepo(model=MinimalRecord)
+    handler = BatchedHandler(RepoHandler(repo=repo))
+    handler.close()
+    handler.handle(_make_record(created=1.0))
+    assert [r.created for r in repo.filter_by().all()] == [1.0]
+    assert handler._thread is None
+
+def test_session(session):
+    logger = logging.getLogger("rocketry.task")
+    repo = logger.handlers[0].repo
+    logger.handlers = [BatchedHandler(RepoHandler(repo=repo))]
+    session.config.shut_cond = SchedulerCycles() >= 2
+
+    task = FuncTask(do_success, name="my task", start_cond="true", execution="main", session=session)
+    session.start()
+
+    # Flushed on shutdown
+    assert [r.action for r in repo.filter_by(task_name="my task").all()] == ["run", "success", "run", "success"]
+    assert task.status == "success"
+
+def test_compact_queue():
+    queue = SimpleQueue()
+    handler = CompactQueueHandler(queue)
+    start = datetime.datetime(2022, 1, 1, 10, 0)
+    end = datetime.datetime(2022, 1, 1, 10, 30)
+
+    record = _make_record(created=start.timestamp())
+    record.action = "success"
+    record.start = start
+    record.end = end
+    record.runtime = end - start
+    record.__return__ = {"x": 1}
+    handler.handle(record)
+
+    data = queue.get()
+    assert isinstance(data, tuple)
+    decoded = decode_record(data)
+    assert isinstance(decoded, logging.LogRecord)
+    for attr in ("name", "msg", "levelname", "levelno", "task_name", "action", "created", "lineno", "process"):
+        assert getattr(decoded, attr) == getattr(record, attr)
+    assert decoded.message == "run"
+    assert decoded.start == start
+    assert decoded.end == end
+    assert decoded.runtime == end - start
+    assert decoded.__return__ == {"x": 1}
+    assert MinimalRecord(**vars(decoded)).action == "success"
+
+    # Other records are passed as is
+    assert decode_record(record) is record
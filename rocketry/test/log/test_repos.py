@@ -0,0 +1,171 @@
+import time
+
+import pytest
+
+from redbird.oper import between, greater_equal, greater_than, in_, less_equal, less_than
+from redbird.repos import MemoryRepo
+
+from rocketry.log import IndexedMemoryRepo, MinimalRecord, SQLiteRepo, TaskLogRecord
+
+RECORDS = [
+    {"task_name": "task 1", "action": "run", "created": 1.0},
+    {"task_name": "task 2", "action": "run", "created": 2.0},
+    {"task_name": "task 1", "action": "success", "created": 3.0},
+    {"task_name": "task 2", "action": "fail", "created": 4.0},
+    {"task_name": "task 1", "action": "run", "created": 5.0},
+    # Arriving late
+    {"task_name": "task 2", "action": "run", "created": 3.5},
+    {"task_name": "task 1", "action": "fail", "created": 6.0},
+]
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repos(request, tmpdir):
+    if request.param == "memory":
+        repo = IndexedMemoryRepo(model=MinimalRecord)
+    else:
+        repo = SQLiteRepo(filename=str(tmpdir / "logs.db"), model=MinimalRecord, batch_size=3)
+    expected = MemoryRepo(model=MinimalRecord)
+    for record in RECORDS:
+        repo.add(MinimalRecord(**record))
+        expected.add(MinimalRecord(**record))
+    return repo, expected
+
+def get_last(repo, expected, query):
+    # Last inserted (also for SQLite)
+    return expected.filter_by(**query).last()
+
+@pytest.mark.parametrize("query", [
+    {},
+    {"task_name": "task 1"},
+    {"task_name": "task 2"},
+    {"task_name": "not found"},
+    {"task_name": "task 1", "action": "run"},
+    {"task_name": "task 1", "action": "not found"},
+    {"task_name": "task 1", "action": in_(["success", "fail"])},
+    {"task_name": "task 2", "action": in_(["success", "fail", "run"])},
+    {"action": "run"},
+    {"task_name": in_(["task 1", "task 2"]), "action": "run"},
+    {"task_name": "task 1", "created": between(2.0, 5.0)},
+    {"task_name": "task 2", "created": between(2.0, 3.5)},
+    {"task_name": "task 1", "created": greater_equal(3.0)},
+    {"task_name": "task 1", "created": greater_than(3.0)},
+    {"task_name": "task 1", "created": less_equal(3.0)},
+    {"task_name": "task 1", "created": less_than(3.0)},
+    {"task_name": "task 1", "action": "run", "created": between(0.0, 10.0)},
+])
+def test_query(repos, query):
+    repo, expected = repos
+    def key(record):
+        return (record.task_name, record.created)
+    assert sorted(repo.filter_by(**query).all(), key=key) == sorted(expected.filter_by(**query).all(), key=key)
+    assert repo.filter_by(**query).last() == get_last(repo, expected, query)
+    assert repo.filter_by(**query).count() == expected.filter_by(**query).count()
+
+def test_time_order(repos):
+    repo, _ = repos
+    if isinstance(repo, SQLiteRepo):
+        pytest.skip("SQLite repo returns the records in insertion order")
+    created = [rec.created for rec in repo.filter_by(task_name="task 2").all()]
+    assert created == [2.0, 3.5, 4.0]
+    # Not filtered by task name: in the order of insertion
+    created = [rec.created for rec in repo.filter_by().all()]
+    assert created == [record["created"] for record in RECORDS]
+
+@pytest.mark.parametrize("modify", ["delete", "update", "set collection"])
+def test_modify(repos, modify):
+    repo, expected = repos
+    if modify == "set collection" and isinstance(repo, SQLiteRepo):
+        pytest.skip("SQLite repo has no collection")
+    for rep in (repo, expected):
+        if modify == "delete":
+            rep.filter_by(task_name="task 1", action="fail").delete()
+        elif modify == "update":
+            rep.filter_by(task_name="task 1", action="fail").update(action="inaction")
+        elif modify == "set collection":
+            rep.collection = rep.collection[:-1]
+    for query in ({"task_name": "task 1"}, {"task_name": "task 1", "action": "fail"}, {"task_name": "task 1", "action": "inaction"}):
+        assert repo.filter_by(**query).all() == expected.filter_by(**query).all()
+        assert repo.filter_by(**query).last() == get_last(repo, expected, query)
+
+def test_retention_max_records():
+    repo = IndexedMemoryRepo(model=MinimalRecord, max_records=10, min_compact_size=50)
+    for i in range(100):
+        repo.add(MinimalRecord(task_name="task 1", action="run", created=float(i)))
+        repo.add(MinimalRecord(task_name="task 2", action="run", created=float(i)))
+    repo.add(MinimalRecord(task_name="task 1", action="success", created=100.0))
+
+    # Compacted when grown to double
+    assert len(repo.collection) < 100
+    repo.compact()
+    assert repo.filter_by(task_name="task 2").count() == 10
+    assert [rec.created for rec in repo.filter_by(task_name="task 2").all()] == [float(i) for i in range(90, 100)]
+    assert repo.filter_by(task_name="task 1").count() == 10
+    assert repo.filter_by(task_name="task 1", action="run").last().created == 99.0
+    assert repo.filter_by(task_name="task 1", action="success").last().created == 100.0
+
+def test_retention_max_age():
+    now = time.time()
+    repo = IndexedMemoryRepo(model=MinimalRecord, max_age=60)
+    repo.add(MinimalRecord(task_name="task 1", action="success", created=now - 200))
+    repo.add(MinimalRecord(task_name="task 1", action="run", created=now - 100))
+    repo.add(MinimalRecord(task_name="task 1", action="run", created=now - 30))
+    repo.add(MinimalRecord(task_name="task 1", action="run", created=now - 10))
+    repo.compact()
+
+    assert [rec.created for rec in repo.filter_by(task_name="task 1").all()] == [now - 200, now - 30, now - 10]
+    # The latest of each action is kept
+    assert repo.filter_by(task_name="task 1", action="success").last().created == now - 200
+
+def test_sqlite_persist(tmpdir):
+    import datetime
+    filename = str(tmpdir / "logs.db")
+    repo = SQLiteRepo(filename=filename, model=TaskLogRecord, batch_size=10)
+    record = TaskLogRecord(
+        task_name="task 1", action="success", created=1.0, message="finished", exc_text=None,
+        start=datetime.datetime(2022, 1, 1, 10), end=datetime.datetime(2022, 1, 1, 10, 5), runtime=datetime.timedelta(minutes=5)
+    )
+    repo.add(record)
+    assert repo._pending
+
+    # Pending records are written before reading
+    assert SQLiteRepo(filename=filename, model=TaskLogRecord).filter_by().all() == []
+    assert repo.filter_by(task_name="task 1").all() == [record]
+    assert not repo._pending
+    assert SQLiteRepo(filename=filename, model=TaskLogRecord).filter_by(task_name="task 1").last() == record
+
+    repo.add(record)
+    del repo
+    assert SQLiteRepo(filename=filename, model=TaskLogRecord).filter_by(task_name="task 1").count() == 2
+
+def test_sqlite_write_through(tmpdir):
+    filename = str(tmpdir / "logs.db")
+    repo = SQLiteRepo(filename=filename, model=MinimalRecord)
+    repo.add(MinimalRecord(task_name="task 1", action="success", created=1.0))
+    # Committed on insert by default
+    assert not repo._pending
+
+    repo = SQLiteRepo(filename=filename, model=MinimalRecord, batch_size=10)
+    repo.add(MinimalRecord(task_name="task 1", action="success", created=2.0))
+    assert repo._pending
+    # Runs are needed for detecting crashes thus written immediately
+    repo.add(MinimalRecord(task_name="task 1", action="run", created=3.0))
+    assert not repo._pending
+    other = SQLiteRepo(filename=filename, model=MinimalRecord)
+    assert other.filter_by(task_name="task 1").count() == 3
+    assert other.filter_by(task_name="task 1").last().action == "run"
+
+def test_sqlite_session(tmpdir, session):
+    import logging
+    from redbird.logging import RepoHandler
+    from rocketry.conditions import TaskStarted
+    from rocketry.tasks import FuncTask
+
+    task_logger = logging.getLogger(session.config.task_logger_basename)
+    task_logger.handlers = [RepoHandler(repo=SQLiteRepo(filename=str(tmpdir / "logs.db")))]
+
+    task = FuncTask(lambda: None, name="task 1", start_cond="true", execution="main", session=session)
+    session.config.shut_cond = TaskStarted(task="task 1") >= 3
+    session.start()
+
+    assert task.logger.filter_by(action="success").count() == 3
+    assert task.status == "success"
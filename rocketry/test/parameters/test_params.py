@@ -3,6 +3,7 @@ import pytest
 
 from rocketry.core import Parameters
 from rocketry.args import Private
+from rocketry.core.parameters import BaseArgument
 
 @pytest.mark.parametrize(
     "a,b,union",
@@ -67,4 +68,20 @@ def test_update(a, b, union):
     b = b()
     union = union()
     a.update(b)
-    assert union.materialize() == a.materialize()
\ No newline at end of file
+    assert union.materialize() == a.materialize()
+
+
+class StagedArg(BaseArgument):
+    "Argument that is staged to a new value"
+    def get_value(self, **kwargs):
+        return "original"
+
+    def stage(self, **kwargs):
+        return "staged"
+
+def test_pre_materialize():
+    params = Parameters({"a": StagedArg(), "b": 1})
+    staged = params.pre_materialize()
+    assert staged.materialize() == {"a": "staged", "b": 1}
+    # The original parameters are not modified
+    assert params.materialize() == {"a": "original", "b": 1}
@@ -1,10 +1,19 @@
 
+import asyncio
+import logging
 import multiprocessing
+import threading
+import time
+from queue import Empty
+
+import pytest
 
 from rocketry.core import Scheduler
+from rocketry.core.log import LogQueueListener
 from rocketry.tasks import FuncTask
 from rocketry.time import TimeDelta
 from rocketry.conditions import SchedulerStarted, TaskStarted, AlwaysTrue
+from rocketry.conditions.scheduler import SchedulerCycles
 
 def run_succeeding():
     pass
@@ -27,3 +36,148 @@ def test_creating_child(session):
     assert 1 == logger.filter_by(action="run").count()
     assert 1 == logger.filter_by(action="success").count()
     assert 0 == logger.filter_by(action="fail").count()
+
+def test_run_handshake_nonblocking(session):
+    task = FuncTask(run_succeeding, name="task_1", execution="process", session=session)
+    other = FuncTask(run_succeeding, name="task_2", execution="process", session=session)
+    log_queue = multiprocessing.Queue(-1)
+
+    def create_record(task_name):
+        record = logging.LogRecord(
+            name=session.config.task_logger_basename, level=logging.INFO, lineno=1,
+            pathname=__file__, msg="Logging of 'task'", args=(), exc_info=None,
+        )
+        record.action = "run"
+        record.task_name = task_name
+        return record
+
+    def put_records():
+        time.sleep(0.2)
+        log_queue.put(create_record("task_2"))
+        log_queue.put(create_record("task_1"))
+
+    n_ticks = 0
+    async def tick():
+        nonlocal n_ticks
+        while True:
+            n_ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def main():
+        ticker = asyncio.create_task(tick())
+        threading.Thread(target=put_records).start()
+        await task._lock_to_run_log_async(log_queue)
+        ticker.cancel()
+
+    asyncio.run(main())
+
+    # The event loop was not blocked while waiting
+    assert n_ticks > 5
+    assert task.status == "run"
+    assert other.status == "run"
+
+def test_log_listener():
+    log_queue = multiprocessing.Queue(-1)
+    listener = LogQueueListener(log_queue, batch_size=2)
+    listener.start()
+    for i in range(5):
+        log_queue.put(i)
+    assert [listener.get(timeout=1) for _ in range(5)] == [0, 1, 2, 3, 4]
+
+    log_queue.put(5)
+    listener.stop()
+    assert listener.get_nowait() == 5
+    assert listener.empty()
+    assert log_queue.empty()
+
+class FailingQueue:
+    "Queue that raises given errors before returning the records"
+    def __init__(self, errors, records):
+        self.errors = list(errors)
+        self.records = list(records)
+
+    def get(self, block=True, timeout=None):
+        if self.errors:
+            raise self.errors.pop(0)
+        while block and not self.records:
+            time.sleep(0.001)
+        if self.records:
+            return self.records.pop(0)
+        raise Empty
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def put(self, record):
+        self.records.append(record)
+
+def test_log_listener_broken_queue():
+    listener = LogQueueListener(FailingQueue([OSError("handle is closed")] * 1000, []))
+    listener.start()
+    with pytest.raises(OSError):
+        listener.get(timeout=1)
+    listener._thread.join(timeout=1)
+    # Stopped instead of trying again
+    assert not listener._thread.is_alive()
+    assert listener.empty()
+
+def test_log_listener_error():
+    listener = LogQueueListener(FailingQueue([RuntimeError("bad record")] * 3, [1, 2]))
+    listener.start()
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            listener.get(timeout=1)
+    assert [listener.get(timeout=1) for _ in range(2)] == [1, 2]
+    listener.stop()
+
+def test_listener_lifecycle(session):
+    task = FuncTask(run_succeeding, name="task_1", start_cond=AlwaysTrue(), execution="process", session=session)
+    session.config.shut_cond = (TaskStarted(task="task_1") >= 2) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+
+    session.start()
+
+    scheduler = session.scheduler
+    assert scheduler._log_listener is None
+    assert scheduler._record_queue is scheduler._log_queue
+    assert task.logger.filter_by(action="success").count() >= 2
+    assert task.status == "success"
+
+def test_launches_gathered(session, monkeypatch):
+    waiting = []
+    max_waiting = []
+
+    async def wait_run_log(self, log_queue):
+        waiting.append(self)
+        max_waiting.append(len(waiting))
+        await asyncio.sleep(0.2)
+        waiting.remove(self)
+
+    monkeypatch.setattr(FuncTask, "_lock_to_run_log_async", wait_run_log)
+    for i in range(3):
+        FuncTask(run_succeeding, name=f"task_{i}", start_cond=AlwaysTrue(), execution="process", session=session)
+    session.config.max_process_count = 5
+    session.config.shut_cond = (TaskStarted(task="task_0") >= 1) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+
+    session.start()
+
+    # The run records of a cycle are waited at the same time
+    assert max(max_waiting) == 3
+    for i in range(3):
+        assert session[f"task_{i}"].logger.filter_by(action="run").count() >= 1
+
+def run_slow():
+    time.sleep(2)
+
+def test_launches_max_process_count(session):
+    for i in range(6):
+        FuncTask(run_slow, name=f"task_{i}", start_cond=AlwaysTrue(), execution="process", session=session)
+    session.config.max_process_count = 1
+    session.config.instant_shutdown = True
+    session.config.shut_cond = SchedulerCycles() >= 2
+
+    session.start()
+
+    # The processes waiting for their run records count
+    # as running thus not all of the tasks are started
+    n_runs = sum(session[f"task_{i}"].logger.filter_by(action="run").count() for i in range(6))
+    assert n_runs == 2
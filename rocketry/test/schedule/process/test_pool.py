@@ -0,0 +1,125 @@
+import logging
+from logging.handlers import BufferingHandler
+import multiprocessing
+import os
+import pickle
+import time
+
+from rocketry.args import Return
+from rocketry.core.utils.pool import _run_worker
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeDelta
+from rocketry.conditions import SchedulerStarted, TaskStarted, TaskFinished, AlwaysTrue, DependSuccess
+
+def run_writing_pid():
+    with open("pids.txt", "a") as file:
+        file.write(f"{os.getpid()}\n")
+
+def run_slow():
+    time.sleep(0.5)
+    with open("work.txt", "a") as file:
+        file.write("line created\n")
+
+def run_with_output():
+    return 'some value'
+
+def run_with_return(arg=Return('task_with_output')):
+    assert arg == 'some value'
+
+def test_reuse_workers(tmpdir, session):
+    with tmpdir.as_cwd():
+        task = FuncTask(run_writing_pid, name="task_1", start_cond=AlwaysTrue(), execution="process", session=session)
+
+        session.config.process_pool_size = 1
+        session.config.shut_cond = (TaskStarted(task="task_1") >= 3) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+        session.start()
+
+        assert task.logger.filter_by(action="success").count() >= 3
+        with open("pids.txt") as file:
+            pids = set(file.read().split())
+        assert len(pids) == 1
+        assert str(os.getpid()) not in pids
+        assert session.scheduler._process_pool is None
+
+def test_return(session):
+    FuncTask(run_with_output, name="task_with_output", start_cond=AlwaysTrue(), execution="process", session=session)
+    task = FuncTask(run_with_return, name="task_with_input", start_cond=DependSuccess(depend_task="task_with_output"), execution="process", session=session)
+
+    session.config.process_pool_size = 2
+    session.config.shut_cond = (TaskFinished(task="task_with_input") >= 1) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+    session.start()
+
+    assert task.logger.filter_by(action="success").count() >= 1
+    assert task.logger.filter_by(action="fail").count() == 0
+
+def test_terminate(tmpdir, session):
+    with tmpdir.as_cwd():
+        task = FuncTask(run_slow, name="slow task", start_cond=AlwaysTrue(), execution="process", session=session)
+
+        session.config.process_pool_size = 1
+        session.config.timeout = 0.1
+        session.config.shut_cond = (TaskStarted(task="slow task") >= 2) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+        session.start()
+
+        # The terminated worker is replaced
+        assert task.logger.filter_by(action="run").count() >= 2
+        assert task.logger.filter_by(action="terminate").count() >= 1
+        assert task.logger.filter_by(action="success").count() == 0
+        assert not os.path.exists("work.txt")
+
+def test_all_busy(tmpdir, session):
+    with tmpdir.as_cwd():
+        FuncTask(run_slow, name="task_1", start_cond=AlwaysTrue(), execution="process", session=session)
+        FuncTask(run_slow, name="task_2", start_cond=AlwaysTrue(), execution="process", session=session)
+
+        session.config.process_pool_size = 1
+        session.config.shut_cond = (TaskStarted(task="task_1") >= 1) & (TaskStarted(task="task_2") >= 1)
+        session.start()
+
+        # One run in the pool and the other in a new process
+        for name in ("task_1", "task_2"):
+            assert session[name].logger.filter_by(action="success").count() == 1
+
+def test_pickle_once(session, monkeypatch):
+    import rocketry.core.task
+    def fail(obj):
+        raise AssertionError("Checked picklability of a picklable task")
+    monkeypatch.setattr(rocketry.core.task, "is_pickleable", fail)
+
+    task = FuncTask(run_with_output, name="task_1", start_cond=AlwaysTrue(), execution="process", session=session)
+    session.config.process_pool_size = 1
+    session.config.shut_cond = (TaskFinished(task="task_1") >= 1) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+    session.start()
+    assert task.logger.filter_by(action="success").count() >= 1
+
+def test_unpicklable(session):
+    def run_nested():
+        ...
+    task = FuncTask(run_nested, name="task_1", start_cond=AlwaysTrue(), execution="process", session=session)
+    session.config.process_pool_size = 1
+    session.config.silence_task_prerun = True
+    session.config.shut_cond = (TaskStarted(task="task_1") >= 1) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+    session.start()
+    assert task.logger.filter_by(action="fail").count() >= 1
+    assert task.logger.filter_by(action="success").count() == 0
+
+def test_worker_setup_error():
+    handler = BufferingHandler(capacity=100)
+    logger = logging.getLogger("rocketry.core.utils.pool")
+    logger.addHandler(handler)
+
+    recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+    job_id = multiprocessing.Value('q', 1)
+    send_conn.send_bytes(b"not a pickle")
+    send_conn.send_bytes(b"")
+    try:
+        _run_worker(recv_conn, None, job_id)
+    finally:
+        logger.removeHandler(handler)
+
+    # The error is logged and the worker is idle again
+    assert job_id.value == 0
+    record, = handler.buffer
+    assert record.levelno == logging.ERROR
+    assert record.getMessage() == "Pooled worker failed to run task None"
+    assert record.exc_info[0] is pickle.UnpicklingError
@@ -0,0 +1,126 @@
+import gc
+import os
+import pickle
+import subprocess
+import sys
+import time
+
+import pytest
+
+import rocketry
+from rocketry.args import Return
+from rocketry.tasks import FuncTask
+from rocketry.conditions import TaskFinished, DependSuccess, AlwaysTrue
+from rocketry.core.utils import shared
+from rocketry.core.utils.shared import IS_SUPPORTED, SharedReturn
+
+if IS_SUPPORTED:
+    from multiprocessing import resource_tracker
+
+pytestmark = pytest.mark.skipif(not IS_SUPPORTED, reason="Shared memory returns require Python 3.8+ and POSIX")
+
+class Blob:
+    "Object with an out-of-band buffer (like NumPy arrays)"
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return Blob, (pickle.PickleBuffer(self.data),)
+        return Blob, (bytearray(self.data),)
+
+def run_large():
+    return Blob(bytearray(b"x" * 1000))
+
+def run_small():
+    return Blob(bytearray(b"x" * 10))
+
+def run_with_return(arg=Return('large task')):
+    assert bytes(arg.data) == b"x" * 1000
+
+@pytest.mark.parametrize("func,size,is_shared", [(run_large, 1000, True), (run_small, 10, False)])
+def test_return(session, func, size, is_shared):
+    task = FuncTask(func, name="my task", start_cond=AlwaysTrue(), execution="process", session=session)
+
+    session.config.shared_memory_min_size = 100
+    session.config.shut_cond = TaskFinished(task="my task") >= 1
+    session.start()
+
+    assert task.logger.filter_by(action="success").count() >= 1
+    value = session.returns[task]
+    assert bytes(value.data) == b"x" * size
+    # Shared memory is used as is (not copied)
+    assert isinstance(value.data, memoryview) == is_shared
+
+def test_pass_to_task(session):
+    FuncTask(run_large, name="large task", start_cond=AlwaysTrue(), execution="process", session=session)
+    task = FuncTask(run_with_return, name="task with input", start_cond=DependSuccess(depend_task="large task"), execution="main", session=session)
+
+    session.config.shared_memory_min_size = 100
+    session.config.shut_cond = TaskFinished(task="task with input") >= 1
+    session.start()
+
+    assert task.logger.filter_by(action="success").count() == 1
+
+def test_load():
+    shared = SharedReturn.from_value(Blob(bytearray(b"x" * 1000)), min_size=100)
+    value = shared.load()
+    gc.collect()
+    # The block is unlinked but the memory is
+    # kept as long as the value is used
+    assert bytes(value.data) == b"x" * 1000
+    with pytest.raises(FileNotFoundError):
+        shared.load()
+
+def test_small_in_band():
+    shared = SharedReturn.from_value(Blob(bytearray(b"x" * 10)), min_size=100)
+    assert shared.buffers == [b"x" * 10]
+    assert bytes(shared.load().data) == b"x" * 10
+
+@pytest.mark.parametrize("is_tracker_shared", [True, False])
+def test_tracked_once(monkeypatch, is_tracker_shared):
+    # The tracker keeps the names in a set
+    registered = set()
+    monkeypatch.setattr(resource_tracker, "register", lambda name, rtype: registered.add(name))
+    monkeypatch.setattr(resource_tracker, "unregister", lambda name, rtype: registered.remove(name))
+    monkeypatch.setattr(shared, "_is_tracker_shared", lambda: is_tracker_shared)
+
+    value = SharedReturn.from_value(Blob(bytearray(b"x" * 1000)), min_size=100)
+    (name, _), = value.buffers
+    # The creator tracks the block only if the
+    # main process uses the same tracker
+    assert registered == ({"/" + name} if is_tracker_shared else set())
+
+    value = value.load()
+    assert registered == set()
+    assert bytes(value.data) == b"x" * 1000
+
+UNREAD_SCRIPT = """
+import multiprocessing, pickle
+from rocketry.core.utils.shared import SharedReturn, start_tracker
+
+def create(queue):
+    value = SharedReturn.from_value(pickle.PickleBuffer(bytearray(b"x" * 1000)), min_size=100)
+    queue.put(value.buffers[0][0])
+
+if __name__ == "__main__":
+    start_tracker()
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=create, args=(queue,))
+    process.start()
+    print(queue.get())
+    process.join()
+"""
+
+def test_unread_unlinked():
+    # The value is never loaded
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(rocketry.__file__)))
+    result = subprocess.run([sys.executable, "-c", UNREAD_SCRIPT], env=env, capture_output=True, text=True, timeout=30)
+    assert result.returncode == 0, result.stderr
+    path = os.path.join("/dev/shm", result.stdout.strip())
+
+    # The tracker unlinks the block after the main process exited
+    start = time.time()
+    while os.path.exists(path) and time.time() - start < 5:
+        time.sleep(0.01)
+    assert not os.path.exists(path)
@@ -220,6 +220,8 @@ def test_task_status(session, execution, func_type, mode):
         priority=0,
         session=session
     )
+    # All the tasks run in every cycle regardless of the CPU count
+    session.config.max_process_count = 10
     session.config.shut_cond = (TaskStarted(task="task inact") >= 3) | ~SchedulerStarted(period=TimeDelta("20 second"))
     session.start()
 
@@ -342,6 +344,8 @@ def test_priority(execution, session):
 
     assert 0 == task_4.priority
 
+    # All the tasks run in the cycle regardless of the CPU count
+    session.config.max_process_count = 10
     session.config.shut_cond = (SchedulerCycles() == 1) | ~SchedulerStarted(period=TimeDelta("2 seconds"))
 
     session.start()
@@ -354,6 +358,51 @@ def test_priority(execution, session):
     
     assert task_1_start < task_2_start < task_3_start < task_4_start
 
+def test_priority_order(session):
+    task_1 = FuncTask(run_succeeding, name="1", priority=100, execution="main", session=session)
+    task_2 = FuncTask(run_succeeding, name="2", priority=50, execution="main", session=session)
+    scheduler = session.scheduler
+
+    assert scheduler.tasks == [task_1, task_2]
+    assert scheduler.tasks is scheduler.tasks
+
+    task_2.priority = 200
+    assert scheduler.tasks == [task_2, task_1]
+
+    task_3 = FuncTask(run_succeeding, name="3", priority=150, execution="main", session=session)
+    assert scheduler.tasks == [task_2, task_3, task_1]
+
+    session.remove_task(task_2)
+    assert scheduler.tasks == [task_3, task_1]
+
+    task_1.delete()
+    assert scheduler.tasks == [task_3]
+
+def run_short():
+    time.sleep(0.1)
+
+async def run_short_async():
+    await asyncio.sleep(0.1)
+
+@pytest.mark.parametrize("execution", ["thread", "async"])
+def test_max_running(execution, session):
+    func = run_short_async if execution == "async" else run_short
+    task_1 = FuncTask(func, name="1", start_cond=AlwaysTrue(), execution=execution, session=session)
+    task_2 = FuncTask(func, name="2", start_cond=AlwaysTrue(), execution=execution, session=session)
+
+    setattr(session.config, f"max_{execution}_count", 1)
+    session.config.shut_cond = (TaskStarted(task="1") >= 2) | ~SchedulerStarted(period=TimeDelta("2 seconds"))
+    session.start()
+
+    # Runs did not overlap
+    records = sorted(
+        (rec.created, rec.action)
+        for task in (task_1, task_2)
+        for rec in task.logger.get_records()
+    )
+    actions = [action for _, action in records]
+    assert actions[:4] == ["run", "success", "run", "success"]
+
 @pytest.mark.parametrize("execution", ["main", "thread", "process"])
 def test_pass_params_as_global(execution, session):
     # thread-Parameters has been observed to fail rarely
@@ -481,6 +530,8 @@ def test_logging_repo(tmpdir, execution):
 
         assert 0 == task_4.priority
 
+        # All the tasks run in the cycle regardless of the CPU count
+        session.config.max_process_count = 10
         session.config.shut_cond = (SchedulerCycles() == 1) | ~SchedulerStarted(period=TimeDelta("2 seconds"))
         session.start()
         assert session.scheduler.n_cycles == 1 
@@ -510,4 +561,30 @@ def test_instant_shutdown(execution, session):
 
     assert 0 == task.logger.filter_by(action="fail").count()
     assert 0 == task.logger.filter_by(action="success").count()
-    assert 1 == task.logger.filter_by(action="terminate").count()
\ No newline at end of file
+    assert 1 == task.logger.filter_by(action="terminate").count()
+class EndingThread:
+    "Thread of a task that has finished but has not ended yet"
+    def __init__(self):
+        self.joins = []
+
+    def is_alive(self):
+        return True
+
+    def join(self, timeout=None):
+        self.joins.append(timeout)
+
+def test_join_finished_threads(session):
+    task = FuncTask(run_succeeding, name="task", start_cond=true, execution="thread", session=session)
+    thread = EndingThread()
+    task._thread = thread
+    scheduler = session.scheduler
+    scheduler._add_alive(task)
+
+    # Inspecting the task does not wait for the thread
+    for _ in range(3):
+        assert not scheduler.is_task_runnable(task)
+    assert thread.joins == []
+
+    # Finished threads are reaped once without waiting
+    scheduler._join_finished()
+    assert thread.joins == [0]
@@ -0,0 +1,101 @@
+import datetime
+import time
+
+import pytest
+
+from rocketry.core import BaseCondition
+from rocketry.core.time import TimePeriod
+from rocketry.conditions import SchedulerStarted, TaskStarted, FuncCond
+from rocketry.conds import every, after_success
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeDelta
+
+def run_succeeding():
+    pass
+
+class CountingFalse(BaseCondition):
+    "Condition that counts how many times it is checked"
+    n_observed = 0
+
+    def get_state(self):
+        type(self).n_observed += 1
+        return False
+
+    def next_possible(self, **kwargs):
+        return TimePeriod.max
+
+class CountingLater(CountingFalse):
+    "Condition that could turn true only after an hour"
+    n_observed = 0
+
+    def next_possible(self, **kwargs):
+        return datetime.datetime.fromtimestamp(time.time()) + datetime.timedelta(hours=1)
+
+def test_event_skip_unchanged(session):
+    CountingFalse.n_observed = 0
+    FuncTask(run_succeeding, name="never", start_cond=CountingFalse(), execution="main", session=session)
+
+    session.config.cycle_mode = "event"
+    session.config.shut_cond = ~SchedulerStarted(period=TimeDelta("0.5 second"))
+    session.start()
+
+    assert CountingFalse.n_observed == 1
+    assert session.scheduler.n_cycles <= 2
+
+@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+def test_event_pipeline(execution, session):
+    FuncTask(run_succeeding, name="first", start_cond=every("0.2 seconds"), execution=execution, session=session)
+    FuncTask(run_succeeding, name="second", start_cond=after_success("first"), execution=execution, session=session)
+
+    session.config.cycle_mode = "event"
+    session.config.shut_cond = (TaskStarted(task="second") >= 2) | ~SchedulerStarted(period=TimeDelta("5 second"))
+    session.start()
+
+    logger = session["second"].logger
+    assert logger.filter_by(action="success").count() >= 2
+    # Polling would have had hundreds of cycles
+    assert session.scheduler.n_cycles < 100
+
+def test_event_inspect_changed(session):
+    CountingLater.n_observed = 0
+    FuncTask(run_succeeding, name="later", start_cond=CountingLater(), execution="main", session=session)
+    FuncTask(run_succeeding, name="runner", start_cond=every("0.1 seconds"), execution="main", session=session)
+
+    session.config.cycle_mode = "event"
+    session.config.shut_cond = (TaskStarted(task="runner") >= 3) | ~SchedulerStarted(period=TimeDelta("5 second"))
+    session.start()
+
+    assert session["runner"].logger.filter_by(action="run").count() >= 3
+    # Changes in the other task do not cause inspecting it
+    assert CountingLater.n_observed == 1
+
+def test_event_no_cycle_sleep(session):
+    FuncTask(run_succeeding, name="runner", start_cond=every("0.2 seconds"), execution="main", session=session)
+
+    session.config.cycle_mode = "event"
+    session.config.cycle_sleep = None
+    session.config.shut_cond = TaskStarted(task="runner") >= 3
+    session.start()
+
+    assert session["runner"].logger.filter_by(action="run").count() == 3
+    # Sleeps till the task can run instead of spinning
+    assert session.scheduler.n_cycles < 20
+
+def test_event_unknown_next_possible(session):
+    n_observed = 0
+    def is_false():
+        nonlocal n_observed
+        n_observed += 1
+        return False
+
+    FuncTask(run_succeeding, name="never", start_cond=FuncCond(is_false), execution="main", session=session)
+
+    session.config.cycle_mode = "event"
+    session.config.cycle_sleep = 0.1
+    session.config.shut_cond = ~SchedulerStarted(period=TimeDelta("1 second"))
+    session.start()
+
+    # Not known when the condition could turn true thus
+    # it is checked every cycle_sleep instead of spinning
+    assert 2 <= n_observed < 30
+    assert session.scheduler.n_cycles < 30
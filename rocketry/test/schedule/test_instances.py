@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import threading
+import time
+
+import pytest
+from redbird.logging import RepoHandler
+from redbird.repos import MemoryRepo
+
+from rocketry.args import TerminationFlag
+from rocketry.conditions import AlwaysTrue, SchedulerCycles, SchedulerStarted, TaskRunning, TaskStarted
+from rocketry.exc import TaskTerminationException
+from rocketry.log import TaskLogRecord
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeDelta
+
+running = []
+max_running = []
+lock = threading.Lock()
+
+def _enter():
+    with lock:
+        running.append(None)
+        max_running.append(len(running))
+
+def _exit():
+    with lock:
+        running.pop()
+
+def run_slow_thread():
+    _enter()
+    time.sleep(0.2)
+    _exit()
+
+async def run_slow_async():
+    _enter()
+    await asyncio.sleep(0.2)
+    _exit()
+
+def run_slow_process():
+    time.sleep(0.5)
+
+def run_forever_process():
+    time.sleep(10)
+
+async def run_forever():
+    await asyncio.sleep(10)
+
+def run_forever_thread(flag=TerminationFlag()):
+    while not flag.is_set():
+        time.sleep(0.001)
+    raise TaskTerminationException()
+
+@pytest.mark.parametrize("execution,func", [("async", run_slow_async), ("thread", run_slow_thread)])
+def test_max_instances(session, execution, func):
+    running.clear()
+    max_running.clear()
+    task = FuncTask(func, name="my task", start_cond=AlwaysTrue(), execution=execution, max_instances=3, session=session)
+
+    session.config.shut_cond = SchedulerCycles() >= 5
+    session.start()
+
+    assert task.logger.filter_by(action="run").count() == 3
+    assert task.logger.filter_by(action="success").count() == 3
+    assert max(max_running) == 3
+    assert task.count_instances() == 0
+
+def test_max_instances_process(session):
+    task = FuncTask(run_slow_process, name="my task", start_cond=AlwaysTrue(), execution="process", max_instances=2, session=session)
+
+    session.config.max_process_count = 5
+    session.config.shut_cond = (TaskStarted(task="my task") >= 2) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+    session.start()
+
+    assert task.logger.filter_by(action="run").count() == 2
+    assert task.logger.filter_by(action="success").count() == 2
+
+def test_running(session):
+    task = FuncTask(run_slow_async, name="my task", start_cond=AlwaysTrue(), execution="async", max_instances=2, session=session)
+    session.config.shut_cond = SchedulerCycles() >= 3
+    session.start()
+    assert not TaskRunning(task="my task").observe(session=session)
+
+    async def run():
+        await task.start_async()
+        await asyncio.sleep(0.01)
+        await task.start_async()
+        assert task.count_instances() == 2
+        assert TaskRunning(task="my task").observe(session=session)
+        await asyncio.sleep(0.3)
+        assert task.count_instances() == 0
+        assert not TaskRunning(task="my task").observe(session=session)
+    asyncio.run(run())
+
+async def _wait_instances(task, n):
+    for _ in range(1000):
+        if task.count_instances() == n:
+            break
+        await asyncio.sleep(0.001)
+    assert task.count_instances() == n
+
+@pytest.mark.parametrize("execution,func", [("async", run_forever), ("thread", run_forever_thread)])
+def test_timeout(session, execution, func):
+    task = FuncTask(func, name="my task", execution=execution, max_instances=2, timeout="0.2 seconds", session=session)
+    scheduler = session.scheduler
+
+    async def run():
+        await task.start_async()
+        await asyncio.sleep(0.3)
+        await task.start_async()
+        await asyncio.sleep(0.01) # Let the async task log its run
+        assert task.count_instances() == 2
+
+        # Only the first has run too long
+        assert not scheduler.is_timeouted(task)
+        await scheduler._terminate_timeouted_instances(task)
+        await _wait_instances(task, 1)
+        assert task.logger.filter_by(action="terminate").count() == 1
+
+        # Terminating the task terminates all instances
+        await task.start_async()
+        await _wait_instances(task, 2)
+        await scheduler.terminate_task(task)
+        await _wait_instances(task, 0)
+        assert task.logger.filter_by(action="terminate").count() == 3
+    asyncio.run(run())
+
+@pytest.mark.parametrize("execution,func", [("async", run_slow_async), ("thread", run_slow_thread)])
+def test_runtime(session, execution, func):
+    repo = MemoryRepo(model=TaskLogRecord)
+    logging.getLogger("rocketry.task").handlers = [RepoHandler(repo=repo)]
+    task = FuncTask(func, name="my task", execution=execution, max_instances=2, session=session)
+
+    async def run():
+        await task.start_async()
+        await asyncio.sleep(0.1)
+        await task.start_async()
+        await asyncio.sleep(0.01)
+        await _wait_instances(task, 0)
+    asyncio.run(run())
+
+    starts = [record.start for record in repo.filter_by(action="run").all()]
+    successes = repo.filter_by(action="success").all()
+    assert len(successes) == 2
+    # Each run logs its own start and runtime
+    assert sorted(record.start for record in successes) == sorted(starts)
+    assert all(record.runtime.total_seconds() >= 0.15 for record in successes)
+
+def test_runtime_terminated_process(session):
+    repo = MemoryRepo(model=TaskLogRecord)
+    logging.getLogger("rocketry.task").handlers = [RepoHandler(repo=repo)]
+    task = FuncTask(run_forever_process, name="my task", execution="process", max_instances=2, timeout="0.5 seconds", session=session)
+    scheduler = session.scheduler
+
+    async def run():
+        await task.start_async()
+        await asyncio.sleep(0.6)
+        await task.start_async()
+        await scheduler._terminate_timeouted_instances(task)
+        await _wait_instances(task, 1)
+        await scheduler.terminate_task(task)
+        await _wait_instances(task, 0)
+    asyncio.run(run())
+
+    starts = [record.start for record in repo.filter_by(action="run").all()]
+    terminations = repo.filter_by(action="terminate").all()
+    # The start in the scheduler is when the run was logged
+    assert len(terminations) == 2
+    for record, start in zip(terminations, starts):
+        assert abs((record.start - start).total_seconds()) < 0.1
@@ -58,4 +58,20 @@ def test_run_task(execution, task_func, run_count, fail_count, success_count, se
     scheduler.handle_logs()
 
     assert success_count == logger.filter_by(action="success").count()
-    assert fail_count == logger.filter_by(action="fail").count()
\ No newline at end of file
+    assert fail_count == logger.filter_by(action="fail").count()
+
+@pytest.mark.parametrize("execution", ["thread", "process"])
+def test_count_alive(execution, session):
+    task = FuncTask(func=run_succeeding, name="task", start_cond=AlwaysFalse(), execution=execution, session=session)
+    scheduler = session.scheduler
+    assert scheduler.n_alive == 0
+
+    asyncio.run(scheduler.run_task(task))
+    assert scheduler.count_alive(execution) == 1
+    assert scheduler.count_alive("async") == 0
+
+    while scheduler.n_alive > 0:
+        time.sleep(0.001)
+    scheduler.handle_logs()
+    assert not task.is_alive()
+    assert scheduler.count_alive(execution) == 0
@@ -0,0 +1,68 @@
+import threading
+import time
+
+from rocketry.conditions import AlwaysTrue, SchedulerCycles, TaskStarted
+from rocketry.core.utils import ThreadPool
+from rocketry.tasks import FuncTask
+
+threads = set()
+
+def run_slow():
+    threads.add(threading.get_ident())
+    time.sleep(0.1)
+
+def test_pool_queue():
+    pool = ThreadPool(2)
+    release = threading.Event()
+    done = []
+
+    jobs = [pool.submit(lambda i: (release.wait(), done.append(i)), i) for i in range(5)]
+    assert [job.is_queued for job in jobs] == [False, False, True, True, True]
+    assert all(job.is_alive() for job in jobs)
+
+    metrics = pool.get_metrics()
+    assert metrics["workers"] == 2
+    assert metrics["submitted"] == 5
+    assert metrics["saturated"] == 3
+    assert metrics["max_queued"] == 3
+
+    release.set()
+    for job in jobs:
+        job.join(timeout=5)
+    assert sorted(done) == [0, 1, 2, 3, 4]
+    assert not any(job.is_alive() for job in jobs)
+    assert pool.get_metrics()["running"] == 0
+    assert pool.get_metrics()["queued"] == 0
+
+    pool.close()
+    assert pool.get_metrics()["workers"] == 0
+
+def test_reuse_threads(session):
+    threads.clear()
+    for i in range(5):
+        FuncTask(run_slow, name=f"task {i}", start_cond=AlwaysTrue(), execution="thread", session=session)
+
+    session.config.thread_pool_size = 2
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+
+    for i in range(5):
+        task = session[f"task {i}"]
+        assert task.logger.filter_by(action="run").count() == 1
+        assert task.logger.filter_by(action="success").count() == 1
+    # Two threads were used to run all of the tasks
+    assert len(threads) == 2
+    assert session.scheduler._thread_pool is None
+
+def test_terminate_queued(session):
+    FuncTask(run_slow, name="slow", start_cond=AlwaysTrue(), execution="thread", session=session)
+    task = FuncTask(run_slow, name="queued", start_cond=TaskStarted(task="slow"), execution="thread", session=session)
+
+    session.config.thread_pool_size = 1
+    session.config.instant_shutdown = True
+    session.config.shut_cond = SchedulerCycles() >= 3
+    session.start()
+
+    # Waited for the slow task and terminated on shutdown
+    assert task.logger.filter_by(action="run").count() == 0
+    assert task.logger.filter_by(action="terminate").count() == 1
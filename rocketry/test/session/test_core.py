@@ -115,6 +115,18 @@ def test_remove(session):
     assert session.tasks == {task_1, task_2}
     session.remove_task("task 2")
     assert session.tasks == {task_1}
+    assert "task 2" not in session
+    assert "task 3" not in session
+    assert session["task 1"] is task_1
+
+    # Name is free again
+    task_2 = FuncTask(
+        lambda : None, 
+        name="task 2",
+        execution="main",
+        session=session
+    )
+    assert session["task 2"] is task_2
 
 # Old interface
 # -------------
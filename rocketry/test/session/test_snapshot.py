@@ -0,0 +1,87 @@
+import datetime
+import json
+import logging
+
+from rocketry.conditions import SchedulerCycles
+from rocketry.tasks import FuncTask
+
+def do_success():
+    ...
+
+def test_save(session, tmpdir):
+    file = tmpdir.join("snapshot.json")
+    session.config.status_snapshot = str(file)
+    session.config.shut_cond = SchedulerCycles() >= 1
+
+    task = FuncTask(do_success, name="my task", start_cond="true", execution="main", session=session)
+    session.start()
+
+    snapshot = json.loads(file.read())
+    assert set(snapshot["tasks"]) == {"my task"}
+    assert snapshot["tasks"]["my task"] == {
+        "run": task.last_run.timestamp(),
+        "success": task.last_success.timestamp(),
+    }
+    assert snapshot["created"] >= task.last_success.timestamp()
+
+def test_load(session, tmpdir):
+    now = datetime.datetime.now().timestamp()
+    file = tmpdir.join("snapshot.json")
+    file.write(json.dumps({
+        "created": now,
+        "tasks": {"my task": {"run": now - 100, "success": now - 90}}
+    }))
+    session.config.status_snapshot = str(file)
+
+    logger = logging.getLogger("rocketry.task")
+    repo = logger.handlers[0].repo
+    # Logged before the snapshot (already in it) and after it
+    repo.add({"task_name": "my task", "action": "run", "created": now - 50})
+    repo.add({"task_name": "my task", "action": "fail", "created": now - 40})
+    repo.add({"task_name": "my task", "action": "run", "created": now + 10})
+    repo.add({"task_name": "my task", "action": "success", "created": now + 20})
+
+    task = FuncTask(do_success, name="my task", execution="main", session=session)
+    assert task.last_run == datetime.datetime.fromtimestamp(now + 10)
+    assert task.last_success == datetime.datetime.fromtimestamp(now + 20)
+    assert task.last_fail is None
+    assert task.status == "success"
+
+def test_missing(session, tmpdir):
+    now = datetime.datetime.now().timestamp()
+    session.config.status_snapshot = str(tmpdir.join("snapshot.json"))
+
+    logger = logging.getLogger("rocketry.task")
+    repo = logger.handlers[0].repo
+    repo.add({"task_name": "my task", "action": "run", "created": now - 50})
+    repo.add({"task_name": "my task", "action": "fail", "created": now - 40})
+
+    # Read from the logs
+    task = FuncTask(do_success, name="my task", execution="main", session=session)
+    assert task.last_run == datetime.datetime.fromtimestamp(now - 50)
+    assert task.last_fail == datetime.datetime.fromtimestamp(now - 40)
+    assert task.status == "fail"
+
+def test_dropped_on_start(session, tmpdir):
+    now = datetime.datetime.now().timestamp()
+    file = tmpdir.join("snapshot.json")
+    file.write(json.dumps({
+        "created": now,
+        "tasks": {"my task": {"run": now - 100, "success": now - 90}}
+    }))
+    session.config.status_snapshot = str(file)
+    session.config.shut_cond = SchedulerCycles() >= 1
+
+    FuncTask(do_success, name="my task", execution="main", session=session)
+    assert session._status_snapshot is not None
+
+    created = []
+    def create_task():
+        # Created while running thus the snapshot is not used
+        assert session._get_status_snapshot() is None
+        created.append(FuncTask(do_success, name="new task", execution="main", session=session))
+    FuncTask(create_task, name="creator", start_cond="true", execution="main", session=session)
+    session.start()
+
+    assert session._status_snapshot is None
+    assert created[0].last_run is None
@@ -84,4 +84,20 @@ def test_run_fail(session, execution):
 
     records = list(map(lambda e: e.dict(exclude={'created'}), session.get_task_log()))
     record_fail = [r for r in records if r['action'] == 'fail'][0]
-    assert 'File "<string>", line 5, in <module>\n  File "<string>", line 3, in main\nRuntimeError: Failed' in record_fail['exc_text']
\ No newline at end of file
+    assert 'File "<string>", line 5, in <module>\n  File "<string>", line 3, in main\nRuntimeError: Failed' in record_fail['exc_text']
+def test_construct_syntax_error(session):
+    with pytest.raises(SyntaxError):
+        CodeTask(code="return_value = (", name="mytask", session=session)
+    assert "mytask" not in session
+
+def test_compile_once(session):
+    from rocketry.tasks.code import _compile_code
+    code = dedent("""
+        return_value = myparam * 2
+        """)
+    task = CodeTask(code=code, name="mytask", execution="main", parameters={'myparam': 2}, session=session)
+    misses = _compile_code.cache_info().misses
+    task()
+    task()
+    assert _compile_code.cache_info().misses == misses
+    assert session.returns[task] == 4
@@ -1,8 +1,10 @@
 
+import asyncio
 import logging
 from pathlib import Path
 import platform
 import sys
+import time
 
 import pytest
 
@@ -14,6 +16,10 @@ from rocketry.tasks import CommandTask
 
 from task_helpers import wait_till_task_finish
 
+async def _run_async(task):
+    await task.start_async()
+    await task._async_task
+
 @pytest.mark.parametrize("execution", ["main", "thread", "process"])
 @pytest.mark.parametrize("cmd,params,systems,shell", [
     pytest.param(["python", "-c", "open('test.txt', 'w');"], None, ["win32"], False, id="list (win32)"),
@@ -49,7 +55,7 @@ def test_success_command(tmpdir, session, cmd, params, systems,shell, execution)
         assert Path("test.txt").is_file()
         assert "success" == task.status
 
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 def test_fail_command(tmpdir, execution, session):
     with tmpdir.as_cwd() as old_dir:
 
@@ -67,7 +73,10 @@ def test_fail_command(tmpdir, execution, session):
         )
         assert task.status is None
 
-        task()
+        if execution == "async":
+            asyncio.run(_run_async(task))
+        else:
+            task()
 
         wait_till_task_finish(task)
 
@@ -132,4 +141,124 @@ def test_success_bash_file(tmpdir, session):
         wait_till_task_finish(task)
 
         assert Path("test.txt").is_file()
-        assert "success" == task.status
\ No newline at end of file
+        assert "success" == task.status
+def test_async_command(session):
+    task = CommandTask(
+        command=[sys.executable, "-c", "print('hello')"], 
+        name="a task",
+        execution="async",
+        session=session
+    )
+    asyncio.run(_run_async(task))
+    assert "success" == task.status
+    assert session.returns[task].strip() == b"hello"
+
+def test_async_command_concurrent(session):
+    tasks = [
+        CommandTask(
+            command=[sys.executable, "-c", "import time; time.sleep(0.5)"], 
+            name=f"task {i}",
+            execution="async",
+            session=session
+        )
+        for i in range(3)
+    ]
+    async def run():
+        for task in tasks:
+            await task.start_async()
+        await asyncio.gather(*(task._async_task for task in tasks))
+
+    start = time.time()
+    asyncio.run(run())
+    # Commands were run at the same time
+    assert time.time() - start < 1.4
+    assert all(task.status == "success" for task in tasks)
+
+def test_async_command_terminate(session):
+    task = CommandTask(
+        command=[sys.executable, "-c", "import time; time.sleep(10)"], 
+        name="a task",
+        execution="async",
+        session=session
+    )
+    async def run():
+        await task.start_async()
+        await asyncio.sleep(0.2)
+        await session.scheduler.terminate_task(task)
+
+    start = time.time()
+    asyncio.run(run())
+    assert time.time() - start < 5
+    assert "terminate" == task.status
+
+def test_async_command_timeout(session):
+    task = CommandTask(
+        command=[sys.executable, "-c", "import time; time.sleep(10)"], 
+        name="a task",
+        execution="async",
+        timeout=0.2,
+        session=session
+    )
+    start = time.time()
+    asyncio.run(_run_async(task))
+    assert time.time() - start < 5
+    assert "fail" == task.status
+
+@pytest.mark.parametrize("execution", ["main", "thread", "async"])
+def test_stream_output(tmpdir, session, execution):
+    with tmpdir.as_cwd() as old_dir:
+        task = CommandTask(
+            command=[sys.executable, "-c", "import sys\nfor i in range(100000): print(i)\nprint('error', file=sys.stderr)"],
+            name="a task",
+            execution=execution,
+            stream_output=True,
+            output_tail=20,
+            output_file="output.txt",
+            session=session
+        )
+        if execution == "async":
+            asyncio.run(_run_async(task))
+        else:
+            task()
+        wait_till_task_finish(task)
+
+        assert "success" == task.status
+        expected = "".join(f"{i}\n" for i in range(100000)).encode()
+        output = session.returns[task].replace(b"\r", b"")
+        assert output == expected[-len(output):]
+        assert 10 < len(output) <= 20
+        assert Path("output.txt").read_bytes().replace(b"\r", b"") == expected
+
+@pytest.mark.parametrize("execution", ["main", "async"])
+def test_stream_output_fail(session, execution):
+    task = CommandTask(
+        command=[sys.executable, "-c", "import sys\nprint('x' * 1000, file=sys.stderr)\nprint('oops', file=sys.stderr)\nsys.exit(1)"],
+        name="a task",
+        execution=execution,
+        stream_output=True,
+        output_tail=10,
+        session=session
+    )
+    if execution == "async":
+        asyncio.run(_run_async(task))
+    else:
+        task()
+    assert "fail" == task.status
+
+@pytest.mark.parametrize("execution", ["main", "async"])
+def test_stream_output_timeout(session, execution):
+    task = CommandTask(
+        command=[sys.executable, "-c", "import time; time.sleep(10)"],
+        name="a task",
+        execution=execution,
+        stream_output=True,
+        timeout=0.2,
+        session=session
+    )
+    start = time.time()
+    if execution == "async":
+        asyncio.run(_run_async(task))
+    else:
+        task()
+    assert time.time() - start < 5
+    assert "fail" == task.status
@@ -1,10 +1,15 @@
 
 from pathlib import Path
+import gc
 import types
+from unittest import mock
+import weakref
 
 import pytest
 
+from rocketry.args import Session, Task
 from rocketry.tasks import FuncTask
+from rocketry.tasks.func import _signature_args
 from rocketry.conditions import AlwaysFalse, AlwaysTrue, DependSuccess
 from rocketry.parse.utils import ParserError
 
@@ -252,4 +257,42 @@ def test_existing_rename(session):
     assert task2.name == 'a task - 1'
 
     assert session['a task'] is task1
-    assert session['a task - 1'] is task2
\ No newline at end of file
+    assert session['a task - 1'] is task2
+def test_signature_args(session):
+    def do_things(a, b=Task(), *, c=Session()):
+        ...
+
+    task = FuncTask(do_things, name="a task", session=session)
+    assert task.pos_args == ["a", "b"]
+    assert task.kw_args == ["a", "b", "c"]
+    params = task.get_task_params()
+    assert isinstance(params._params["b"], Task)
+    assert isinstance(params._params["c"], Session)
+    assert task.prefilter_params({"a": 1, "d": 2}) == {"a": 1}
+
+    # The signature is read only once per function
+    assert do_things in _signature_args
+    with mock.patch("inspect.signature", side_effect=AssertionError("signature read again")):
+        task.kw_args
+        task.pos_args
+
+def test_signature_args_released(session):
+    def do_things(a):
+        ...
+    task = FuncTask(do_things, name="a task", session=session)
+    assert task.kw_args == ["a"]
+    ref = weakref.ref(do_things)
+    session.remove_task(task)
+    del task, do_things
+    gc.collect()
+    # The cache does not keep the function alive
+    assert ref() is None
+
+def test_signature_args_unhashable(session):
+    class MyFunc:
+        __hash__ = None
+        def __call__(self, a, b=1):
+            ...
+
+    task = FuncTask(MyFunc(), name="a task", execution="main", session=session)
+    assert task.kw_args == ["a", "b"]
@@ -8,6 +8,7 @@ from redbird.logging import RepoHandler
 
 from rocketry import Session
 from rocketry.log.log_record import  MinimalRecord
+from rocketry.log.handlers import decode_record
 
 from rocketry.tasks import FuncTask
 
@@ -318,6 +319,8 @@ def test_process_no_double_logging(session):
         except Empty:
             break
         else:
+            # Records are passed as compact tuples
+            record = decode_record(record)
             records.append(record)
             # task.log_record(record)
             actual_actions.append(record.action)
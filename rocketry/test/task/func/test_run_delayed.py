@@ -264,4 +264,39 @@ def test_parametrization_kwargs(tmpdir, script_files, session):
         assert [
             {"task_name": "a task", "action": "run"},
             {"task_name": "a task", "action": "success"},
-        ] == records
\ No newline at end of file
+        ] == records
+@pytest.mark.parametrize("module_cache", [True, False])
+def test_module_cache(tmpdir, session, module_cache):
+    session.config.module_cache = module_cache
+    task_dir = tmpdir.mkdir("mytasks")
+    script = task_dir.join("myfile.py")
+    script.write(dedent("""
+    imports = []
+    def myfunc():
+        imports.append(None)
+        return len(imports)
+    """))
+
+    with tmpdir.as_cwd() as old_dir:
+
+        task = FuncTask(
+            func_name="myfunc",
+            path="mytasks/myfile.py", 
+            name="a task",
+            execution="main",
+            session=session
+        )
+        assert task.kw_args == []
+        task()
+        task()
+        # The module is reused if cached
+        assert session.returns[task] == (2 if module_cache else 1)
+        assert task.is_delayed()
+
+        # Changing the file reloads the module
+        script.write(dedent("""
+        def myfunc():
+            return "changed"
+        """))
+        task()
+        assert session.returns[task] == "changed"
@@ -43,6 +43,7 @@ def test_delete(session):
     assert session.tasks == {task}
     task.delete()
     assert session.tasks == set()
+    assert "mytest" not in session
 
 def test_set_invalid_status(session):
     task = DummyTask(name="mytest", session=session)
@@ -106,6 +107,7 @@ def test_json(session):
         "force_termination": false,
         "status": "success",
         "timeout": null,
+        "max_instances": 1,
         "parameters": {
             "arg_2": "Return('another')",
             "session": "session",
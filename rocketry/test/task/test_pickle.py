@@ -1,11 +1,15 @@
 
+import multiprocessing
 import pickle
+from pickle import PicklingError
 from inspect import isfunction
 from textwrap import dedent
 import os
 
 import pytest
 
+from rocketry.core import Parameters
+from rocketry.core.utils import ProcessPool
 from rocketry.tasks import FuncTask
 from rocketry.conditions import TaskFailed
 from rocketry.args import Arg
@@ -79,3 +83,50 @@ class TestFunc:
         pick_task = pickle_dump_read(task)
         
         assert pick_task.session is None
+
+def test_unpicklable_pool(session):
+    def func_nested():
+        pass
+    task = FuncTask(func_nested, execution="process", name="unpicklable", session=session)
+    pool = ProcessPool(1, log_queue=session.scheduler._log_queue)
+    pool.start()
+    session.scheduler._process_pool = pool
+    try:
+        with pytest.raises(PicklingError, match="Cannot pickle: {'func': "):
+            task._start_process(Parameters())
+    finally:
+        session.scheduler._process_pool = None
+        pool.close()
+
+    assert task.logger.filter_by(action="run").count() == 1
+    assert task.logger.filter_by(action="fail").count() == 1
+
+def test_unpicklable_spawn(session, monkeypatch):
+    def func_nested():
+        pass
+    task = FuncTask(func_nested, execution="process", name="unpicklable", session=session)
+    monkeypatch.setattr(multiprocessing, "Process", multiprocessing.get_context("spawn").Process)
+
+    with pytest.raises(PicklingError, match="Cannot pickle: {'func': "):
+        task._start_process(Parameters())
+
+    assert task.logger.filter_by(action="run").count() == 1
+    assert task.logger.filter_by(action="fail").count() == 1
+
+def test_start_error_not_pickling(session, monkeypatch):
+    error = OSError("Cannot start process")
+    class FailingProcess:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def start(self):
+            raise error
+
+    task = FuncTask(func_on_main_level, execution="process", name="picklable", session=session)
+    monkeypatch.setattr(multiprocessing, "Process", FailingProcess)
+
+    with pytest.raises(OSError) as exc_info:
+        task._start_process(Parameters())
+    # Raised as is
+    assert exc_info.value is error
+    assert task.logger.filter_by(action="fail").count() == 0